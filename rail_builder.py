@@ -0,0 +1,2190 @@
+# Rail Placer Builder
+# The path tracing and block placing half of the "Place Rails" plug-in (rail_placer_working_v1dot3_with_choices.py)
+#
+# Amulet Map Editor and API Code from the Amulet Team
+# All other code (c) 2024 Black Forest Creations
+# Blame:  @lNQUlSlTlON
+
+"""
+Everything the Rail Placer does to a world, without the wx user interface.
+
+The "Place Rails" panel inherits from RailBuilder and only adds the dropdowns,
+so the same pipeline can be run from "rail_placer_cli.py" on a saved world
+without Amulet's editor running.
+
+Like "rail_pipeline.py", this file needs to be in the same folder as the rail
+placer script.  It has no "export" entry, so Amulet will not list it as an
+operation.
+"""
+
+
+import os
+import sys
+import logging
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from typing import TYPE_CHECKING
+from amulet.api.selection import SelectionGroup
+from amulet.api.data_types import Dimension
+from amulet.api.block import Block
+from amulet_nbt import StringTag, IntTag, ByteTag
+# Amulet Construction OpenSource
+from construction import ConstructionReader
+# Rail Placer helpers (same folder as this script)
+from rail_pipeline import (
+    BALLAST_FIELDS, CORE_GROUND_FIELDS, GROUND_FIELDS, MARKER_FIELDS, PATH_FIELDS, USE_CASE_NAMES, USE_CASES,
+    CORNER_STEPS, PROGRESS_WINDOW, STRAIGHT_STEPS, EditPlan, EditRecorder, PathGraph, PathTable, PillarTemplate, RouteCache, SpanAnalysis, WriteBuffer,
+    APPLY_LABEL, changed_window, checkpoint_path, discard_checkpoint, known_depths, load_checkpoint, load_template, phase_progress, probe_column_depths,
+    TRACE, logger, renumber_iterations, roadbase_blocks, run_to_completion, scan_markers, selection_mask, snbt_block, solid_ground_records, splice_rows, windows,
+)
+
+
+try:
+    from amulet_map_editor.programs.edit.api.operations.errors import OperationError
+except ImportError:
+    # Running without the editor (rail_placer_cli.py, rail_placer_benchmark.py)
+    class OperationError(Exception):
+        """Raised when a run cannot go ahead; the editor shows these to the user."""
+
+
+if TYPE_CHECKING:
+    from amulet.api.level import BaseLevel
+
+
+# The choices offered by the panel's dropdowns (and the command line runner)
+CRIBBING_CHOICES = ["Dark Oak", "Smooth Stone", "Deepslate Tile", "Iron Block"]
+UNDERPINNING_CHOICES = ["Dark Oak", "Smooth Stone", "Deepslate Tile", "Iron Block"]
+POWER_CHOICES = ["Powered", "Unpowered"]
+PILLAR_CHOICES = ["3x3 Dark Oak", "3x5 Blackstone", "3x3 Smooth Stone"]
+
+
+def default_construction_dir():
+    """The folder Amulet loads the stock operation plug-ins (and their construction files) from."""
+    return os.path.join(os.getcwd(), "amulet_map_editor", "programs", "edit", "plugins", "operations", "stock_plugins", "operations")
+
+
+def default_checkpoint_dir():
+    """The folder long runs save their checkpoints in, so a crashed or cancelled build can carry on."""
+    return os.path.join(os.path.expanduser("~"), ".rail_placer", "checkpoints")
+
+
+def default_route_cache_dir():
+    """The folder incremental rebuilds keep the last plan of each world in."""
+    return os.path.join(os.path.expanduser("~"), ".rail_placer", "routes")
+
+
+def default_workers():
+    """
+    How many processes plan separate routes at once.
+
+    Inside a frozen (installed) build of Amulet a new process would start
+    another copy of the editor, so routes are planned one after another there.
+    """
+    if getattr(sys, "frozen", False):
+        return 1
+    return os.cpu_count() or 1
+
+
+def plan_route(coords, use_cases, power_choice, platform, version_number, dimension, ordered=False):
+    """
+    Plan the track (roadbase, rails and ballast) of one route without a world.
+
+    Runs in a worker process.  "ordered" routes are followed in "coords" order
+    (see PathGraph.stretches).  Returns the recorded edits (see
+    EditRecorder.edits) and the values RailBuilder.plan_track returns.
+    """
+    graph = PathGraph.from_voxels(((x, y, z, use_case) for (x, y, z), use_case in zip(coords, use_cases)), ordered)
+    recorder = EditRecorder(platform, version_number)
+    start = graph.coords[0]
+    coordinates = [{'x': start[0], 'y': start[1], 'z': start[2], 'value': 1, 'use_case': graph.use_cases[0]}]
+    second_block_coordinates = graph.unvisited_neighbours(start, {start})
+    track = run_to_completion(RailBuilder().plan_track(power_choice, coordinates, second_block_coordinates, recorder, dimension, PathTable(PATH_FIELDS), 0, [], 0, graph))
+    return recorder.edits(), track
+
+
+def plan_routes(jobs, workers):
+    """
+    Run plan_route for each job (a tuple of its arguments) and yield the plans in job order.
+
+    With more than one worker the jobs are shared out over a process pool.  If
+    the pool cannot be started, or breaks, the rest are planned in this process.
+    """
+    done = 0
+    if workers > 1 and len(jobs) > 1:
+        pool = None
+        try:
+            pool = ProcessPoolExecutor(max_workers=min(workers, len(jobs)))
+            for plan in pool.map(plan_route, *zip(*jobs)):
+                done += 1
+                yield plan
+        except (BrokenProcessPool, OSError) as e:
+            logger.warning('Route planning pool failed, planning the remaining routes here: %s', e)
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+    for job in jobs[done:]:
+        yield plan_route(*job)
+
+
+class RailBuilder:
+
+    def build_railroad(self, world: "BaseLevel", dimension: Dimension, selection_group: SelectionGroup, cribbing_choice, minus1_choice, power_choice, pillar_choice, construction_dir=None, workers=None, checkpoint_dir=None, cache_dir=None):
+        """
+        Trace the wool path in the selection and build the railroad along it.
+
+        This is a generator that yields (progress, message) pairs, which is the
+        form Amulet's operation runner expects.  Anything else driving it only
+        has to exhaust it.  A selection that starts several separate routes
+        builds them all, planning their track in up to "workers" processes.
+
+        With a "checkpoint_dir" the run is planned first (see plan_railroad), so
+        nothing is written until every phase is done and a cancelled or crashed
+        run picks up where it stopped.  The checkpoint is removed once applied.
+        Without one the route is written a window at a time as it is worked
+        out, and a cancelled run leaves the windows written so far in the
+        world (the panel always passes a checkpoint_dir).  Either way the
+        route's path, ballast and ground tables are kept whole until its
+        supports are placed; only the staged writes are windowed.
+
+        With a "cache_dir" the run is an incremental rebuild (see rebuild_railroad).
+        """
+        if cache_dir is not None:
+            yield from self.rebuild_railroad(world, dimension, selection_group, cribbing_choice, minus1_choice, power_choice, pillar_choice, construction_dir, workers, checkpoint_dir, cache_dir)
+            return
+        if checkpoint_dir is not None:
+            plan = yield from self.plan_railroad(world, dimension, selection_group, cribbing_choice, minus1_choice, power_choice, pillar_choice, construction_dir, workers, checkpoint_dir)
+            yield from self.apply_plan(plan, world)
+            discard_checkpoint(plan)
+            return
+        placed_blocks = PathTable(PATH_FIELDS)  # array backed, but rows read and append like dicts
+        placed_block_iter = 0
+        placed_rails = []
+        placed_rails_iter = 0
+        support_locations = []
+        placed_support_blocks = []
+        placed_support_block_iter = 0
+
+        coordinates, placed_blocks, placed_block_iter = self.read_selection(world, dimension, selection_group, placed_blocks, placed_block_iter)
+        if not coordinates:
+            raise OperationError("No Pink, Orange or Purple Wool found in the selection.")
+    ## Read each wool route once and build the path graphs that the tracing loop walks
+        graphs = PathGraph.components(world, dimension, (((int(coord['x']), int(coord['y']), int(coord['z'])), coord['use_case']) for coord in coordinates))
+        if len(graphs) > 1:
+            logger.info('Separate routes found in the selection: %d', len(graphs))
+            yield from self.build_routes(cribbing_choice, minus1_choice, power_choice, pillar_choice, graphs, world, dimension, construction_dir, workers)
+            return
+        graph = graphs[0]
+        start = graph.coords[0]
+        second_block_coordinates = graph.unvisited_neighbours(start, {start})
+        # print('Origin Selection Coordinates:', coordinates)
+        # print('Second Block Coordinates:', second_block_coordinates)
+        # print('Current Path Calculation Iteration:', placed_block_iter)
+
+        yield from self.loop_operation(cribbing_choice, minus1_choice, power_choice, pillar_choice, coordinates, second_block_coordinates, world, dimension, placed_blocks, placed_block_iter, placed_rails, placed_rails_iter, placed_support_blocks, placed_support_block_iter, support_locations, graph, construction_dir)
+
+
+    def build_routes(self, cribbing_choice, minus1_choice, power_choice, pillar_choice, graphs, world, dimension, construction_dir=None, workers=None):
+    ## Every route's track is planned on its own (in parallel when there are workers to spare), then all of the
+    ## track is written in one pass, in route order, before any route probes the ground for its supports.
+        platform, version_number = world.level_wrapper.platform, world.level_wrapper.version
+        if workers is None:
+            workers = default_workers()
+        jobs = [(graph.coords, graph.use_cases, power_choice, platform, version_number, dimension, graph.ordered) for graph in graphs]
+        plans = []
+        yield phase_progress('trace', 0, len(jobs))
+        for plan in plan_routes(jobs, workers):
+            plans.append(plan)
+            yield phase_progress('trace', len(plans), len(jobs))
+
+        buffer = WriteBuffer(world)
+        for route, ((coords, block_index, blockstates), track) in enumerate(plans, 1):
+            blocks = [snbt_block(blockstate) for blockstate in blockstates]
+            buffer.set_version_blocks(coords, dimension, (platform, version_number), blocks, block_index)
+            buffer.flush()
+            yield phase_progress('rails', route, len(plans))
+
+        for route, (edits, track) in enumerate(plans, 1):
+            coordinates, placed_blocks, placed_block_iter, placed_rails, placed_rails_iter, placed_ballast_inner, placed_ballast_outer = track
+            for progress, message in self.build_supports(cribbing_choice, minus1_choice, pillar_choice, coordinates, world, buffer, dimension, placed_blocks, placed_block_iter, placed_rails, placed_rails_iter, placed_ballast_inner, placed_ballast_outer, [], 0, [], construction_dir):
+                yield progress, f"Route {route}/{len(plans)}: {message}"
+
+###
+### Planning mode runs the same stages, but records the edits into an EditPlan instead of writing them.
+### Nothing in the world changes until the plan is applied, and plan_supports can be run again on its own
+### with other cribbing, underpinning or pillar choices, reusing the traced track.
+###
+
+    def plan_railroad(self, world: "BaseLevel", dimension: Dimension, selection_group: SelectionGroup, cribbing_choice, minus1_choice, power_choice, pillar_choice, construction_dir=None, workers=None, checkpoint_dir=None):
+        """
+        Work out every edit build_railroad would make.  A generator like build_railroad that returns an EditPlan.
+
+        With a "checkpoint_dir" the plan is saved there after the track and after each route's supports, and a
+        run of the same build (same world, selection, markers and rails) carries on from the last save.
+        """
+        platform, version_number = world.level_wrapper.platform, world.level_wrapper.version
+        plan = EditPlan(platform, version_number, dimension, {'power': power_choice})
+        coordinates, placed_blocks, placed_block_iter = self.get_coordinates_bulk(world, dimension, selection_group, PathTable(PATH_FIELDS), 0, plan.stages['markers'])
+        if not coordinates:
+            raise OperationError("No Pink, Orange or Purple Wool found in the selection.")
+        if checkpoint_dir is not None:
+            markers = [[int(coord['x']), int(coord['y']), int(coord['z']), str(coord['use_case'])] for coord in coordinates]
+            checkpoint = checkpoint_path(checkpoint_dir, world, dimension, selection_group, markers, {'power': power_choice})
+            saved = load_checkpoint(checkpoint)
+            if saved is not None and 'track' in saved.completed:
+                logger.info('Resuming from checkpoint: %s', checkpoint)
+                plan = saved
+            plan.checkpoint = checkpoint
+        if 'track' not in plan.completed:
+            yield from self.plan_routes_track(plan, world, coordinates, power_choice, workers)
+        yield from self.plan_supports(plan, world, cribbing_choice, minus1_choice, pillar_choice, construction_dir)
+        return plan
+
+    def plan_routes_track(self, plan, world: "BaseLevel", coordinates, power_choice, workers=None):
+        """Split the scanned markers into routes and plan each route's track.  A generator."""
+        graphs = PathGraph.components(world, plan.dimension, (((int(coord['x']), int(coord['y']), int(coord['z'])), coord['use_case']) for coord in coordinates))
+        yield from self.plan_graphs_track(plan, graphs, power_choice, workers)
+
+    def plan_graphs_track(self, plan, graphs, power_choice, workers=None):
+        """Plan the track of each route graph, in up to "workers" processes.  A generator."""
+        platform, version_number, dimension = plan.platform, plan.version, plan.dimension
+        if workers is None:
+            workers = default_workers()
+        jobs = [(graph.coords, graph.use_cases, power_choice, platform, version_number, dimension, graph.ordered) for graph in graphs]
+        yield phase_progress('trace', 0, len(jobs))
+        for graph, (edits, track) in zip(graphs, plan_routes(jobs, workers)):
+            coordinates, placed_blocks, placed_block_iter, placed_rails, placed_rails_iter, placed_ballast_inner, placed_ballast_outer = track
+            plan.stages['track'].extend(*edits)
+            plan.routes.append({'markers': graph.marker_table(), 'path': placed_blocks, 'ballast_inner': placed_ballast_inner, 'ballast_outer': placed_ballast_outer})
+            yield phase_progress('trace', len(plan.routes), len(jobs))
+        plan.completed.append('track')
+        if plan.checkpoint is not None:
+            plan.save(plan.checkpoint)
+
+###
+### A precomputed path (a spline, or a survey export) can stand in for the wool.  Its voxels go straight into the
+### trace in the order they were given, so nothing is scanned or marked in the world and routes too long to mark by
+### hand can be built.
+###
+
+    def plan_from_path(self, world: "BaseLevel", dimension: Dimension, path, cribbing_choice, minus1_choice, power_choice, pillar_choice, construction_dir=None, workers=None):
+        """
+        Work out every edit of a railroad along "path", a list of (coord, use case) entries in path order (see
+        load_path_file).  Each stretch of it is traced in that order (see PathGraph.stretches).  A generator like
+        plan_railroad that returns an EditPlan.
+        """
+        if not path:
+            raise OperationError("The path is empty.")
+        platform, version_number = world.level_wrapper.platform, world.level_wrapper.version
+        plan = EditPlan(platform, version_number, dimension, {'power': power_choice})
+    ## The path voxels get the cobblestone the wool would have been turned into (the trace builds on from the start block)
+        plan.stages['markers'].set_version_blocks(np.array([coord for coord, _ in path], dtype=np.int64), dimension, (platform, version_number), [Block('minecraft', 'cobblestone')], np.zeros(len(path), dtype=np.int64))
+        graphs = PathGraph.stretches(path)
+        if len(graphs) > 1:
+            logger.info('Separate routes found in the path: %d', len(graphs))
+        yield from self.plan_graphs_track(plan, graphs, power_choice, workers)
+        yield from self.plan_supports(plan, world, cribbing_choice, minus1_choice, pillar_choice, construction_dir)
+        return plan
+
+    def build_from_path(self, world: "BaseLevel", dimension: Dimension, path, cribbing_choice, minus1_choice, power_choice, pillar_choice, construction_dir=None, workers=None):
+        """Build the railroad along a precomputed path (see plan_from_path).  A generator like build_railroad."""
+        plan = yield from self.plan_from_path(world, dimension, path, cribbing_choice, minus1_choice, power_choice, pillar_choice, construction_dir, workers)
+        yield from self.apply_plan(plan, world)
+
+    def plan_supports(self, plan, world: "BaseLevel", cribbing_choice, minus1_choice, pillar_choice, construction_dir=None):
+        """
+        Plan the ground probe, supports and pillars of a plan whose track is planned.  A generator that returns the plan.
+
+        Routes that already have supports planned with these same choices (in a checkpoint) are skipped.
+        """
+        options = {'cribbing': cribbing_choice, 'underpinning': minus1_choice, 'pillar': pillar_choice}
+        if any(plan.options.get(name) != value for name, value in options.items()):
+            plan.reset_supports()
+            plan.options.update(options)
+        recorder = plan.stages['supports']
+        for route_number, route in enumerate(plan.routes, 1):
+            if 'ground_core' in route:
+                continue
+            yield phase_progress('ground', route_number - 1, len(plan.routes))
+        ## Earlier routes' supports are in the overlay too, just as they would be in the world by now on a direct run
+            overlay = plan.overlay(world)
+            placed_block_x_z_inner, placed_block_x_z_core, placed_block_x_z_outer = self.find_solid_ground(None, world, plan.dimension, route['path'], len(route['path']), None, None, route['ballast_inner'], route['ballast_outer'], overlay)
+            span_stats = []
+            support_locations = self.place_supports(cribbing_choice, minus1_choice, None, recorder, plan.dimension, route['path'], len(route['path']), None, None, route['ballast_inner'], route['ballast_outer'], placed_block_x_z_inner, placed_block_x_z_core, placed_block_x_z_outer, [], span_stats)
+            for progress, message in self.place_pillars(pillar_choice, support_locations, recorder, plan.dimension, [], 0, construction_dir):
+                yield progress, f"Route {route_number}/{len(plan.routes)}: {message}"
+        ## The ground tables only go on the route once its supports are recorded, so a checkpoint never holds half a route
+            route.update({'ground_inner': placed_block_x_z_inner, 'ground_core': placed_block_x_z_core, 'ground_outer': placed_block_x_z_outer})
+            plan.support_locations.extend(support_locations)
+            for stats in span_stats:
+                plan.add_span_stats(stats)
+            if plan.checkpoint is not None:
+                plan.save(plan.checkpoint)
+        if 'supports' not in plan.completed:
+            plan.completed.append('supports')
+            if plan.checkpoint is not None:
+                plan.save(plan.checkpoint)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(plan.summary())
+        return plan
+
+###
+### Incremental rebuilds keep the plan of the last run on each world in a RouteCache.  A rerun traces every route
+### again, and only the stretch whose path changed (plus a margin) gets new track, a new ground probe and new supports.
+###
+
+    def rebuild_railroad(self, world: "BaseLevel", dimension: Dimension, selection_group: SelectionGroup, cribbing_choice, minus1_choice, power_choice, pillar_choice, construction_dir=None, workers=None, checkpoint_dir=None, cache_dir=None):
+        """
+        Build the railroad, rewriting only what changed since the last run on this world.  A generator like build_railroad.
+
+        The wool of a route that was built before is cobblestone by now, so the route is found again from its cached
+        markers, and the wool in the selection is added to them.  Each cached route is first checked against the world
+        (see RouteCache.changed_rows).  In the selection, a marker whose roadbase or rail is no longer as it was built
+        has been taken away or redrawn, so to move a stretch, break its roadbase, lay the new wool and select both.
+        Whatever else the replaced stretch built, and the new plan does not build again, is cleared to air.  A change
+        outside the selection (an undo, for instance) means the cache no longer describes the world; then, as without a
+        cache for the world or with other choices than the cached run, everything in the selection is built (see
+        plan_railroad) and cached.
+        """
+        cache = RouteCache(cache_dir if cache_dir is not None else default_route_cache_dir())
+        previous = cache.load(world, dimension)
+        options = {'power': power_choice, 'cribbing': cribbing_choice, 'underpinning': minus1_choice, 'pillar': pillar_choice}
+        if previous is not None and any(previous.options.get(name) != value for name, value in options.items()):
+            previous = None
+        if previous is not None and not all('markers' in route and 'built' in route for route in previous.routes):
+            logger.warning('The route cache predates build checks, building the selection again')
+            previous = None
+        removed = set()
+        if previous is not None:
+            for route_number, route in enumerate(previous.routes, 1):
+                path = np.stack([route['path'].column(name) for name in ('x', 'y', 'z')], axis=1).reshape(-1, 3)
+                changed = RouteCache.changed_rows(world, dimension, route)
+                selected = selection_mask(selection_group, path)
+                if (changed & ~selected).any():
+                    logger.warning('Cached route %d no longer matches the world at %s, building the selection again', route_number, tuple(path[int(np.argmax(changed & ~selected))].tolist()))
+                    previous = None
+                    break
+                removed.update(map(tuple, path[changed].tolist()))
+        if previous is None:
+            plan = yield from self.plan_railroad(world, dimension, selection_group, cribbing_choice, minus1_choice, power_choice, pillar_choice, construction_dir, workers, checkpoint_dir)
+            yield from self.apply_plan(plan, world)
+            discard_checkpoint(plan)
+            cache.store(world, plan)
+            return
+
+        platform, version_number = world.level_wrapper.platform, world.level_wrapper.version
+        plan = EditPlan(platform, version_number, dimension, options)
+        coordinates, _, _ = self.get_coordinates_bulk(world, dimension, selection_group, PathTable(PATH_FIELDS), 0, plan.stages['markers'])
+    ## The cached markers that are still built, and the wool in the selection
+        markers = PathTable.concat(MARKER_FIELDS, [route['markers'] for route in previous.routes])
+        voxels = {}
+        for coord, code in zip(zip(*(markers.column(name).tolist() for name in ('x', 'y', 'z'))), markers.column('use_case').tolist()):
+            if coord not in removed:
+                voxels[coord] = USE_CASES.decode(code)
+        for coord in coordinates:
+            voxels[(int(coord['x']), int(coord['y']), int(coord['z']))] = coord['use_case']
+        if not voxels:
+            raise OperationError("No Pink, Orange or Purple Wool found in the selection.")
+    ## A route keeps its cached start, so its path (and its counts) trace the same as before up to the change
+        cached_by_start = {}
+        for route in previous.routes:
+            start = tuple(int(route['markers'].column(name)[0]) for name in ('x', 'y', 'z'))
+            cached_by_start[start] = route
+        graphs = PathGraph.components_from_voxels(voxels, cached_by_start)
+        replaced = []
+        for route_number, graph in enumerate(graphs, 1):
+            for progress, message in self.replan_route(plan, world, graph, cached_by_start.pop(graph.coords[0], None), power_choice, cribbing_choice, minus1_choice, pillar_choice, construction_dir, replaced, removed):
+                yield progress, f"Route {route_number}/{len(graphs)}: {message}"
+    ## A cached route that no longer starts a route was redrawn from its start, or taken away altogether
+        for route in cached_by_start.values():
+            replaced.append(self.route_blocks(plan, route, power_choice, cribbing_choice, minus1_choice, pillar_choice, 0, len(route['path']), construction_dir))
+        self.clear_replaced(plan, replaced)
+        plan.completed = ['track', 'supports']
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(plan.summary())
+        yield from self.apply_plan(plan, world)
+        cache.store(world, plan)
+
+    def replan_route(self, plan, world: "BaseLevel", graph, cached, power_choice, cribbing_choice, minus1_choice, pillar_choice, construction_dir=None, replaced=None, removed=frozenset()):
+        """
+        Trace one route again and plan the stretch that differs from its "cached" route tables (None for a new route),
+        along with any path block on one of the "removed" coordinates (taken away from the world since it was built).
+        A generator.  The route, spliced together from the cached and the new rows, is added to the plan, and the
+        blocks the cached stretch it replaces had built (see route_blocks) are appended to the "replaced" list.
+        """
+        dimension = plan.dimension
+        trace = EditRecorder(plan.platform, plan.version)
+        start = graph.coords[0]
+        coordinates = [{'x': start[0], 'y': start[1], 'z': start[2], 'value': 1, 'use_case': graph.use_cases[0]}]
+        second_block_coordinates = graph.unvisited_neighbours(start, {start})
+        coordinates, placed_blocks, placed_block_iter = yield from self.trace_track(coordinates, second_block_coordinates, trace, dimension, PathTable(PATH_FIELDS), 0, graph)
+        if cached is None:
+            cached = {'path': PathTable(PATH_FIELDS), 'ballast_inner': PathTable(BALLAST_FIELDS), 'ballast_outer': PathTable(BALLAST_FIELDS), 'ground_inner': PathTable(GROUND_FIELDS), 'ground_core': PathTable(CORE_GROUND_FIELDS), 'ground_outer': PathTable(GROUND_FIELDS)}
+        route = {'markers': graph.marker_table(), 'path': placed_blocks}
+        plan.routes.append(route)
+        stale = [row for row, coord in enumerate(zip(*(placed_blocks.column(name).tolist() for name in ('x', 'y', 'z')))) if coord in removed]
+        window = changed_window(cached['path'], placed_blocks, stale=stale)
+        if window is None:
+            route.update({name: cached[name] for name in ('ballast_inner', 'ballast_outer', 'ground_inner', 'ground_core', 'ground_outer')})
+            return
+        first, old_last, new_last = window
+        logger.info('Rebuilding path blocks %d to %d of %d', first, new_last - 1, len(placed_blocks))
+        if replaced is not None:
+            replaced.append(self.route_blocks(plan, cached, power_choice, cribbing_choice, minus1_choice, pillar_choice, first, old_last, construction_dir))
+
+    ## The roadbase the trace laid along the window (and the start rail above a corner), and new rails and ballast
+        path = np.stack([placed_blocks.column(name) for name in ('x', 'y', 'z')], axis=1)[first:new_last].astype(np.int64)
+        relaid = set(map(tuple, path.tolist())) | set(map(tuple, (path + (0, 1, 0)).tolist()))
+        coords, block_index, blockstates = trace.edits()
+        keep = np.fromiter((coord in relaid for coord in map(tuple, coords.tolist())), dtype=bool, count=len(coords))
+        plan.stages['track'].extend(coords[keep], block_index[keep], blockstates)
+        _, _, window_inner, window_outer = yield from self.lay_track(power_choice, coordinates, plan.stages['track'], dimension, placed_blocks, placed_block_iter, [], 0, first, new_last)
+        route['ballast_inner'] = splice_rows(cached['ballast_inner'], window_inner, first, old_last, new_last)
+        route['ballast_outer'] = splice_rows(cached['ballast_outer'], window_outer, first, old_last, new_last)
+
+    ## Only columns the cached run never probed are probed now, over the track planned so far
+        yield phase_progress('ground')
+        old_core = np.arange(len(cached['path']))
+        old_core = (old_core >= first) & (old_core < old_last)
+        old_inner = (cached['ballast_inner'].column('count') >= first) & (cached['ballast_inner'].column('count') < old_last)
+        old_outer = (cached['ballast_outer'].column('count') >= first) & (cached['ballast_outer'].column('count') < old_last)
+        window_core = placed_blocks.take(slice(first, new_last))
+        known = [
+            known_depths(window_inner, cached['ballast_inner'].take(old_inner), cached['ground_inner'].take(old_inner)),
+            known_depths(window_core, cached['path'].take(old_core), cached['ground_core'].take(old_core)),
+            known_depths(window_outer, cached['ballast_outer'].take(old_outer), cached['ground_outer'].take(old_outer)),
+        ]
+        ground_inner, ground_core, ground_outer = self.find_solid_ground(None, world, dimension, window_core, len(window_core), None, None, window_inner, window_outer, plan.overlay(world), known)
+        route['ground_inner'] = splice_rows(cached['ground_inner'], ground_inner, first, old_last, new_last)
+        route['ground_outer'] = splice_rows(cached['ground_outer'], ground_outer, first, old_last, new_last)
+        route['ground_core'] = PathTable.concat(CORE_GROUND_FIELDS, (cached['ground_core'].take(slice(0, first)), ground_core, cached['ground_core'].take(slice(old_last, None))))
+        route['ground_core'].column('count')[:] = placed_blocks.column('count')
+        for table_name in ('ground_inner', 'ground_core', 'ground_outer'):
+            renumber_iterations(route[table_name])
+
+    ## Supports for every span the window touches.  Core rows count in path counts and ballast rows in path
+    ## indices, which only ever fall behind the indices, so the window of counts covers both.
+        yield phase_progress('supports')
+        path_counts = placed_blocks.column('count')
+        counts = (min(first, int(path_counts[first])), max(new_last, int(path_counts[new_last - 1]) + 1))
+        span_stats = []
+        support_locations = self.place_supports(cribbing_choice, minus1_choice, None, plan.stages['supports'], dimension, placed_blocks, len(placed_blocks), None, None, route['ballast_inner'], route['ballast_outer'], route['ground_inner'], route['ground_core'], route['ground_outer'], [], span_stats, counts)
+        yield from self.place_pillars(pillar_choice, support_locations, plan.stages['supports'], dimension, [], 0, construction_dir)
+        plan.support_locations.extend(support_locations)
+        for stats in span_stats:
+            plan.add_span_stats(stats)
+
+    def route_blocks(self, plan, route, power_choice, cribbing_choice, minus1_choice, pillar_choice, first, last, construction_dir=None):
+        """
+        The (N, 3) coordinates of every block path rows first..last - 1 of a cached route built: the roadbase, the
+        rails and ballast, and the supports of the spans they touch.  They are planned again from the cached tables
+        into a scratch recorder, which needs no world.
+        """
+        if last <= first:
+            return np.zeros((0, 3), dtype=np.int64)
+        dimension = plan.dimension
+        scratch = EditRecorder(plan.platform, plan.version)
+        path = route['path']
+        run_to_completion(self.lay_track(power_choice, None, scratch, dimension, path, len(path), [], 0, first, last))
+        path_counts = path.column('count')
+        counts = (min(first, int(path_counts[first])), max(last, int(path_counts[last - 1]) + 1))
+        support_locations = self.place_supports(cribbing_choice, minus1_choice, None, scratch, dimension, path, len(path), None, None, route['ballast_inner'], route['ballast_outer'], route['ground_inner'], route['ground_core'], route['ground_outer'], [], None, counts)
+        run_to_completion(self.place_pillars(pillar_choice, support_locations, scratch, dimension, [], 0, construction_dir))
+        roadbase = np.stack([path.column(name) for name in ('x', 'y', 'z')], axis=1)[first:last].astype(np.int64)
+        return np.concatenate((roadbase, scratch.edits()[0].astype(np.int64).reshape(-1, 3)))
+
+    @staticmethod
+    def clear_replaced(plan, replaced):
+        """
+        Plan air over the "replaced" blocks (arrays from route_blocks) that the plan does not set again and that no
+        route of the plan stands on: its roadbase, the rails above it and its ballast.
+        """
+        if not replaced:
+            return
+        keep = [plan.edits()[0].astype(np.int64).reshape(-1, 3)]
+        for route in plan.routes:
+            path = np.stack([route['path'].column(name) for name in ('x', 'y', 'z')], axis=1).astype(np.int64).reshape(-1, 3)
+            keep.extend((path, path + (0, 1, 0)))
+            for table_name in ('ballast_inner', 'ballast_outer'):
+                keep.append(np.stack([route[table_name].column(name) for name in ('x', 'y', 'z')], axis=1).astype(np.int64).reshape(-1, 3))
+        kept = set(map(tuple, np.concatenate(keep).tolist()))
+        cleared = np.array(sorted(set(map(tuple, np.concatenate(replaced).tolist())) - kept), dtype=np.int64).reshape(-1, 3)
+        if len(cleared):
+            logger.info('Clearing %d blocks of replaced track', len(cleared))
+            plan.stages['track'].set_version_blocks(cleared, plan.dimension, (plan.platform, plan.version), [Block('minecraft', 'air')], np.zeros(len(cleared), dtype=np.int64))
+
+    @staticmethod
+    def apply_plan(plan, world: "BaseLevel"):
+        """Write a planned run to the world in one bulk commit.  A generator like build_railroad."""
+        yield 0.0, f"{APPLY_LABEL} ({len(plan)})"
+        plan.apply(world)
+
+    def loop_operation(self, cribbing_choice, minus1_choice, power_choice, pillar_choice, coordinates, second_block_coordinates, world, dimension, placed_blocks, placed_block_iter, placed_rails, placed_rails_iter, placed_support_blocks, placed_support_block_iter, support_locations, graph, construction_dir=None):
+    ## Every block the placer sets is staged here and written out a chunk at a time
+        buffer = WriteBuffer(world)
+        coordinates, placed_blocks, placed_block_iter, placed_rails, placed_rails_iter, placed_ballast_inner, placed_ballast_outer = yield from self.plan_track(power_choice, coordinates, second_block_coordinates, buffer, dimension, placed_blocks, placed_block_iter, placed_rails, placed_rails_iter, graph)
+        yield from self.build_supports(cribbing_choice, minus1_choice, pillar_choice, coordinates, world, buffer, dimension, placed_blocks, placed_block_iter, placed_rails, placed_rails_iter, placed_ballast_inner, placed_ballast_outer, placed_support_blocks, placed_support_block_iter, support_locations, construction_dir)
+
+###
+### The track (roadbase, rails and ballast) only ever writes blocks, so "buffer" can be a WriteBuffer or an EditRecorder.
+### plan_track returns everything build_supports needs once the track is in the world.  It is trace_track (the roadbase,
+### which works out the path) followed by lay_track (rails and ballast along the path), which can also lay just a stretch.
+###
+
+    def plan_track(self, power_choice, coordinates, second_block_coordinates, buffer, dimension, placed_blocks, placed_block_iter, placed_rails, placed_rails_iter, graph):
+        coordinates, placed_blocks, placed_block_iter = yield from self.trace_track(coordinates, second_block_coordinates, buffer, dimension, placed_blocks, placed_block_iter, graph)
+        placed_rails, placed_rails_iter, placed_ballast_inner, placed_ballast_outer = yield from self.lay_track(power_choice, coordinates, buffer, dimension, placed_blocks, placed_block_iter, placed_rails, placed_rails_iter)
+        return coordinates, placed_blocks, placed_block_iter, placed_rails, placed_rails_iter, placed_ballast_inner, placed_ballast_outer
+
+    def trace_track(self, coordinates, second_block_coordinates, buffer, dimension, placed_blocks, placed_block_iter, graph):
+        continue_operation = True
+        recursive = False
+    ## The path graph already knows every wool block on the route, so "visited" replaces the scans over placed_blocks
+        visited = {(int(coordinates[0]['x']), int(coordinates[0]['y']), int(coordinates[0]['z']))}
+        visited.update((block['x'], block['y'], block['z']) for block in placed_blocks)
+    ## The stages are generators: each yield updates Amulet's progress dialog, and a cancel stops the run there.
+    ## The buffer is flushed before every yield, so the staged writes never outgrow a window.  A cancel keeps what was written.
+        route_length = len(graph)
+        reported = len(placed_blocks)
+        yield phase_progress('trace', reported, route_length)
+        while continue_operation:
+            block_differential = self.rail_direction(coordinates, second_block_coordinates, buffer, dimension)
+            # print('Second block coords before set roadbase', second_block_coordinates)
+            placed_before = len(placed_blocks)
+            back_to_back, continue_coordinates, recursive, placed_blocks, placed_block_iter = self.set_roadbase(coordinates, second_block_coordinates, block_differential, recursive, buffer, dimension, placed_blocks, placed_block_iter)
+            visited.update((block['x'], block['y'], block['z']) for block in placed_blocks[placed_before:])
+            if len(placed_blocks) - reported >= PROGRESS_WINDOW:
+                reported = len(placed_blocks)
+                buffer.flush()
+                yield phase_progress('trace', reported, route_length)
+
+            # print('Current Path Calculation Iteration:', placed_block_iter)
+            # print('set_roadbase marked recursive as:', recursive, ' for the this iteration')
+
+            # print('Back-to-Back Diagonal Block:', back_to_back)
+
+        ## The back_to_back dict is empty if the path is N-S or E-W, and contains the coordinates of the middle diagonal block if the path is diagonal
+            if back_to_back != []:
+                b2b_x = int(back_to_back[0]['x'])
+                b2b_y = int(back_to_back[0]['y'])
+                b2b_z = int(back_to_back[0]['z'])
+            ## Any unplaced wool next to the diagonal block means the next diagonal follows straight on
+                if graph.unvisited_neighbours((b2b_x, b2b_y, b2b_z), visited):
+                    self.mark_back_to_back(placed_blocks, placed_block_iter)
+                else:
+                    logger.log(TRACE, 'Not Back to Back')
+
+            elif back_to_back == []:
+                logger.log(TRACE, 'No diagonal blocks found, not testing for back-to-back this iteration.')
+
+            cont_x = int(continue_coordinates[0]['x'])
+            cont_y = int(continue_coordinates[0]['y'])
+            cont_z = int(continue_coordinates[0]['z'])
+            if back_to_back != []:
+                use_case = back_to_back[0]['use_case']
+            else:
+                use_case = continue_coordinates[0]['use_case']                
+
+            coordinates = [{'x': cont_x, 'y': cont_y, 'z': cont_z, 'value': 1, 'use_case': use_case}]
+            # print('Next Block for Pink Wool path testing is at:', coordinates)
+
+            second_block_coordinates = graph.unvisited_neighbours((cont_x, cont_y, cont_z), visited)
+            # print(placed_blocks)
+            # print("After start_direction:", second_block_coordinates)
+
+            if any(d['value'] == 1 for d in second_block_coordinates):
+                # print('Second block found.  Continuing operation.')
+                continue_operation = True
+                continue
+            else :
+                # print('Second block not found.  Ending operation.')
+                continue_operation = False
+                break
+
+        buffer.flush()
+        return coordinates, placed_blocks, placed_block_iter
+
+    def lay_track(self, power_choice, coordinates, buffer, dimension, placed_blocks, placed_block_iter, placed_rails, placed_rails_iter, first=0, last=None):
+        """Place the rails and ballast along path indices first..last - 1 (the whole path by default).  A generator."""
+        if last is None:
+            last = len(placed_blocks)
+    ## Rails and ballast work through the route a window at a time, so the staged writes stay bounded by the window size
+        route_length = len(placed_blocks)
+        for start, stop in windows(last, first=first):
+            yield phase_progress('rails', start, route_length)
+            placed_rails, placed_rails_iter = self.set_rails(power_choice, coordinates, buffer, dimension, placed_blocks, placed_block_iter, placed_rails, placed_rails_iter, start, stop)
+            buffer.flush()
+        placed_ballast_inner = PathTable(BALLAST_FIELDS)
+        placed_ballast_outer = PathTable(BALLAST_FIELDS)
+        for start, stop in windows(last, first=first):
+            yield phase_progress('ballast', start, route_length)
+            placed_ballast_inner, placed_ballast_outer = self.set_ballast(coordinates, buffer, dimension, placed_blocks, placed_block_iter, placed_rails, placed_rails_iter, start, stop, placed_ballast_inner, placed_ballast_outer)
+            buffer.flush()
+
+    # Uncomment to log the blocks that are placed on the "Core" path and the "Inner" & "Outer" ballast sets.
+        # directory = os.getcwd()
+        # with open(f'{directory}\\amulet_map_editor\\programs\\edit\\plugins\\operations\\stock_plugins\\operations\\placed_blocks_output.json', 'w') as f:
+        #     json.dump(placed_blocks.to_dicts(), f, indent=4)
+        # with open(f'{directory}\\amulet_map_editor\\programs\\edit\\plugins\\operations\\stock_plugins\\operations\\inner_ballast_output.json', 'w') as f:
+        #     json.dump(placed_ballast_inner.to_dicts(), f, indent=4)
+        # with open(f'{directory}\\amulet_map_editor\\programs\\edit\\plugins\\operations\\stock_plugins\\operations\\outer_ballast_output.json', 'w') as f:
+        #     json.dump(placed_ballast_outer.to_dicts(), f, indent=4)
+
+        return placed_rails, placed_rails_iter, placed_ballast_inner, placed_ballast_outer
+
+    def build_supports(self, cribbing_choice, minus1_choice, pillar_choice, coordinates, world, buffer, dimension, placed_blocks, placed_block_iter, placed_rails, placed_rails_iter, placed_ballast_inner, placed_ballast_outer, placed_support_blocks, placed_support_block_iter, support_locations, construction_dir=None):
+    ## The ground probe reads the chunks directly, so the roadbed has to be in the world first
+        buffer.flush()
+        yield phase_progress('ground')
+        placed_block_x_z_inner, placed_block_x_z_core, placed_block_x_z_outer = self.find_solid_ground(coordinates, world, dimension, placed_blocks, placed_block_iter, placed_rails, placed_rails_iter, placed_ballast_inner, placed_ballast_outer)
+        yield phase_progress('supports')
+        support_locations = self.place_supports(cribbing_choice, minus1_choice, coordinates, buffer, dimension, placed_blocks, placed_block_iter, placed_rails, placed_rails_iter, placed_ballast_inner, placed_ballast_outer, placed_block_x_z_inner, placed_block_x_z_core, placed_block_x_z_outer, support_locations)
+        logger.info('Total core blocks placed: %d', placed_block_iter)
+        placed_support_blocks, placed_support_block_iter = yield from self.place_pillars(pillar_choice, support_locations, buffer, dimension, placed_support_blocks, placed_support_block_iter, construction_dir)
+        buffer.flush()
+
+    def place_pillars(self, pillar_choice, support_locations, buffer, dimension, placed_support_blocks, placed_support_block_iter, construction_dir=None):
+    # Debug that Pillar choice is being passed correctly and the Support Locations list is being populated
+        # print('Pillar Choice:', pillar_choice)
+        # print('Support Locations:', support_locations)
+        if support_locations is not None and len(support_locations) > 0:
+
+        ## The construction files sit next to the plug-in unless a folder is given (the command line runner does)
+            if construction_dir is None:
+                construction_dir = default_construction_dir()
+        # Debug print statement
+            # print(construction_dir)
+            if pillar_choice == "3x3 Dark Oak":
+                src_file_path_ns = os.path.join(construction_dir, "2x2_pier_NorthSouth_DarkOak.construction")
+                src_file_path_ew = os.path.join(construction_dir, "2x2_pier_EastWest_DarkOak.construction")
+            elif pillar_choice == "3x5 Blackstone":
+                src_file_path_ns = os.path.join(construction_dir, "3x5_pier_NorthSouth_Blackstone.construction")
+                src_file_path_ew = os.path.join(construction_dir, "3x5_pier_EastWest_Blackstone.construction")
+            elif pillar_choice == "3x3 Smooth Stone":
+                src_file_path_ns = os.path.join(construction_dir, "3x3_pier_NorthSouth_PolishedStone.construction")
+                src_file_path_ew = os.path.join(construction_dir, "3x3_pier_EastWest_PolishedStone.construction")
+        # The file opened will depend on the direction of the path
+            construction_blocks_ns = self.read_construction(src_file_path_ns)
+            construction_blocks_ew = self.read_construction(src_file_path_ew)
+            ## Debug print statement
+                # print('construction blocks dictionary:', construction_blocks)
+        # Iterate over each "location" (X, Y, X) in the support_locations list
+            for location_iter, location in enumerate(support_locations):
+                if location_iter % 16 == 0:
+                    buffer.flush()
+                    yield phase_progress('pillars', location_iter, len(support_locations))
+                location_x = location['x'][0]
+                location_y = location['y'][0]
+                location_z = location['z'][0]
+                location_air_depth = location['air_depth'][0]
+                location_water_depth = location['water_depth'][0]
+                location_facing = location['facing'][0]
+                total_y = int(location_air_depth) + int(location_water_depth)
+
+
+                # print(f"total_y: {total_y}, support_coordinates: {support_coordinates}")  # Debug print statement
+
+                if location_facing == 'north' or location_facing == 'south' or location_facing == 'north-northwest' or location_facing == 'north-northeast' or location_facing == 'south-southwest' or location_facing == 'south-southeast' or location_facing == 'wild':
+                    if pillar_choice == "3x3 Dark Oak":
+                        support_coordinates = {'x': location_x - 1, 'y': location_y, 'z': location_z - 1, 'facing': location_facing}
+                    elif pillar_choice == "3x5 Blackstone":
+                        support_coordinates = {'x': location_x - 1, 'y': location_y, 'z': location_z - 2, 'facing': location_facing}
+                    elif pillar_choice == "3x3 Smooth Stone":
+                        support_coordinates = {'x': location_x - 1, 'y': location_y, 'z': location_z - 1, 'facing': location_facing}
+                ## The whole pillar (template x height) is staged as one array instead of one set_blocks call per Y level
+                    placed_support_blocks, placed_support_block_iter = self.extrude_blocks(buffer, dimension, support_coordinates, construction_blocks_ns, total_y, placed_support_blocks, placed_support_block_iter)
+                elif location_facing == 'east' or location_facing == 'west' or location_facing == 'west-northwest' or location_facing == 'west-southwest' or location_facing == 'east-northeast' or location_facing == 'east-southeast':
+                    if pillar_choice == "3x3 Dark Oak":
+                        support_coordinates = {'x': location_x - 1, 'y': location_y, 'z': location_z - 1, 'facing': location_facing}
+                    elif pillar_choice == "3x5 Blackstone":
+                        support_coordinates = {'x': location_x - 2, 'y': location_y, 'z': location_z - 1, 'facing': location_facing}
+                    elif pillar_choice == "3x3 Smooth Stone":
+                        support_coordinates = {'x': location_x - 1, 'y': location_y, 'z': location_z - 1, 'facing': location_facing}
+                    placed_support_blocks, placed_support_block_iter = self.extrude_blocks(buffer, dimension, support_coordinates, construction_blocks_ew, total_y, placed_support_blocks, placed_support_block_iter)
+        return placed_support_blocks, placed_support_block_iter
+
+###
+### The "Read Selection" function is used to read the selection box and create an array of coordinates
+###
+### For this class, the selection should always be a single block tall in all dimensions, and made of
+### "Pink Wool" or the path will not instantiate correctly.
+### 
+
+
+    @staticmethod
+    def read_selection(world: "BaseLevel", dimension: Dimension, selection: SelectionGroup, placed_blocks, placed_block_iter):
+        coordinates, placed_blocks, placed_block_iter = RailBuilder.get_coordinates_bulk(world, dimension, selection, placed_blocks, placed_block_iter)
+        return(coordinates, placed_blocks, placed_block_iter)
+        ## Print the coordinates to the console for a sanity check
+        # print(coordinates)
+
+###
+### The "Get Coordinates Bulk" function reads the selection a chunk slice at a time and builds NumPy masks of the
+### Pink/Orange/Purple wool.  Only the wool blocks are returned and only the wool blocks are turned into
+### cobblestone, so large selections do not cost a get_block and a set_version_block per block.
+###
+
+    @staticmethod
+    def get_coordinates_bulk(world: "BaseLevel", dimension: Dimension, selection: SelectionGroup, placed_blocks, placed_block_iter, writer=None):
+        coordinates = []
+        platform, version_number = world.level_wrapper.platform, world.level_wrapper.version
+    ## A planning run hands in an EditRecorder, so the wool is only recorded as turning to cobblestone
+        if writer is None:
+            writer = world
+
+        track_base_block = Block('minecraft', 'cobblestone')
+
+        marker_coords, use_case_codes = scan_markers(world, dimension, selection)
+        for (x, y, z), code in zip(marker_coords.tolist(), use_case_codes.tolist()):
+            coordinates.append({'x': x, 'y': y, 'z': z, 'value': 1, 'use_case': USE_CASE_NAMES[code]})
+            writer.set_version_block(x, y, z, dimension, (platform, version_number), track_base_block, None)
+        return coordinates, placed_blocks, placed_block_iter
+
+    @staticmethod
+    def mark_back_to_back(placed_blocks, placed_block_iter):
+        # print('Back to Back, altering direction of last block in placed_blocks dict.')
+        use_case = placed_blocks[-1]['use_case']
+        # print('Back to Back Use Case:', use_case)
+        ###
+        ### Need to update the direction of the last block in the placed_blocks dictionary to reflect the back-to-back status
+        ### read the direction of the -2 block and update the -1 block to reflect the appropriately connecting direction
+        ###
+        if placed_blocks[-2]['direction'] == 'north_west':
+            placed_blocks[-1] = {'x': placed_blocks[-1]['x'], 'y': placed_blocks[-1]['y'], 'z': placed_blocks[-1]['z'], 'count': placed_block_iter - 1, 'direction': 'south_east', 'origin_direction': 'north_west', 'facing': 'wild', 'state': 'diagonal', 'b2b': True, 'use_case': use_case}
+            # print('Current Iteration is:', placed_block_iter - 1, 'Block is:', placed_blocks[-1])
+            # print('Updated Block:', placed_blocks[-1])
+        elif placed_blocks[-2]['direction'] == 'north_east':
+            placed_blocks[-1] = {'x': placed_blocks[-1]['x'], 'y': placed_blocks[-1]['y'], 'z': placed_blocks[-1]['z'], 'count': placed_block_iter - 1, 'direction': 'south_west', 'origin_direction': 'north_east', 'facing': 'wild', 'state': 'diagonal', 'b2b': True, 'use_case': use_case}
+            # print('Current Iteration is:', placed_block_iter - 1, 'Block is:', placed_blocks[-1])
+            # print('Updated Block:', placed_blocks[-1])
+        elif placed_blocks[-2]['direction'] == 'south_west':
+            # print('Current Iteration is:', placed_block_iter - 1, 'Block is:', placed_blocks[-1])
+            placed_blocks[-1] = {'x': placed_blocks[-1]['x'], 'y': placed_blocks[-1]['y'], 'z': placed_blocks[-1]['z'], 'count': placed_block_iter - 1, 'direction': 'north_east', 'origin_direction': 'south_west', 'facing': 'wild', 'state': 'diagonal', 'b2b': True, 'use_case': use_case}
+            # print('Updated Block:', placed_blocks[-1])
+        elif placed_blocks[-2]['direction'] == 'south_east':
+            # print('Current Iteration is:', placed_block_iter - 1, 'Block is:', placed_blocks[-1])
+            # print('Updated Block:', placed_blocks[-1])
+            placed_blocks[-1] = {'x': placed_blocks[-1]['x'], 'y': placed_blocks[-1]['y'], 'z': placed_blocks[-1]['z'], 'count': placed_block_iter - 1, 'direction': 'north_west', 'origin_direction': 'south_east', 'facing': 'wild', 'state': 'diagonal', 'b2b': True, 'use_case': use_case}            
+        return
+
+    @staticmethod
+    def rail_direction(coordinates, second_block_coordinates, world, dimension):
+        # print('\"Second Block Coords\" Dict:', second_block_coordinates)
+        block_differential = []
+        for coord in coordinates:
+            x = coord['x']
+            y = coord['y']
+            z = coord['z']
+            use_case = coord['use_case']
+            # If there is at least one next block...
+            if len(second_block_coordinates) >= 1:
+                # Consider the last two entries if there are more than one
+                last_two_blocks = second_block_coordinates[-2:] if len(second_block_coordinates) > 1 else second_block_coordinates
+                for next_coord in last_two_blocks:
+                    next_x = next_coord['x']
+                    next_y = next_coord['y']
+                    next_z = next_coord['z']
+                    value = len(last_two_blocks)
+                    diff_x = next_x - x
+                    diff_y = next_y - y
+                    diff_z = next_z - z
+                    block_differential.append({'x': diff_x, 'y': diff_y, 'z': diff_z, 'value': value, 'use_case': use_case})
+        # print('Block Differential output from \"block_diff_funct\":', block_differential)
+        return block_differential               
+
+###
+###  Now we need to build a library of functions to place the rails and roadbed
+###  along the path defined by the Pink Wool blocks.
+###  Need to determine North/South/East/West direction of the path.
+###  And, whether the path goes up or down.
+###  The script also needs to keep track of where rails have been to exclude those checks from the next iteration.
+
+    @staticmethod
+    def set_roadbase(coordinates, second_block_coordinates, block_differential, recursive, world, dimension, placed_blocks, placed_block_iter):
+        back_to_back = []
+        continue_coordinates = []
+        direction_dict = []
+        platform, version_number = world.level_wrapper.platform, world.level_wrapper.version
+
+    ## The roadbed blocks are built once per platform and shared by every call
+        roadbase_block = roadbase_blocks(platform)
+        track_base_block = roadbase_block['track_base']
+
+        # In order to place stairs, rails, etc in the correct direction, we have to determine the direction of the path.
+        # Using block_differential, we can determine the direction of the path.  The len(block_differential) == 1 when the path is straight, and 2+ when the path is complex
+        # print('block differential in set roadbase', block_differential)
+        if len(block_differential) == 1:
+
+##
+##  Thus far, the code determines the axis or corners correctly, however, it doesn't indicate what direction the path is going.
+##  So, in addition to returning the axis or corner, we need to return the direction of the path.
+##  Let's add an entry to placed_blocks called "facing" to indicate the direction of the path.
+##  This will allow us to determine which set of ballast blocks is on the "inside" of the path and which is on the "outside".
+##  That is going to be necessary we we can test for air and water under the ballast blocks in the correct order and take actions
+##  based on wether air is found under the "inside" or "outside" ballast blocks, depending on the test under the central path block.
+##
+##  The rail direction and facing for every one block step live in the STRAIGHT_STEPS table, keyed by (dx, dy, dz)
+##
+            dx, dy, dz = block_differential[0]['x'], block_differential[0]['y'], block_differential[0]['z']
+            step = STRAIGHT_STEPS.get((dx, dy, dz))
+            if step is None:
+                logger.debug('determine_direction: block_differential=%s, base=(%s,%s,%s), iter=%s', block_differential, coordinates[0]['x'], coordinates[0]['y'], coordinates[0]['z'], placed_block_iter)
+                raise OperationError(f"Could not work out the rail direction for a step of {(dx, dy, dz)}.")
+            direction, facing = step
+            direction_dict.append(direction)
+
+    ## Corindates and block placement are working, but ascending rail placement is not if the ascending rail is not the first block placed
+    ##
+    ## Descending rail placement is working
+    ##
+    ## Theory -- we need to update the iteration prior to the current block to place the ascending rail
+    ##
+
+        ## Read coordinates list at the base location of the current iteration
+            base_x = coordinates[0]['x']
+            base_y = coordinates[0]['y']
+            base_z = coordinates[0]['z']
+            use_case = second_block_coordinates[0]['use_case']
+            # print('second block use_case', use_case)
+            # print('Coordinates', coordinates)
+            # print('Base block rail direction:', direction)
+        ## Read "use_case" at this iteration
+   
+
+        ## Add first block to placed_blocks list after determining starting direction
+            if placed_block_iter == 0:
+                placed_blocks.append({'x': base_x, 'y': base_y, 'z': base_z, 'count': placed_block_iter, 'direction': direction, 'origin_direction': direction, 'facing': facing, 'state': 'cardinal', 'b2b': False, 'use_case': use_case})
+                logger.debug('First roadbase block: %s', placed_blocks[0])
+                placed_block_iter += 1
+                # print('dx, dy, dz:', dx, dy, dz)
+
+        ## Place a single block at "second block location"           
+            # print('Roadbase blocks placed before current iteration:', placed_block_iter)
+            # print('dx, dy, dz:', dx, dy, dz)            
+            world.set_version_block(base_x + dx, base_y + dy, base_z + dz, dimension, (platform, version_number), track_base_block, None)
+
+            if dy > 0:
+                # print('dy > 1')
+                placed_blocks[-1] = {'x': base_x, 'y': base_y, 'z': base_z, 'count': placed_block_iter, 'direction': direction, 'origin_direction': direction, 'facing': facing, 'state': 'cardinal', 'b2b': False, 'use_case': use_case}
+                placed_blocks.append({'x': base_x + dx, 'y': base_y + dy, 'z': base_z + dz, 'count': placed_block_iter, 'direction': direction, 'origin_direction': direction, 'facing': facing, 'state': 'cardinal', 'b2b': False, 'use_case': use_case})                
+                recursive = True
+            else:
+                # print(recursive)
+                if recursive == True:
+                    # print('Recursive!!!!')
+                    # print('End of Placed Blocks Dictionary before Recursive Operation', placed_blocks[-2], placed_blocks[-1])
+                    placed_blocks[-1] = {'x': base_x, 'y': base_y, 'z': base_z, 'count': placed_block_iter, 'direction': direction, 'origin_direction': direction, 'facing': facing, 'state': 'cardinal', 'b2b': False, 'use_case': use_case}
+                    # print('End of Placed Blocks Dictionary after Recursive Operation', placed_blocks[-2], placed_blocks[-1])
+                # print('dy <= 0')
+                placed_blocks.append({'x': base_x + dx, 'y': base_y + dy, 'z': base_z + dz, 'count': placed_block_iter, 'direction': direction, 'origin_direction': direction, 'facing': facing, 'state': 'cardinal', 'b2b': False, 'use_case': use_case})
+                recursive = False
+
+            # print('Iteration', placed_block_iter, 'placed block at:', base_x + dx, base_y + dy, base_z + dz)
+            placed_block_iter += 1
+            # print('Roadbase blocks placed through current iteration:', placed_block_iter)
+        # Print the updated placed blocks                 
+            # print('Updated placed blocks dict:', placed_blocks)
+            if logger.isEnabledFor(TRACE):
+                logger.log(TRACE, 'Current Iteration is: %d Block is: %s', placed_block_iter - 1, placed_blocks[-1])
+        ## back_to_back should stay empty if the path is N-S or E-W
+        ## Continue testing at the block
+            continue_coordinates.append({'x': base_x + dx, 'y': base_y + dy, 'z': base_z + dz, 'value': direction, 'use_case': use_case})
+            # print('N-S or E-W direction, continuing pathfinding at:', continue_coordinates, 'facing:', facing)                             
+
+        elif len(block_differential) == 2:
+
+            base_x = coordinates[0]['x']
+            base_y = coordinates[0]['y'] 
+            base_z = coordinates[0]['z']
+            use_case = second_block_coordinates[0]['use_case']
+            use_case2 = second_block_coordinates[1]['use_case']
+
+            # print('Base block of iteration (len 2):', base_x, base_y, base_z, use_case)
+            # print('2nd Coordinates', second_block_coordinates)
+            # if placed_blocks:
+            #     print('Current Iteration is:', placed_block_iter - 1, 'Block is:', placed_blocks[-1])
+            # else:
+            #     print('Current Iteration is:', placed_block_iter - 1, 'Block is: List is empty')
+
+        ## Corner steps are looked up by the pair of deltas in CORNER_STEPS.  The table gives the two blocks in the
+        ## order they have to be placed, and the rail directions of the start, corner and end blocks
+            corner_key = tuple((item['x'], item['y'], item['z']) for item in block_differential)
+            corner = CORNER_STEPS.get(corner_key)
+            if corner is None:
+                logger.debug('determine_direction: block_differential=%s, base=(%s,%s,%s), iter=%s', block_differential, base_x, base_y, base_z, placed_block_iter)
+                raise OperationError(f"Could not work out the rail direction for the corner {corner_key}.")
+            direction = facing = corner.facing
+            (x1, y1, z1), (x2, y2, z2) = corner.first, corner.second
+            d1, d2, d3 = corner.start_direction, corner.corner_direction, corner.end_direction
+            if placed_block_iter == 1:
+                world.set_version_block(base_x, base_y + 1, base_z, dimension, (platform, version_number), roadbase_block[corner.start_rail], None)
+            direction_dict.append(direction)
+        ## Debug print statement for the direction of the path    
+            # print(direction_dict)    
+
+        ## Add first block to placed_blocks list after determining starting direction
+            if placed_block_iter == 0:
+                placed_blocks.append({'x': base_x, 'y': base_y, 'z': base_z, 'count': placed_block_iter, 'direction': d1, 'origin_direction': direction, 'facing': 'unknown', 'state': 'cardinal', 'b2b': False, 'use_case': use_case})
+                # print('starting block @:', placed_blocks)                
+                placed_block_iter += 1
+        ## If recursive, we need to go back and change the "ascending" blok to the direction of D1
+            if recursive == True:
+                # print('Recursive!!!!')
+                # print('End of Placed Blocks Dictionary before Recursive Operation', placed_blocks[-2], placed_blocks[-1])
+                placed_blocks[-1] = {'x': base_x, 'y': base_y, 'z': base_z, 'count': placed_block_iter, 'direction': d1, 'origin_direction': direction, 'facing': facing, 'state': 'cardinal', 'b2b': False, 'use_case': use_case}
+                # print('End of Placed Blocks Dictionary after Recursive Operation', placed_blocks[-2], placed_blocks[-1])
+                recursive = False
+        ## Place first of two blocks
+            # print('placed count before current iteration:', placed_block_iter)
+            world.set_version_block(base_x + x1, base_y + y1, base_z + z1, dimension, (platform, version_number), track_base_block, None)
+            placed_blocks.append({'x': base_x + x1, 'y': base_y + y1, 'z': base_z + z1, 'count': placed_block_iter, 'direction': d2, 'origin_direction': direction, 'facing': facing, 'state': 'corner', 'b2b': False, 'use_case': use_case})
+            # print('Block 1 placed block at:', base_x + x1, base_y + y1, base_z + z1, 'count:', placed_block_iter, 'use_case:', use_case)
+            placed_block_iter += 1
+            # print('placed count after current iteration:', placed_block_iter)
+        ## Place second of two blocks
+            # print('placed count before current iteration:', placed_block_iter)
+            world.set_version_block(base_x + x2, base_y + y2, base_z + z2, dimension, (platform, version_number), track_base_block, None)
+            placed_blocks.append({'x': base_x + x2, 'y': base_y + y2, 'z': base_z + z2, 'count': placed_block_iter, 'direction': d3, 'origin_direction': direction, 'facing': facing, 'state': 'cardinal', 'b2b': False, 'use_case': use_case2})
+            # print('Block 2 placed block at:', base_x + x2, base_y + y2, base_z + z2, 'count:', placed_block_iter, 'use_case:', use_case2)            
+            placed_block_iter += 1
+            # print('placed count after current iteration:', placed_block_iter)    
+        ## Print the updated placed blocks           
+            # print('updated placed blocks:', placed_blocks)        
+        ## Continue testing at the second placed block
+            back_to_back.append({'x': base_x + x1, 'y': base_y + y1, 'z': base_z + z1, 'value': direction, 'use_case': use_case2})
+            continue_coordinates.append({'x': base_x + x2, 'y': base_y + y2, 'z': base_z + z2, 'value': direction, 'use_case': use_case})
+            # print('multiple blocks set, continue at:', continue_coordinates)  
+        return back_to_back, continue_coordinates, recursive, placed_blocks, placed_block_iter
+
+
+    @staticmethod
+    def set_rails(power_choice, coordinates, world, dimension, placed_blocks, placed_block_iter, placed_rails, placed_rails_iter, start=0, stop=None):
+        platform, version_number = world.level_wrapper.platform, world.level_wrapper.version
+
+        air_block = Block('minecraft', 'air')
+
+        if power_choice == 'Powered':
+            rail_north_ascending = Block('minecraft', 'golden_rail', {"rail_data_bit": ByteTag(0), "rail_direction": IntTag(4)})
+            rail_north_descending = Block('minecraft', 'golden_rail', {"rail_data_bit": ByteTag(0), "rail_direction": IntTag(5)})
+            rail_east_ascending = Block('minecraft', 'golden_rail', {"rail_data_bit": ByteTag(0), "rail_direction": IntTag(2)})
+            rail_east_descending = Block('minecraft', 'golden_rail', {"rail_data_bit": ByteTag(0), "rail_direction": IntTag(3)})
+        else:
+            rail_north_ascending = Block('minecraft', 'rail', {"rail_direction": IntTag(4)})
+            rail_north_descending = Block('minecraft', 'rail', {"rail_direction": IntTag(5)})
+            rail_east_ascending = Block('minecraft', 'rail', {"rail_direction": IntTag(2)})
+            rail_east_descending = Block('minecraft', 'rail', {"rail_direction": IntTag(3)})
+
+        rail_north_south = Block('minecraft', 'rail', {"rail_direction": IntTag(0)})
+        # rail_north_ascending = Block('minecraft', 'rail', {"rail_direction": IntTag(4)})
+        # rail_north_descending = Block('minecraft', 'rail', {"rail_direction": IntTag(5)})                   
+        rail_east_west = Block('minecraft', 'rail', {"rail_direction": IntTag(1)})
+        # rail_east_ascending = Block('minecraft', 'rail', {"rail_direction": IntTag(2)})
+        # rail_east_descending = Block('minecraft', 'rail', {"rail_direction": IntTag(3)})
+        rail_north_west = Block('minecraft', 'rail', {"rail_direction": IntTag(8)})
+        rail_north_east = Block('minecraft', 'rail', {"rail_direction": IntTag(9)})
+        rail_south_west = Block('minecraft', 'rail', {"rail_direction": IntTag(7)})
+        rail_south_east = Block('minecraft', 'rail', {"rail_direction": IntTag(6)})                                                   
+
+        powered_rail_north_south = Block('minecraft', 'golden_rail', {"rail_data_bit": ByteTag(0), "rail_direction": IntTag(0)})
+        powered_rail_north_ascending = Block('minecraft', 'golden_rail', {"rail_data_bit": ByteTag(0), "rail_direction": IntTag(4)})
+        powered_rail_north_descending = Block('minecraft', 'golden_rail', {"rail_data_bit": ByteTag(0), "rail_direction": IntTag(5)})                   
+        powered_rail_east_west = Block('minecraft', 'golden_rail', {"rail_data_bit": ByteTag(0), "rail_direction": IntTag(1)})
+        powered_rail_east_ascending = Block('minecraft', 'golden_rail', {"rail_data_bit": ByteTag(0), "rail_direction": IntTag(2)})
+        powered_rail_east_descending = Block('minecraft', 'golden_rail', {"rail_data_bit": ByteTag(0), "rail_direction": IntTag(3)})
+
+        rail_directions = {
+            'north_south': rail_north_south,
+            'north_ascending': rail_north_ascending,
+            'north_descending': rail_north_descending,
+            'east_west': rail_east_west,
+            'east_ascending': rail_east_ascending,
+            'east_descending': rail_east_descending,
+            'north_west': rail_north_west,
+            'north_east': rail_north_east,
+            'south_west': rail_south_west,
+            'south_east': rail_south_east
+        }
+
+        powered_rail_directions = {
+            'north_south': powered_rail_north_south,
+            'north_ascending': powered_rail_north_ascending,
+            'north_descending': powered_rail_north_descending,
+            'east_west': powered_rail_east_west,
+            'east_ascending': powered_rail_east_ascending,
+            'east_descending': powered_rail_east_descending
+        }
+
+        ascending_directions = {
+            'north_ascending': rail_north_ascending,
+            'north_descending': rail_north_descending,
+            'east_ascending': rail_east_ascending,
+            'east_descending': rail_east_descending,
+            'north_ascending': powered_rail_north_ascending,
+            'north_descending': powered_rail_north_descending,
+            'east_ascending': powered_rail_east_ascending,
+            'east_descending': powered_rail_east_descending            
+        }
+
+        invalid_powered_rail_direction = {
+            'north_west',
+            'north_east',
+            'south_west',
+            'south_east'
+        }
+
+        # print('placed rail count:', placed_rails_iter)
+        # print('first rail:', placed_blocks[placed_rails_iter])
+
+    ## start/stop limit the call to one window of the path, the whole path by default
+        if stop is None:
+            stop = len(placed_blocks)
+        for i in range(start, stop):
+            x1 = placed_blocks[i]['x']
+            y1 = placed_blocks[i]['y']
+            z1 = placed_blocks[i]['z']
+            direction = placed_blocks[i]['direction']
+            if placed_rails_iter % 16 == 16:
+                powered = True
+            else:
+                powered = False
+        # Place a rail at the base block location (+1 Y) based on the direction of the path
+            if powered == True and direction != invalid_powered_rail_direction:                
+                rail_block = powered_rail_directions[direction]
+                world.set_version_block(x1, y1 + 1, z1, dimension, (platform, version_number), rail_block, None)
+                world.set_version_block(x1, y1 + 2, z1, dimension, (platform, version_number), air_block, None)
+                if direction in ascending_directions:
+                    world.set_version_block(x1, y1 + 3, z1, dimension, (platform, version_number), air_block, None)
+                placed_rails_iter += 1
+                # print('placed powered rail at:', x1, y1 + 1, z1, 'direction:', direction, 'facing:', facing, 'count:', placed_rails_iter)
+            else:
+                rail_block = rail_directions[direction]    
+                world.set_version_block(x1, y1 + 1, z1, dimension, (platform, version_number), rail_block, None)
+                world.set_version_block(x1, y1 + 2, z1, dimension, (platform, version_number), air_block, None)
+                if direction in ascending_directions:
+                    world.set_version_block(x1, y1 + 3, z1, dimension, (platform, version_number), air_block, None)                
+                placed_rails_iter += 1
+                # print('placed rail at:', x1, y1 + 1, z1, 'direction:', direction, 'facing:', facing, 'count:', placed_rails_iter)
+
+        return placed_rails, placed_rails_iter              
+
+###
+###
+###  Time to start placing the "ballast" blocks to the sides of the roadbed
+###  These blocks will be heavily dependent on the direction of the roadbed, and the rails ahead
+###  and behind the current block.
+###
+###  Goal 1) Cobblestone stairs on the sides of the roadbed
+###  Goal 2) Test for air under all blocks
+###  Goal 3) Create a "support" under the "ballast" and "roadbed" blocks
+###  Goal 4) Paste a schematic under the roadbed if air depth exceeds 3 blocks
+###
+
+    @staticmethod
+    def set_ballast(coordinates, world, dimension, placed_blocks, placed_block_iter, placed_rails, placed_rails_iter, start=0, stop=None, placed_ballast_inner=None, placed_ballast_outer=None):
+        platform, version_number = world.level_wrapper.platform, world.level_wrapper.version
+
+    ## A windowed call (start/stop) appends to the ballast tables of the previous window
+        if placed_ballast_inner is None:
+            placed_ballast_inner = PathTable(BALLAST_FIELDS)
+        if placed_ballast_outer is None:
+            placed_ballast_outer = PathTable(BALLAST_FIELDS)
+        if stop is None:
+            stop = len(placed_blocks)
+
+##
+##  The stairs are being set correctly.  Now, we need to confirm path-finding is able to tell the "inside" from the "outside" of the path
+##  To do that, we'll change the blocks below to be a different color and use the "facing" key in the placed_blocks dictionary to determine
+##  which set of stairs to place.
+##
+##  The "inside" will be blue wool and the "outside" will be red wool.  Corners will be green wool.
+##
+        # stair_northsouth_1_block = Block('minecraft', 'blue_wool')
+        # stair_northsouth_2_block = Block('minecraft', 'red_wool')
+        # stair_eastwest_1_block = Block('minecraft', 'blue_wool')
+        # stair_eastwest_2_block = Block('minecraft', 'red_wool')
+        # stair_corner_1_block = Block('minecraft', 'green_wool')
+        # stair_corner_2_block = Block('minecraft', 'green_wool')
+        # stair_corner_3_block = Block('minecraft', 'green_wool')
+        # stair_corner_4_block = Block('minecraft', 'green_wool')
+        # stair_corner_5_block = Block('minecraft', 'green_wool')
+        # stair_corner_6_block = Block('minecraft', 'green_wool')
+        # stair_corner_7_block = Block('minecraft', 'green_wool')
+        # stair_corner_8_block = Block('minecraft', 'green_wool')
+
+        stair_northsouth_1_block = Block('minecraft', 'stone_stairs', {"upside_down_bit": ByteTag(0), "weirdo_direction": IntTag(0)})
+        stair_northsouth_2_block = Block('minecraft', 'stone_stairs', {"upside_down_bit": ByteTag(0), "weirdo_direction": IntTag(1)})
+        stair_eastwest_1_block = Block('minecraft', 'stone_stairs', {"upside_down_bit": ByteTag(0), "weirdo_direction": IntTag(2)})
+        stair_eastwest_2_block = Block('minecraft', 'stone_stairs', {"upside_down_bit": ByteTag(0), "weirdo_direction": IntTag(3)})
+
+    ## Since I only play Bedrock, and Bedrock is pants at explicit stair placement, I am going to leave these entries here for future development
+    ## Giant has also said that he is going to be obfuscating the "Universal" block refs, so these will need to be updated to the new format
+        # stair_corner_1_block = Block('universal_minecraft', 'stairs', {"material": StringTag("cobblestone"), "facing": StringTag("north"), "half": StringTag("bottom"), "shape": StringTag("inner_left")})
+        # stair_corner_2_block = Block('universal_minecraft', 'stairs', {"material": StringTag("cobblestone"), "facing": StringTag("north"), "half": StringTag("bottom"), "shape": StringTag("inner_right")})
+        # stair_corner_3_block = Block('universal_minecraft', 'stairs', {"material": StringTag("cobblestone"), "facing": StringTag("north"), "half": StringTag("bottom"), "shape": StringTag("outer_left")})
+        # stair_corner_4_block = Block('universal_minecraft', 'stairs', {"material": StringTag("cobblestone"), "facing": StringTag("north"), "half": StringTag("bottom"), "shape": StringTag("outer_right")})
+        # stair_corner_5_block = Block('universal_minecraft', 'stairs', {"material": StringTag("cobblestone"), "facing": StringTag("south"), "half": StringTag("bottom"), "shape": StringTag("inner_left")})
+        # stair_corner_6_block = Block('universal_minecraft', 'stairs', {"material": StringTag("cobblestone"), "facing": StringTag("south"), "half": StringTag("bottom"), "shape": StringTag("inner_right")})
+        # stair_corner_7_block = Block('universal_minecraft', 'stairs', {"material": StringTag("cobblestone"), "facing": StringTag("south"), "half": StringTag("bottom"), "shape": StringTag("outer_left")})
+        # stair_corner_8_block = Block('universal_minecraft', 'stairs', {"material": StringTag("cobblestone"), "facing": StringTag("south"), "half": StringTag("bottom"), "shape": StringTag("outer_right")})
+
+        air_block = Block('minecraft', 'air')
+        stair_corner_1_block = Block('minecraft', 'air')
+        stair_corner_2_block = Block('minecraft', 'air')
+        stair_corner_3_block = Block('minecraft', 'air')
+        stair_corner_4_block = Block('minecraft', 'air')
+        stair_corner_6_block = Block('minecraft', 'air')
+        stair_corner_7_block = Block('minecraft', 'air')
+        stair_corner_8_block = Block('minecraft', 'air')
+
+        if start == 0:
+            logger.debug('Ballast Function!')
+    ## Checked once per window, so the per-block traces below cost nothing when they are off
+        trace = logger.isEnabledFor(TRACE)
+        # print('Beginning function...')
+
+    ## placed_ballast_iter stays an index into the whole path, so the look behind/ahead works across windows
+        placed_ballast_iter = start
+
+        # print('Placed Ballast Function Iteration:', placed_ballast_iter)
+
+        for item in placed_blocks[start:stop]:
+            x = item['x']
+            y = item['y']
+            z = item['z']
+            direction = item['direction']
+            origin_direction = placed_blocks[placed_ballast_iter]['origin_direction']
+            facing = item['facing']
+            b2b = item['b2b']
+            count = item['count']
+            use_case = item['use_case']
+
+
+            if trace:
+                logger.log(TRACE, '%s Block in Ballast Function: %s %s %s direction: %s origin_direction: %s facing: %s count: %s b2b: %s use_case: %s', 'First' if placed_ballast_iter == 0 else 'Current', x, y, z, direction, origin_direction, facing, count, b2b, use_case)
+###
+### Now that we have the first, current/previous pieces passing the direction and origin_direction, we can start placing the ballast blocks
+### I think it makes sense top test the origin_direction first, then the direction of the current block
+### If the origin_direction is the same as the current direction, we can place the ballast blocks on the sides of the roadbed
+### Otherwise, we get granular with the N-NE, N-NW, S-SE, S-SW, etc directions and the eight different stair configurations
+###
+### NOTE -- Ascending and Descending blocks need additional overhead clearance, so there is one additional air block above the ballast blocks
+###         when the direction is ascending or descending.
+###
+            if origin_direction == direction:
+                # NOTE -- The last block in "back-to-back" series will test as a "simple happy path"
+                # So, we we need to test each N-S/E-W block to see if there is a b2b block before them
+                if trace:
+                    logger.log(TRACE, 'This is a simple, happy path!')
+                
+            ##
+            ## NOTE -- "Inner"/"Outer" designator on the blocks in the placed_ballast list, based on the "facing" key in the placed_blocks dictionary
+            ## Using blue wool to indicate "inner" edges and red wool to indicated the "outer" edges of the path for now for debugging purposes
+            ##
+
+                ## North-South Facing North
+                if (direction in ['north_south', 'north_ascending', 'north_descending']) and (facing == 'north'):
+                    if len(placed_blocks) == 0:
+                            # print('North-South Ballast Placement, facing North')                                           
+                            world.set_version_block(x - 1, y, z, dimension, (platform, version_number), stair_northsouth_1_block, None)
+                            world.set_version_block(x - 1, y + 1, z, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x - 1, y + 2, z, dimension, (platform, version_number), air_block, None)
+                            if direction == 'north_ascending' or direction == 'north_descending':
+                                world.set_version_block(x - 1, y + 3, z, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_inner.append({'x': x - 1, 'y': y, 'z': z, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'cardinal', 'value': 'stair_northsouth_1_block'})
+                            world.set_version_block(x + 1, y, z, dimension, (platform, version_number), stair_northsouth_2_block, None)
+                            world.set_version_block(x + 1, y + 1, z, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x + 1, y + 2, z, dimension, (platform, version_number), air_block, None)
+                            if direction == 'north_ascending' or direction == 'north_descending':
+                                world.set_version_block(x + 1, y + 3, z, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_outer.append({'x': x + 1, 'y': y, 'z': z, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'cardinal', 'value': 'stair_northsouth_2_block'})
+                    elif len(placed_blocks) > 0:
+                        prev_b2b = placed_blocks[placed_ballast_iter - 1]['b2b']
+                        prev_dir = placed_blocks[placed_ballast_iter - 1]['direction']                        
+                        # print('Previous Block b2b:', prev_b2b, 'Previous Block Direction:', prev_dir)
+                        if prev_b2b == False:     
+                            # print('North-South Ballast Placement, facing North')                                           
+                            world.set_version_block(x - 1, y, z, dimension, (platform, version_number), stair_northsouth_1_block, None)
+                            world.set_version_block(x - 1, y + 1, z, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x - 1, y + 2, z, dimension, (platform, version_number), air_block, None)   
+                            if direction == 'north_ascending' or direction == 'north_descending':
+                                world.set_version_block(x - 1, y + 3, z, dimension, (platform, version_number), air_block, None)                                                     
+                            placed_ballast_inner.append({'x': x - 1, 'y': y, 'z': z, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'cardinal', 'value': 'stair_northsouth_1_block'})
+                            world.set_version_block(x + 1, y, z, dimension, (platform, version_number), stair_northsouth_2_block, None)
+                            world.set_version_block(x + 1, y + 1, z, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x + 1, y + 2, z, dimension, (platform, version_number), air_block, None)
+                            if direction == 'north_ascending' or direction == 'north_descending':
+                                world.set_version_block(x + 1, y + 3, z, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_outer.append({'x': x + 1, 'y': y, 'z': z, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'cardinal', 'value': 'stair_northsouth_2_block'})
+                        elif prev_b2b == True and prev_dir == 'north_west':
+                            # print('North-South Ballast Placement, facing North from East-Northeast b2b')
+                            world.set_version_block(x + 1, y, z, dimension, (platform, version_number), stair_northsouth_2_block, None)
+                            world.set_version_block(x + 1, y + 1, z, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x + 1, y + 2, z, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_outer.append({'x': x + 1, 'y': y, 'z': z, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'transition', 'value': 'stair_northsouth_2_block'})
+                            placed_ballast_inner.append({'x': 'NA', 'y': 'NA', 'z': 'NA', 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'skip', 'value': 'skip'})
+                        elif prev_b2b == True and prev_dir == 'north_east':
+                            # print('North-South Ballast Placement, facing North from West-Northwest b2b')
+                            world.set_version_block(x - 1, y, z, dimension, (platform, version_number), stair_northsouth_1_block, None)
+                            world.set_version_block(x - 1, y + 1, z, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x - 1, y + 2, z, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_inner.append({'x': x - 1, 'y': y, 'z': z, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'transition', 'value': 'stair_northsouth_1_block'})
+                            placed_ballast_outer.append({'x': 'NA', 'y': 'NA', 'z': 'NA', 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'skip', 'value': 'skip'})
+
+                ## North-South Facing South
+                elif (direction in ['north_south', 'north_ascending', 'north_descending']) and (facing == 'south'):
+                    if len(placed_blocks) == 0:
+                        # print('North-South Ballast Placement, facing South') 
+                        world.set_version_block(x - 1, y, z, dimension, (platform, version_number), stair_northsouth_1_block, None)
+                        world.set_version_block(x - 1, y + 1, z, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x - 1, y + 2, z, dimension, (platform, version_number), air_block, None)                                           
+                        placed_ballast_outer.append({'x': x - 1, 'y': y, 'z': z, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'cardinal', 'value': 'stair_northsouth_2_block'})
+                        world.set_version_block(x + 1, y, z, dimension, (platform, version_number), stair_northsouth_2_block, None)
+                        world.set_version_block(x + 1, y + 1, z, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x + 1, y + 2, z, dimension, (platform, version_number), air_block, None)                                                
+                        placed_ballast_inner.append({'x': x + 1, 'y': y, 'z': z, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'cardinal', 'value': 'stair_northsouth_1_block'})
+                    elif len(placed_blocks) > 0:
+                        prev_b2b = placed_blocks[placed_ballast_iter - 1]['b2b']
+                        prev_dir = placed_blocks[placed_ballast_iter - 1]['direction']                        
+                        # print('Previous Block b2b:', prev_b2b, 'Previous Block Direction:', prev_dir)        
+                        if prev_b2b == False:
+                            # print('North-South Ballast Placement, facing South')                                                                                    
+                            world.set_version_block(x - 1, y, z, dimension, (platform, version_number), stair_northsouth_1_block, None)
+                            world.set_version_block(x - 1, y + 1, z, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x - 1, y + 2, z, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_outer.append({'x': x - 1, 'y': y, 'z': z, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'cardinal', 'value': 'stair_northsouth_2_block'})
+                            world.set_version_block(x + 1, y, z, dimension, (platform, version_number), stair_northsouth_2_block, None)
+                            world.set_version_block(x + 1, y + 1, z, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x + 1, y + 2, z, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_inner.append({'x': x + 1, 'y': y, 'z': z, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'cardinal', 'value': 'stair_northsouth_1_block'})
+                        elif prev_b2b == True and prev_dir == 'south_west':
+                            # print('North-South Ballast Placement, facing South from East-Southeast b2b')
+                            world.set_version_block(x + 1, y, z, dimension, (platform, version_number), stair_northsouth_1_block, None)
+                            world.set_version_block(x + 1, y + 1, z, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x + 1, y + 2, z, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_inner.append({'x': x + 1, 'y': y, 'z': z, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'transition', 'value': 'stair_northsouth_2_block'})
+                            placed_ballast_outer.append({'x': 'NA', 'y': 'NA', 'z': 'NA', 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'skip', 'value': 'skip'})
+                        elif prev_b2b == True and prev_dir == 'south_east':
+                            # print('North-South Ballast Placement, facing South from West-Northwest b2b')                                                        
+                            world.set_version_block(x - 1, y, z, dimension, (platform, version_number), stair_northsouth_2_block, None)
+                            world.set_version_block(x - 1, y + 1, z, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x - 1, y + 2, z, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_outer.append({'x': x - 1, 'y': y, 'z': z, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'transition', 'value': 'stair_northsouth_1_block'})
+                            placed_ballast_inner.append({'x': 'NA', 'y': 'NA', 'z': 'NA', 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'skip', 'value': 'skip'})
+                ## East-West Facing East            
+                elif (direction in ['east_west', 'east_ascending','east_descending']) and (facing == 'east'):
+                    if len(placed_blocks) == 0:
+                        # print('East-West Ballast Placement, facing East')
+                        world.set_version_block(x, y, z - 1, dimension, (platform, version_number), stair_eastwest_1_block, None)
+                        world.set_version_block(x, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x, y + 2, z - 1, dimension, (platform, version_number), air_block, None)
+                        placed_ballast_inner.append({'x': x, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'cardinal', 'value': 'stair_eastwest_1_block'})                    
+                        world.set_version_block(x, y, z + 1, dimension, (platform, version_number), stair_eastwest_2_block, None)
+                        world.set_version_block(x, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x, y + 2, z + 1, dimension, (platform, version_number), air_block, None)
+                        placed_ballast_outer.append({'x': x, 'y': y, 'z': z + 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'cardinal', 'value': 'stair_eastwest_2_block'})                                            
+                    elif len(placed_blocks) > 0:
+                        prev_b2b = placed_blocks[placed_ballast_iter - 1]['b2b']
+                        prev_dir = placed_blocks[placed_ballast_iter - 1]['direction']
+                        # print('Previous Block b2b:', prev_b2b, 'Previous Block Direction:', prev_dir)
+##
+##  Expanded this test of states to include the prev_dir when prev_b2b == false because of unexpected behavior on the last block of a east-southeast series
+##                         
+                        if prev_b2b == False and (prev_dir == 'east_west' or prev_dir == 'north_south'): 
+                            # print('East-West Ballast Placement, facing East')                                              
+                            world.set_version_block(x, y, z - 1, dimension, (platform, version_number), stair_eastwest_1_block, None)
+                            world.set_version_block(x, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x, y + 2, z - 1, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_inner.append({'x': x, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'cardinal', 'value': 'stair_eastwest_1_block'})                    
+                            world.set_version_block(x, y, z + 1, dimension, (platform, version_number), stair_eastwest_2_block, None)
+                            world.set_version_block(x, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x, y + 2, z + 1, dimension, (platform, version_number), air_block, None)                            
+                            placed_ballast_outer.append({'x': x, 'y': y, 'z': z + 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'cardinal', 'value': 'stair_eastwest_2_block'})
+                        elif (prev_b2b == True or prev_b2b == False) and prev_dir == 'south_east':
+                            # print('East-West Ballast Placement, facing East from South-Southeast b2b')
+                            world.set_version_block(x, y, z - 1, dimension, (platform, version_number), stair_eastwest_1_block, None)
+                            world.set_version_block(x, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x, y + 2, z - 1, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_inner.append({'x': x, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'transition', 'value': 'stair_eastwest_2_block'}) 
+                            placed_ballast_outer.append({'x': 'NA', 'y': 'NA', 'z': 'NA', 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'skip', 'value': 'skip'})
+                        elif (prev_b2b == True or prev_b2b == False) and prev_dir == 'north_east':
+                            # print('East-West Ballast Placement, facing East from North-Northeast b2b')                            
+                            world.set_version_block(x, y, z + 1, dimension, (platform, version_number), stair_eastwest_2_block, None)
+                            world.set_version_block(x, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x, y + 2, z + 1, dimension, (platform, version_number), air_block, None)                              
+                            placed_ballast_outer.append({'x': x, 'y': y, 'z': z + 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'transition', 'value': 'stair_eastwest_1_block'})
+                            placed_ballast_inner.append({'x': 'NA', 'y': 'NA', 'z': 'NA', 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'skip', 'value': 'skip'})
+                ## East-West Facing West
+                elif (direction in ['east_west', 'east_ascending','east_descending']) and (facing == 'west'):
+                    if len(placed_blocks) == 0:                    
+                        # print('East-West Ballast Placement, facing West')
+                        world.set_version_block(x, y, z - 1, dimension, (platform, version_number), stair_eastwest_1_block, None)
+                        world.set_version_block(x, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x, y + 2, z - 1, dimension, (platform, version_number), air_block, None)                        
+                        placed_ballast_outer.append({'x': x, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'cardinal', 'value': 'stair_eastwest_2_block'})                    
+                        world.set_version_block(x, y, z + 1, dimension, (platform, version_number), stair_eastwest_2_block, None)
+                        world.set_version_block(x, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x, y + 2, z + 1, dimension, (platform, version_number), air_block, None)                          
+                        placed_ballast_inner.append({'x': x, 'y': y, 'z': z + 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'cardinal', 'value': 'stair_eastwest_1_block'})                                            
+                    if len(placed_blocks) > 0:
+                        prev_b2b = placed_blocks[placed_ballast_iter - 1]['b2b']
+                        prev_dir = placed_blocks[placed_ballast_iter - 1]['direction']                        
+                        # print('Previous Block b2b:', prev_b2b, 'Previous Block Direction:', prev_dir)
+                        if prev_b2b == False: 
+                            # print('East-West Ballast Placement, facing West')                      
+                            world.set_version_block(x, y, z - 1, dimension, (platform, version_number), stair_eastwest_1_block, None)
+                            world.set_version_block(x, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x, y + 2, z - 1, dimension, (platform, version_number), air_block, None)                                
+                            placed_ballast_outer.append({'x': x, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'cardinal', 'value': 'stair_eastwest_2_block'})                    
+                            world.set_version_block(x, y, z + 1, dimension, (platform, version_number), stair_eastwest_2_block, None)
+                            world.set_version_block(x, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x, y + 2, z + 1, dimension, (platform, version_number), air_block, None)                                 
+                            placed_ballast_inner.append({'x': x, 'y': y, 'z': z + 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'cardinal', 'value': 'stair_eastwest_1_block'})
+                        elif prev_b2b == True and prev_dir == 'north_west':
+                            # print('East-West Ballast Placement, facing West from South-Southwest b2b')                              
+                            world.set_version_block(x, y, z + 1, dimension, (platform, version_number), stair_eastwest_1_block, None)
+                            world.set_version_block(x, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x, y + 2, z + 1, dimension, (platform, version_number), air_block, None)                                 
+                            placed_ballast_inner.append({'x': x, 'y': y, 'z': z + 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'transition', 'value': 'stair_eastwest_1_block'})
+                            placed_ballast_outer.append({'x': 'NA', 'y': 'NA', 'z': 'NA', 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'skip', 'value': 'skip'})
+                        elif prev_b2b == True and prev_dir == 'south_west':
+                            # print('East-West Ballast Placement, facing West from North-Northwest b2b')                              
+                            world.set_version_block(x, y, z - 1, dimension, (platform, version_number), stair_eastwest_1_block, None)
+                            world.set_version_block(x, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x, y + 2, z - 1, dimension, (platform, version_number), air_block, None)                              
+                            placed_ballast_outer.append({'x': x, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'transition', 'value': 'stair_eastwest_2_block'})
+                            placed_ballast_inner.append({'x': 'NA', 'y': 'NA', 'z': 'NA', 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'skip', 'value': 'skip'})
+                placed_ballast_iter += 1
+
+            else:
+                if trace:
+                    logger.log(TRACE, 'This is a complex path!')
+        ###
+        ### Sooo... fun fact, Bedrock does not handle the programmatic setting of Diagonal Stairs.
+        ### So, the logic is here, but it will not work in Bedrock.
+        ###
+                if origin_direction == 'north-northeast':
+                    # print('North-Northeast Ballast Placement, facing East and Turning North')
+                ## ALways Block 0; also Block 3 if Block 1 "next back-to-back" = True, however, will be reported as Happy Path, so logic embedded in the Happy Path Test above
+                    if direction == 'east_west':                        
+                        world.set_version_block(x, y, z + 1, dimension, (platform, version_number), stair_eastwest_2_block, None)
+                        world.set_version_block(x, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x, y + 2, z + 1, dimension, (platform, version_number), air_block, None)                         
+                        placed_ballast_outer.append({'x': x, 'y': y, 'z': z + 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'cardinal', 'value': 'stair_eastwest_2_block'})
+                        placed_ballast_inner.append({'x': 'NA', 'y': 'NA', 'z': 'NA', 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'skip', 'value': 'skip'})
+                     
+                ## Always Block 1
+                    elif direction == 'north_west':
+                        next_b2b = placed_blocks[placed_ballast_iter + 1]['b2b']
+                    ## If the next block in the sequence is not a back-to-back diagonal, set four blocks
+                        if next_b2b == False:   
+                            world.set_version_block(x - 1, y, z - 1, dimension, (platform, version_number), stair_corner_7_block, None)
+                            world.set_version_block(x - 1, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x - 1, y + 2, z - 1, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_inner.append({'x': x - 1, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'corner', 'value': 'stair_corner_7_block'})                         
+                            world.set_version_block(x + 1, y, z + 1, dimension, (platform, version_number), stair_corner_3_block, None)
+                            world.set_version_block(x + 1, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x + 1, y + 2, z + 1, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_outer.append({'x': x + 1, 'y': y, 'z': z + 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'corner', 'value': 'stair_corner_3_block'}) 
+                            world.set_version_block(x + 1, y, z, dimension, (platform, version_number), stair_northsouth_2_block, None)
+                            world.set_version_block(x + 1, y + 1, z, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x + 1, y + 2, z, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_outer.append({'x': x + 1, 'y': y, 'z': z, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'corner', 'value': 'stair_northsouth_2_block'}) 
+                            world.set_version_block(x, y, z + 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x, y + 2, z + 1, dimension, (platform, version_number), air_block, None)  
+                            placed_ballast_outer.append({'x': x, 'y': y, 'z': z + 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'corner', 'value': 'stair_eastwest_2_block'})
+                    ## If the next block in the sequence is a back-to-back diagonal, set three blocks to accomodate the addional corner
+                        else:  
+                            world.set_version_block(x - 1, y, z - 1, dimension, (platform, version_number), stair_corner_7_block, None)
+                            world.set_version_block(x - 1, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x - 1, y + 2, z - 1, dimension, (platform, version_number), air_block, None)                            
+                            placed_ballast_inner.append({'x': x - 1, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'diagonal', 'value': 'stair_corner_7_block'})                         
+                            world.set_version_block(x + 1, y, z + 1, dimension, (platform, version_number), stair_corner_3_block, None)
+                            world.set_version_block(x + 1, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x + 1, y + 2, z + 1, dimension, (platform, version_number), air_block, None)                            
+                            placed_ballast_outer.append({'x': x + 1, 'y': y, 'z': z + 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'diagonal', 'value': 'stair_corner_3_block'}) 
+                            world.set_version_block(x, y, z + 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x, y + 2, z + 1, dimension, (platform, version_number), air_block, None)                               
+                            placed_ballast_outer.append({'x': x, 'y': y, 'z': z + 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'diagonal', 'value': 'stair_eastwest_2_block'})
+                ## Only Block 2 if "next back-to-back" = False
+                    elif direction == 'north_south':
+                        #world.set_version_block(x - 1, y, z, dimension, (platform, version_number), stair_northsouth_1_block, None)
+                        world.set_version_block(x + 1, y, z, dimension, (platform, version_number), stair_northsouth_2_block, None)
+                        world.set_version_block(x + 1, y + 1, z, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x + 1, y + 2, z, dimension, (platform, version_number), air_block, None)                        
+                        placed_ballast_outer.append({'x': x + 1, 'y': y, 'z': z, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'transition', 'value': 'stair_northsouth_2_block'})
+                        placed_ballast_inner.append({'x': 'NA', 'y': 'NA', 'z': 'NA', 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'skip', 'value': 'skip'})                        
+            
+                elif origin_direction == 'west-southwest':
+                ## ALways Block 0; also Block 3 if Block 1 "next back-to-back" = True, however, will be reported as Happy Path, so logic embedded in the Happy Path Test above                    
+                    # print('West-Southwest Ballast Placement, facing South and turning West')                    
+                    if direction == 'north_south':
+                        world.set_version_block(x + 1, y, z, dimension, (platform, version_number), stair_northsouth_1_block, None)
+                        world.set_version_block(x + 1, y + 1, z, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x + 1, y + 2, z, dimension, (platform, version_number), air_block, None)                          
+                        placed_ballast_inner.append({'x': x + 1, 'y': y, 'z': z, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'cardinal', 'value': 'stair_northsouth_2_block'})
+                        placed_ballast_outer.append({'x': 'NA', 'y': 'NA', 'z': 'NA', 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'skip', 'value': 'skip'})
+                ## Always Block 1                                                 
+                    elif direction == 'north_west':
+                        next_b2b = placed_blocks[placed_ballast_iter + 1]['b2b']
+                        if next_b2b == False:
+                    ## If the next block in the sequence is not a back-to-back diagonal, set four blocks  
+                            world.set_version_block(x - 1, y, z - 1, dimension, (platform, version_number), stair_corner_7_block, None)
+                            world.set_version_block(x - 1, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x - 1, y + 2, z - 1, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_outer.append({'x': x - 1, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'corner', 'value': 'stair_corner_7_block'})                         
+                            world.set_version_block(x + 1, y, z + 1, dimension, (platform, version_number), stair_corner_3_block, None)
+                            world.set_version_block(x + 1, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x + 1, y + 2, z + 1, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_inner.append({'x': x + 1, 'y': y, 'z': z + 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'corner', 'value': 'stair_corner_3_block'}) 
+                            world.set_version_block(x + 1, y, z, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x + 1, y + 1, z, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x + 1, y + 2, z, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_inner.append({'x': x + 1, 'y': y, 'z': z, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'corner', 'value': 'stair_northsouth_2_block'}) 
+                            world.set_version_block(x, y, z + 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x, y + 2, z + 1, dimension, (platform, version_number), air_block, None)  
+                            placed_ballast_inner.append({'x': x, 'y': y, 'z': z + 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'corner', 'value': 'stair_eastwest_2_block'})
+                    ## If the next block in the sequence is a back-to-back diagonal, set three blocks to accomodate the addional corner
+                        else:
+                            world.set_version_block(x - 1, y, z - 1, dimension, (platform, version_number), stair_corner_7_block, None)
+                            world.set_version_block(x - 1, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x - 1, y + 2, z - 1, dimension, (platform, version_number), air_block, None)                            
+                            placed_ballast_outer.append({'x': x - 1, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'diagonal', 'value': 'stair_corner_7_block'})                         
+                            world.set_version_block(x + 1, y, z + 1, dimension, (platform, version_number), stair_corner_3_block, None)
+                            world.set_version_block(x + 1, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x + 1, y + 2, z + 1, dimension, (platform, version_number), air_block, None)                            
+                            placed_ballast_inner.append({'x': x + 1, 'y': y, 'z': z + 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'diagonal', 'value': 'stair_corner_3_block'}) 
+                            world.set_version_block(x + 1, y, z, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x + 1, y + 1, z, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x + 1, y + 2, z, dimension, (platform, version_number), air_block, None)                            
+                            placed_ballast_inner.append({'x': x + 1, 'y': y, 'z': z, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'diagonal', 'value': 'stair_northsouth_2_block'}) 
+                ## Only Block 2 if "next back-to-back" = False                                                                                                                
+                    elif direction == 'east_west':
+                        #world.set_version_block(x, y, z - 1, dimension, (platform, version_number), stair_eastwest_1_block, None)
+                        world.set_version_block(x, y, z + 1, dimension, (platform, version_number), stair_eastwest_2_block, None)
+                        world.set_version_block(x, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x, y + 2, z + 1, dimension, (platform, version_number), air_block, None)                          
+                        placed_ballast_inner.append({'x': x, 'y': y, 'z': z + 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'transition', 'value': 'stair_eastwest_2_block'})
+                        placed_ballast_outer.append({'x': 'NA', 'y': 'NA', 'z': 'NA', 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'skip', 'value': 'skip'})
+
+            ## (direction == 'south_east' and origin_direction == 'north_west')
+            ## True for both N-NE b2b and W-SW b2b    
+                elif (direction == 'south_east' and origin_direction == 'north_west'):
+                    prev_origin = placed_blocks[placed_ballast_iter - 1]['origin_direction']
+                ## Only Block 2 if "next back-to-back" = True and previous origin is "north-northeast"
+                    if direction == 'south_east' and prev_origin == 'north-northeast':
+                        world.set_version_block(x + 1, y, z + 1, dimension, (platform, version_number), stair_corner_3_block, None)
+                        world.set_version_block(x + 1, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x + 1, y + 2, z + 1, dimension, (platform, version_number), air_block, None)
+                        placed_ballast_outer.append({'x': x + 1, 'y': y, 'z': z + 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'diagonal', 'value': 'stair_corner_3_block'})
+                        world.set_version_block(x - 1, y, z - 1, dimension, (platform, version_number), stair_corner_6_block, None)
+                        world.set_version_block(x - 1, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x - 1, y + 2, z - 1, dimension, (platform, version_number), air_block, None)
+                        placed_ballast_inner.append({'x': x - 1, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'diagonal', 'value': 'stair_corner_6_block'})                                                      
+                        world.set_version_block(x, y, z - 1, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x, y + 2, z - 1, dimension, (platform, version_number), air_block, None)
+                        placed_ballast_inner.append({'x': x, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'diagonal', 'value': 'stair_eastwest_2_block'}) 
+                ## Only Block 2 if "next back-to-back" = True and previous origin is "west-southwest"                           
+                    elif direction == 'south_east' and prev_origin == 'west-southwest':
+                        world.set_version_block(x - 1, y, z, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x - 1, y + 1, z, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x - 1, y + 2, z, dimension, (platform, version_number), air_block, None)
+                        placed_ballast_outer.append({'x': x - 1, 'y': y, 'z': z, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'diagonal', 'value': 'stair_northsouth_1_block'})
+                        world.set_version_block(x - 1, y, z - 1, dimension, (platform, version_number), stair_corner_3_block, None)
+                        world.set_version_block(x - 1, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x - 1, y + 2, z - 1, dimension, (platform, version_number), air_block, None)                        
+                        placed_ballast_outer.append({'x': x - 1, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'diagonal', 'value': 'stair_corner_3_block'})
+                        world.set_version_block(x + 1, y, z + 1, dimension, (platform, version_number), stair_corner_3_block, None)
+                        world.set_version_block(x + 1, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x + 1, y + 2, z + 1, dimension, (platform, version_number), air_block, None)                        
+                        placed_ballast_inner.append({'x': x + 1, 'y': y, 'z': z + 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'diagonal', 'value': 'stair_corner_3_block'})  
+
+                elif origin_direction == 'east-northeast':
+                    # print('East-Northeast Ballast Placement, facing North and turning East')
+                ## ALways Block 0; also Block 3 if Block 1 "next back-to-back" = True, however, will be reported as Happy Path, so logic embedded in the Happy Path Test above
+                    if direction == 'north_south':
+                        world.set_version_block(x - 1, y, z, dimension, (platform, version_number), stair_northsouth_1_block, None)
+                        world.set_version_block(x - 1, y + 1, z, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x - 1, y + 2, z, dimension, (platform, version_number), air_block, None)
+                        placed_ballast_inner.append({'x': x - 1, 'y': y, 'z': z, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'cardinal', 'value': 'stair_northsouth_1_block'})
+                        placed_ballast_outer.append({'x': 'NA', 'y': 'NA', 'z': 'NA', 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'skip', 'value': 'skip'}) 
+                ## Always Block 1                                                
+                    elif direction == 'south_east':
+                        next_b2b = placed_blocks[placed_ballast_iter + 1]['b2b']
+                    ## If the next block in the sequence is not a back-to-back diagonal, set four blocks                        
+                        if next_b2b == False:
+                            world.set_version_block(x - 1, y, z - 1, dimension, (platform, version_number), stair_corner_7_block, None)
+                            world.set_version_block(x - 1, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x - 1, y + 2, z - 1, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_inner.append({'x': x - 1, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'corner', 'value': 'stair_corner_7_block'})                          
+                        ## This block is redundant to the cardinal direction when b2b = False
+                            # world.set_version_block(x + 1, y, z + 1, dimension, (platform, version_number), stair_northsouth_2_block, None)
+                            # world.set_version_block(x + 1, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                            # world.set_version_block(x + 1, y + 2, z + 1, dimension, (platform, version_number), air_block, None)
+                            # placed_ballast_outer.append({'x': x + 1, 'y': y, 'z': z + 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'corner', 'value': 'stair_corner_1_block'})                          
+                            placed_ballast_outer.append({'x': 'NA', 'y': 'NA', 'z': 'NA', 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'skip', 'value': 'skip'})
+                            world.set_version_block(x - 1, y, z, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x - 1, y + 1, z, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x - 1, y + 2, z, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_inner.append({'x': x - 1, 'y': y, 'z': z, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'corner', 'value': 'stair_northsouth_1_block'})                          
+                            world.set_version_block(x, y, z - 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x, y + 2, z - 1, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_inner.append({'x': x, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'corner', 'value': 'stair_eastwest_1_block'})
+                    ## If the next block in the sequence is a back-to-back diagonal, set three blocks to accomodate the addional corner
+                        else:
+                            world.set_version_block(x - 1, y, z - 1, dimension, (platform, version_number), stair_corner_7_block, None)
+                            world.set_version_block(x - 1, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x - 1, y + 2, z - 1, dimension, (platform, version_number), air_block, None)                            
+                            placed_ballast_inner.append({'x': x - 1, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'diagonal', 'value': 'stair_corner_7_block'})                          
+                        ## This block is NOT redundant in a B2B scenario
+                            world.set_version_block(x + 1, y, z + 1, dimension, (platform, version_number), stair_corner_1_block, None)
+                            world.set_version_block(x + 1, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x + 1, y + 2, z + 1, dimension, (platform, version_number), air_block, None)                            
+                            placed_ballast_outer.append({'x': x + 1, 'y': y, 'z': z + 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'diagonal', 'value': 'stair_corner_1_block'})                          
+                            placed_ballast_outer.append({'x': 'NA', 'y': 'NA', 'z': 'NA', 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'skip', 'value': 'skip'})
+                            world.set_version_block(x - 1, y, z, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x - 1, y + 1, z, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x - 1, y + 2, z, dimension, (platform, version_number), air_block, None)                            
+                            placed_ballast_inner.append({'x': x - 1, 'y': y, 'z': z, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'diagonal', 'value': 'stair_northsouth_1_block'})                          
+                ## Only Block 2 if "next back-to-back" = False 
+                    elif direction == 'east_west':
+            #Debugging 90 deg turns...
+                        #print('YOU GOT ME!  THIS IS EAST-WEST IN A EAST-NORTHEAST LOOP!!!')
+                        world.set_version_block(x, y, z - 1, dimension, (platform, version_number), stair_eastwest_1_block, None)
+                        world.set_version_block(x, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x, y + 2, z - 1, dimension, (platform, version_number), air_block, None)
+                        placed_ballast_inner.append({'x': x, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'transition', 'value': 'stair_eastwest_1_block'})
+                        placed_ballast_outer.append({'x': 'NA', 'y': 'NA', 'z': 'NA', 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'skip', 'value': 'skip'})                         
+                        #world.set_version_block(x, y, z + 1, dimension, (platform, version_number), stair_eastwest_2_block, None)
+
+                elif origin_direction == 'south-southwest':
+                    # print('Souht-Southwest Ballast Placement, facing West and turning South')
+                ## ALways Block 0; also Block 3 if Block 1 "next back-to-back" = True, however, will be reported as Happy Path, so logic embedded in the Happy Path Test above                    
+                    if direction == 'east_west':
+                        world.set_version_block(x, y, z - 1, dimension, (platform, version_number), stair_eastwest_2_block, None)
+                        world.set_version_block(x, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x, y + 2, z - 1, dimension, (platform, version_number), air_block, None)
+                        placed_ballast_outer.append({'x': x, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'cardinal', 'value': 'stair_eastwest_1_block'})
+                        placed_ballast_inner.append({'x': 'NA', 'y': 'NA', 'z': 'NA', 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'skip', 'value': 'skip'})                                          
+                ## Always Block 1                        
+                    elif direction == 'south_east':
+                        next_b2b = placed_blocks[placed_ballast_iter + 1]['b2b']
+                        if next_b2b == False:
+                    ## If the next block in the sequence is not a back-to-back diagonal, set four blocks
+                            world.set_version_block(x - 1, y, z - 1, dimension, (platform, version_number), stair_corner_7_block, None)
+                            world.set_version_block(x - 1, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x - 1, y + 2, z - 1, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_outer.append({'x': x - 1, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'corner', 'value': 'stair_corner_7_block'})                          
+                            world.set_version_block(x + 1, y, z + 1, dimension, (platform, version_number), stair_corner_1_block, None)
+                            world.set_version_block(x + 1, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x + 1, y + 2, z + 1, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_inner.append({'x': x + 1, 'y': y, 'z': z + 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'corner', 'value': 'stair_corner_1_block'})                          
+                            world.set_version_block(x - 1, y, z, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x - 1, y + 1, z, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x - 1, y + 2, z, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_outer.append({'x': x - 1, 'y': y, 'z': z, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'corner', 'value': 'stair_northsouth_1_block'})                          
+                            world.set_version_block(x, y, z - 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x, y + 2, z - 1, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_outer.append({'x': x, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'corner', 'value': 'stair_eastwest_1_block'})
+                    ## If the next block in the sequence is a back-to-back diagonal, set three blocks to accomodate the addional corner
+                        else:
+                            world.set_version_block(x - 1, y, z - 1, dimension, (platform, version_number), stair_corner_7_block, None)
+                            world.set_version_block(x - 1, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x - 1, y + 2, z - 1, dimension, (platform, version_number), air_block, None)                            
+                            placed_ballast_outer.append({'x': x - 1, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'diagonal', 'value': 'stair_corner_7_block'})                          
+                            world.set_version_block(x + 1, y, z + 1, dimension, (platform, version_number), stair_corner_1_block, None)
+                            world.set_version_block(x + 1, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x + 1, y + 2, z + 1, dimension, (platform, version_number), air_block, None)                            
+                            placed_ballast_inner.append({'x': x + 1, 'y': y, 'z': z + 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'diagonal', 'value': 'stair_corner_1_block'})                          
+                            world.set_version_block(x, y, z - 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x, y + 2, z - 1, dimension, (platform, version_number), air_block, None)                            
+                            placed_ballast_outer.append({'x': x, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'diagonal', 'value': 'stair_eastwest_1_block'})                                                      
+                ## Only Block 2 if "next back-to-back" = False 
+                    if direction == 'north_south':
+                        world.set_version_block(x - 1, y, z, dimension, (platform, version_number), stair_northsouth_1_block, None)
+                        world.set_version_block(x - 1, y + 1, z, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x - 1, y + 2, z, dimension, (platform, version_number), air_block, None)
+                        placed_ballast_outer.append({'x': x - 1, 'y': y, 'z': z, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'transition', 'value': 'stair_northsouth_1_block'})
+                        placed_ballast_inner.append({'x': 'NA', 'y': 'NA', 'z': 'NA', 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'skip', 'value': 'skip'})
+
+            ## (direction = 'north_west' and origin_direction == 'south_east')
+            ## True for both E-NE b2b and S-SW b2b
+                elif (direction == 'north_west' and origin_direction == 'south_east'):
+                    prev_origin = placed_blocks[placed_ballast_iter - 1]['origin_direction']
+                ## Only Block 2 if "next back-to-back" = True and previous origin is "east-northeast"                    
+                    if direction == 'north_west' and prev_origin == 'east-northeast':
+                        world.set_version_block(x - 1, y, z - 1, dimension, (platform, version_number), stair_corner_7_block, None)
+                        world.set_version_block(x - 1, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x - 1, y + 2, z - 1, dimension, (platform, version_number), air_block, None)  
+                        placed_ballast_inner.append({'x': x - 1, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'diagonal', 'value': 'stair_corner_7_block'})
+                        world.set_version_block(x + 1, y, z + 1, dimension, (platform, version_number), stair_corner_1_block, None)
+                        world.set_version_block(x + 1, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x + 1, y + 2, z + 1, dimension, (platform, version_number), air_block, None)                           
+                        placed_ballast_outer.append({'x': x + 1, 'y': y, 'z': z + 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'diagonal', 'value': 'stair_corner_1_block'})  
+                        world.set_version_block(x + 1, y, z, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x + 1, y + 1, z, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x + 1, y + 2, z, dimension, (platform, version_number), air_block, None)
+                        placed_ballast_outer.append({'x': x + 1, 'y': y, 'z': z, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'diagonal', 'value': 'stair_northsouth_2_block'})
+                ## Only Block 2 if "next back-to-back" = True and previous origin is "south-southwest"   
+                    elif direction == 'north_west' and prev_origin == 'south-southwest':
+                        world.set_version_block(x, y, z + 1, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x, y + 2, z + 1, dimension, (platform, version_number), air_block, None)
+                        placed_ballast_inner.append({'x': x, 'y': y, 'z': z + 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'diagonal', 'value': 'stair_eastwest_1_block'})
+                        world.set_version_block(x - 1, y, z - 1, dimension, (platform, version_number), stair_corner_7_block, None)
+                        world.set_version_block(x - 1, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x - 1, y + 2, z - 1, dimension, (platform, version_number), air_block, None)                          
+                        placed_ballast_outer.append({'x': x - 1, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'diagonal', 'value': 'stair_corner_7_block'})
+                        world.set_version_block(x + 1, y, z + 1, dimension, (platform, version_number), stair_corner_1_block, None)
+                        world.set_version_block(x + 1, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x + 1, y + 2, z + 1, dimension, (platform, version_number), air_block, None)                           
+                        placed_ballast_inner.append({'x': x + 1, 'y': y, 'z': z + 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'diagonal', 'value': 'stair_corner_1_block'})
+
+                elif origin_direction == 'south-southeast':
+                    # print('South-Southeast Ballast Placement, facing East turning South')                            
+                ## ALways Block 0; also Block 3 if Block 1 "next back-to-back" = True, however, will be reported as Happy Path, so logic embedded in the Happy Path Test above    
+                    if direction == 'east_west':
+                        world.set_version_block(x, y, z - 1, dimension, (platform, version_number), stair_northsouth_1_block, None)
+                        world.set_version_block(x, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x, y + 2, z - 1, dimension, (platform, version_number), air_block, None)
+                        placed_ballast_inner.append({'x': x, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'cardinal', 'value': 'stair_eastwest_1_block'})
+                        placed_ballast_outer.append({'x': 'NA', 'y': 'NA', 'z': 'NA', 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'skip', 'value': 'skip'}) 
+                ## Always Block 1                 
+                    elif direction == 'south_west':    
+                        next_b2b = placed_blocks[placed_ballast_iter + 1]['b2b']
+                    ## If the next block in the sequence is not a back-to-back diagonal, set four blocks                        
+                        if next_b2b == False:
+                            world.set_version_block(x - 1, y, z + 1, dimension, (platform, version_number), stair_corner_2_block, None)
+                            world.set_version_block(x - 1, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x - 1, y + 2, z + 1, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_outer.append({'x': x - 1, 'y': y, 'z': z + 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'corner', 'value': 'stair_corner_2_block'})                            
+                            world.set_version_block(x + 1, y, z - 1, dimension, (platform, version_number), stair_corner_8_block, None)
+                            world.set_version_block(x + 1, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x + 1, y + 2, z - 1, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_inner.append({'x': x + 1, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'corner', 'value': 'stair_corner_8_block'})
+                            world.set_version_block(x + 1, y, z, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x + 1, y + 1, z, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x + 1, y + 2, z, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_inner.append({'x': x + 1, 'y': y, 'z': z, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'corner', 'value': 'stair_northsouth_2_block'})                            
+                            world.set_version_block(x, y, z - 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x, y + 2, z - 1, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_outer.append({'x': x, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'corner', 'value': 'stair_eastwest_1_block'})                            
+                    ## If the next block in the sequence is a back-to-back diagonal, set three blocks to accomodate the addional corner
+                        else:
+                            world.set_version_block(x - 1, y, z + 1, dimension, (platform, version_number), stair_corner_2_block, None)
+                            world.set_version_block(x - 1, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x - 1, y + 2, z + 1, dimension, (platform, version_number), air_block, None)                            
+                            placed_ballast_outer.append({'x': x - 1, 'y': y, 'z': z + 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'diagonal', 'value': 'stair_corner_2_block'}) 
+                            world.set_version_block(x + 1, y, z - 1, dimension, (platform, version_number), stair_corner_8_block, None)      
+                            world.set_version_block(x + 1, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x + 1, y + 2, z - 1, dimension, (platform, version_number), air_block, None)                                                  
+                            placed_ballast_inner.append({'x': x + 1, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'diagonal', 'value': 'stair_corner_8_block'})
+                            world.set_version_block(x, y, z - 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x, y + 2, z - 1, dimension, (platform, version_number), air_block, None)                            
+                            placed_ballast_inner.append({'x': x, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'diagonal', 'value': 'stair_eastwest_1_block'})
+                ## Only Block 2 if "next back-to-back" = False                          
+                    elif direction == 'north_south':
+                        world.set_version_block(x + 1, y, z, dimension, (platform, version_number), stair_northsouth_2_block, None)
+                        world.set_version_block(x + 1, y + 1, z, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x + 1, y + 2, z, dimension, (platform, version_number), air_block, None)
+                        placed_ballast_inner.append({'x': x + 1, 'y': y, 'z': z, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'transition', 'value': 'stair_northsouth_2_block'})
+                        placed_ballast_outer.append({'x': 'NA', 'y': 'NA', 'z': 'NA', 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'skip', 'value': 'skip'})
+
+                elif origin_direction == 'west-northwest':
+                    # print('West-Northwest Ballast Placement, facing North and turning West')                            
+                ## ALways Block 0; also Block 3 if Block 1 "next back-to-back" = True, however, will be reported as Happy Path, so logic embedded in the Happy Path Test above   
+                    if direction == 'north_south':
+                        world.set_version_block(x + 1, y, z, dimension, (platform, version_number), stair_northsouth_2_block, None)
+                        world.set_version_block(x + 1, y + 1, z, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x + 1, y + 2, z, dimension, (platform, version_number), air_block, None)
+                        placed_ballast_outer.append({'x': x + 1, 'y': y, 'z': z, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'cardinal', 'value': 'stair_northsouth_2_block'})
+                        placed_ballast_inner.append({'x': 'NA', 'y': 'NA', 'z': 'NA', 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'skip', 'value': 'skip'})                
+                ## Always Block 1   
+                    elif direction == 'south_west':    
+                        next_b2b = placed_blocks[placed_ballast_iter + 1]['b2b']
+                    ## If the next block in the sequence is not a back-to-back diagonal, set four blocks                          
+                        if next_b2b == False:
+                            world.set_version_block(x - 1, y, z + 1, dimension, (platform, version_number), stair_corner_2_block, None)
+                            world.set_version_block(x - 1, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x - 1, y + 2, z + 1, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_inner.append({'x': x - 1, 'y': y, 'z': z + 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'corner', 'value': 'stair_corner_2_block'})                            
+                            world.set_version_block(x + 1, y, z - 1, dimension, (platform, version_number), stair_corner_8_block, None)
+                            world.set_version_block(x + 1, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x + 1, y + 2, z - 1, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_outer.append({'x': x + 1, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'corner', 'value': 'stair_corner_8_block'})
+                            world.set_version_block(x + 1, y, z, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x + 1, y + 1, z, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x + 1, y + 2, z, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_outer.append({'x': x + 1, 'y': y, 'z': z, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'corner', 'value': 'stair_northsouth_2_block'})                            
+                            world.set_version_block(x, y, z - 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x, y + 2, z - 1, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_outer.append({'x': x, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'corner', 'value': 'stair_eastwest_1_block'})                            
+                    ## If the next block in the sequence is a back-to-back diagonal, set three blocks to accomodate the addional corner
+                        else:
+                            world.set_version_block(x - 1, y, z + 1, dimension, (platform, version_number), stair_corner_2_block, None)
+                            world.set_version_block(x - 1, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x - 1, y + 2, z + 1, dimension, (platform, version_number), air_block, None)                            
+                            placed_ballast_inner.append({'x': x - 1, 'y': y, 'z': z + 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'diagonal', 'value': 'stair_corner_2_block'})                            
+                            world.set_version_block(x + 1, y, z - 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x + 1, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x + 1, y + 2, z - 1, dimension, (platform, version_number), air_block, None)                            
+                            placed_ballast_outer.append({'x': x + 1, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'diagonal', 'value': 'stair_corner_8_block'})
+                            world.set_version_block(x + 1, y, z, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x + 1, y + 1, z, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x + 1, y + 2, z, dimension, (platform, version_number), air_block, None)                            
+                            placed_ballast_outer.append({'x': x + 1, 'y': y, 'z': z, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'diagonal', 'value': 'stair_northsouth_2_block'})                            
+                ## Only Block 2 if "next back-to-back" = False 
+                    elif direction == 'east_west':
+                        world.set_version_block(x, y, z - 1, dimension, (platform, version_number), stair_eastwest_1_block, None)
+                        world.set_version_block(x, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x, y + 2, z - 1, dimension, (platform, version_number), air_block, None)
+                        placed_ballast_outer.append({'x': x, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'transition', 'value': 'stair_eastwest_1_block'})
+                        placed_ballast_inner.append({'x': 'NA', 'y': 'NA', 'z': 'NA', 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'skip', 'value': 'skip'})
+
+            ## (direction == 'north_east' and origin_direction == 'south_west')
+            ## True for both S-SE b2b and W-NW b2b
+                elif (direction == 'north_east' and origin_direction == 'south_west'):
+                    prev_origin = placed_blocks[placed_ballast_iter - 1]['origin_direction']
+                ## Only Block 2 if "next back-to-back" = True and previous origin is "south-southeast"                                           
+                    if direction == 'north_east' and prev_origin == 'south-southeast':
+                        world.set_version_block(x - 1, y, z + 1, dimension, (platform, version_number), stair_corner_6_block, None)
+                        world.set_version_block(x - 1, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x - 1, y + 2, z + 1, dimension, (platform, version_number), air_block, None)
+                        placed_ballast_outer.append({'x': x - 1, 'y': y, 'z': z + 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'diagonal', 'value': 'stair_corner_6_block'})                         
+                        world.set_version_block(x, y, z + 1, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x, y + 2, z + 1, dimension, (platform, version_number), air_block, None)
+                        placed_ballast_outer.append({'x': x, 'y': y, 'z': z + 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'diagonal', 'value': 'stair_eastwest_2_block'})
+                        world.set_version_block(x + 1, y, z - 1, dimension, (platform, version_number), stair_corner_3_block, None)
+                        world.set_version_block(x + 1, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x + 1, y + 2, z - 1, dimension, (platform, version_number), air_block, None)
+                        placed_ballast_inner.append({'x': x + 1, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'diagonal', 'value': 'stair_corner_3_block'})                          
+                ## Only Block 2 if "next back-to-back" = True and previous origin is "west-northwest"                           
+                    elif direction == 'north_east' and prev_origin == 'west-northwest':
+                        world.set_version_block(x - 1, y, z, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x - 1, y + 1, z, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x - 1, y + 2, z, dimension, (platform, version_number), air_block, None)
+                        placed_ballast_inner.append({'x': x - 1, 'y': y, 'z': z, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'diagonal', 'value': 'stair_northsouth_1_block'})                         
+                        world.set_version_block(x - 1, y, z + 1, dimension, (platform, version_number), stair_corner_3_block, None)
+                        world.set_version_block(x - 1, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x - 1, y + 2, z + 1, dimension, (platform, version_number), air_block, None)                        
+                        placed_ballast_inner.append({'x': x - 1, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'diagonal', 'value': 'stair_corner_3_block'})
+                        world.set_version_block(x + 1, y, z - 1, dimension, (platform, version_number), stair_corner_3_block, None)
+                        world.set_version_block(x + 1, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x + 1, y + 2, z - 1, dimension, (platform, version_number), air_block, None)
+                        placed_ballast_outer.append({'x': x + 1, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'diagonal', 'value': 'stair_corner_3_block'})                          
+
+                elif origin_direction == 'east-southeast':
+                    # print('East-Southeast Ballast Placement, facing North and turning East')                        
+                ## ALways Block 0; also Block 3 if Block 1 "next back-to-back" = True, however, will be reported as Happy Path, so logic embedded in the Happy Path Test above                   
+                    if direction == 'north_south':
+                        world.set_version_block(x - 1, y, z, dimension, (platform, version_number), stair_northsouth_2_block, None)
+                        world.set_version_block(x - 1, y + 1, z, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x - 1, y + 2, z, dimension, (platform, version_number), air_block, None)
+                        placed_ballast_outer.append({'x': x - 1, 'y': y, 'z': z, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'cardinal', 'value': 'stair_northsouth_1_block'})
+                        placed_ballast_inner.append({'x': 'NA', 'y': 'NA', 'z': 'NA', 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'skip', 'value': 'skip'})                         
+                ## Always Block 1                     
+                    elif direction == 'north_east':    
+                        next_b2b = placed_blocks[placed_ballast_iter + 1]['b2b']
+                    ## If the next block in the sequence is not a back-to-back diagonal, set four blocks   
+                        if next_b2b == False:
+                            world.set_version_block(x + 1, y, z - 1, dimension, (platform, version_number), stair_corner_6_block, None)
+                            world.set_version_block(x + 1, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x + 1, y + 2, z - 1, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_inner.append({'x': x + 1, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'corner', 'value': 'stair_corner_6_block'})                          
+                            world.set_version_block(x - 1, y, z + 1, dimension, (platform, version_number), stair_corner_4_block, None)
+                            world.set_version_block(x - 1, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x - 1, y + 2, z + 1, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_outer.append({'x': x - 1, 'y': y, 'z': z + 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'corner', 'value': 'stair_corner_4_block'})  
+                            world.set_version_block(x - 1, y, z, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x - 1, y + 1, z, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x - 1, y + 2, z, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_outer.append({'x': x - 1, 'y': y, 'z': z, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'corner', 'value': 'stair_northsouth_1_block'})                           
+                            world.set_version_block(x, y, z + 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x, y + 2, z + 1, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_outer.append({'x': x, 'y': y, 'z': z + 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'corner', 'value': 'stair_eastwest_2_block'})
+                    ## If the next block in the sequence is a back-to-back diagonal, set three blocks to accomodate the addional corner
+                        else:
+                            world.set_version_block(x + 1, y, z - 1, dimension, (platform, version_number), stair_corner_6_block, None)
+                            world.set_version_block(x + 1, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x + 1, y + 2, z - 1, dimension, (platform, version_number), air_block, None)                            
+                            placed_ballast_inner.append({'x': x + 1, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'diagonal', 'value': 'stair_corner_6_block'})                          
+                            world.set_version_block(x - 1, y, z + 1, dimension, (platform, version_number), stair_corner_4_block, None)
+                            world.set_version_block(x - 1, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x - 1, y + 2, z + 1, dimension, (platform, version_number), air_block, None)                            
+                            placed_ballast_outer.append({'x': x - 1, 'y': y, 'z': z + 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'diagonal', 'value': 'stair_corner_4_block'})  
+                            world.set_version_block(x - 1, y, z, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x - 1, y + 1, z, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x - 1, y + 2, z, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_outer.append({'x': x - 1, 'y': y, 'z': z, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'diagonal', 'value': 'stair_northsouth_1_block'})
+                ## Only Block 2 if "next back-to-back" = False                                                        
+                    elif direction == 'east_west':
+                        world.set_version_block(x, y, z + 1, dimension, (platform, version_number), stair_eastwest_2_block, None)
+                        world.set_version_block(x, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x, y + 2, z + 1, dimension, (platform, version_number), air_block, None)
+                        placed_ballast_outer.append({'x': x, 'y': y, 'z': z + 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'transition', 'value': 'stair_eastwest_2_block'})
+                        placed_ballast_inner.append({'x': 'NA', 'y': 'NA', 'z': 'NA', 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'skip', 'value': 'skip'})
+
+                elif origin_direction == 'north-northwest':
+                    # print('North-Northwest Ballast Placement, facing West and turning North')                        
+                ## ALways Block 0; also Block 3 if Block 1 "next back-to-back" = True, however, will be reported as Happy Path, so logic embedded in the Happy Path Test above                   
+                    if direction == 'east_west':
+                        world.set_version_block(x, y, z + 1, dimension, (platform, version_number), stair_eastwest_1_block, None)
+                        world.set_version_block(x, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x, y + 2, z + 1, dimension, (platform, version_number), air_block, None)
+                        placed_ballast_inner.append({'x': x, 'y': y, 'z': z + 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'cardinal', 'value': 'stair_eastwest_2_block'})
+                        placed_ballast_outer.append({'x': 'NA', 'y': 'NA', 'z': 'NA', 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'skip', 'value': 'skip'}) 
+                ## Always Block 1                     
+                    elif direction == 'north_east':    
+                        next_b2b = placed_blocks[placed_ballast_iter + 1]['b2b']
+                    ## If the next block in the sequence is not a back-to-back diagonal, set four blocks   
+                        if next_b2b == False:
+                            world.set_version_block(x + 1, y, z - 1, dimension, (platform, version_number), stair_corner_6_block, None)
+                            world.set_version_block(x + 1, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x + 1, y + 2, z - 1, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_outer.append({'x': x + 1, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'corner', 'value': 'stair_corner_6_block'})                          
+                            world.set_version_block(x - 1, y, z + 1, dimension, (platform, version_number), stair_corner_4_block, None)
+                            world.set_version_block(x - 1, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x - 1, y + 2, z + 1, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_inner.append({'x': x - 1, 'y': y, 'z': z + 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'corner', 'value': 'stair_corner_4_block'})  
+                            world.set_version_block(x - 1, y, z, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x - 1, y + 1, z, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x - 1, y + 2, z, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_inner.append({'x': x - 1, 'y': y, 'z': z, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'corner', 'value': 'stair_northsouth_1_block'})                           
+                            world.set_version_block(x, y, z + 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x, y + 2, z + 1, dimension, (platform, version_number), air_block, None)
+                            placed_ballast_inner.append({'x': x, 'y': y, 'z': z + 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'corner', 'value': 'stair_eastwest_2_block'})
+                    ## If the next block in the sequence is a back-to-back diagonal, set three blocks to accomodate the addional corner
+                        else:
+                            world.set_version_block(x + 1, y, z - 1, dimension, (platform, version_number), stair_corner_6_block, None)
+                            world.set_version_block(x + 1, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x + 1, y + 2, z - 1, dimension, (platform, version_number), air_block, None)                            
+                            placed_ballast_outer.append({'x': x + 1, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'diagonal', 'value': 'stair_corner_6_block'})                          
+                            world.set_version_block(x - 1, y, z + 1, dimension, (platform, version_number), stair_corner_4_block, None)
+                            world.set_version_block(x - 1, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x - 1, y + 2, z + 1, dimension, (platform, version_number), air_block, None)                            
+                            placed_ballast_inner.append({'x': x - 1, 'y': y, 'z': z + 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'diagonal', 'value': 'stair_corner_4_block'})  
+                            world.set_version_block(x, y, z + 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                            world.set_version_block(x, y + 2, z + 1, dimension, (platform, version_number), air_block, None)                            
+                            placed_ballast_inner.append({'x': x, 'y': y, 'z': z + 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'diagonal', 'value': 'stair_eastwest_2_block'})
+                ## Only Block 2 if "next back-to-back" = False                                                        
+                    elif direction == 'north_south':
+                        world.set_version_block(x - 1, y, z, dimension, (platform, version_number), stair_northsouth_1_block, None)
+                        world.set_version_block(x - 1, y + 1, z, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x - 1, y + 2, z, dimension, (platform, version_number), air_block, None)
+                        placed_ballast_inner.append({'x': x - 1, 'y': y, 'z': z, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'transition', 'value': 'stair_northsouth_1_block'})
+                        placed_ballast_outer.append({'x': 'NA', 'y': 'NA', 'z': 'NA', 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'skip', 'value': 'skip'})
+
+            ## (direction == 'south_west' and origin_direction == 'north_east')
+            ## True for both E-SE b2b and N-NW b2b
+                elif (direction == 'south_west' and origin_direction == 'north_east'):
+                    prev_origin = placed_blocks[placed_ballast_iter - 1]['origin_direction']
+                ## Only Block 2 if "next back-to-back" = True and previous origin is "east-southeast"                                           
+                    if direction == 'south_west' and prev_origin == 'east-southeast':
+                        world.set_version_block(x + 1, y, z - 1, dimension, (platform, version_number), stair_corner_6_block, None)
+                        world.set_version_block(x + 1, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x + 1, y + 2, z - 1, dimension, (platform, version_number), air_block, None)
+                        placed_ballast_inner.append({'x': x + 1, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'diagonal', 'value': 'stair_corner_6_block'})                         
+                        world.set_version_block(x + 1, y, z, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x + 1, y + 1, z, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x + 1, y + 2, z, dimension, (platform, version_number), air_block, None)                                                
+                        placed_ballast_inner.append({'x': x + 1, 'y': y, 'z': z, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'diagonal', 'value': 'stair_northsouth_2_block'})
+                        world.set_version_block(x - 1, y, z + 1, dimension, (platform, version_number), stair_corner_3_block, None)
+                        world.set_version_block(x - 1, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x - 1, y + 2, z + 1, dimension, (platform, version_number), air_block, None)
+                        placed_ballast_outer.append({'x': x - 1, 'y': y, 'z': z + 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'diagonal', 'value': 'stair_corner_3_block'})                          
+                ## Only Block 2 if "next back-to-back" = True and previous origin is "north-northwest"                           
+                    elif direction == 'south_west' and prev_origin == 'north-northwest':
+                        world.set_version_block(x, y, z - 1, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                        placed_ballast_outer.append({'x': x, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'diagonal', 'value': 'stair_eastwest_2_block'})                         
+                        world.set_version_block(x - 1, y, z + 1, dimension, (platform, version_number), stair_corner_6_block, None)
+                        world.set_version_block(x - 1, y + 1, z + 1, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x - 1, y + 2, z + 1, dimension, (platform, version_number), air_block, None)
+                        placed_ballast_inner.append({'x': x - 1, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'inner', 'state': 'diagonal', 'value': 'stair_corner_6_block'})
+                        world.set_version_block(x + 1, y, z - 1, dimension, (platform, version_number), stair_corner_3_block, None)
+                        world.set_version_block(x + 1, y + 1, z - 1, dimension, (platform, version_number), air_block, None)
+                        world.set_version_block(x + 1, y + 2, z - 1, dimension, (platform, version_number), air_block, None)                        
+                        placed_ballast_outer.append({'x': x + 1, 'y': y, 'z': z - 1, 'count': placed_ballast_iter, 'direction': direction, 'origin_direction': origin_direction, 'facing': facing, 'b2b': b2b, 'position': 'outer', 'state': 'diagonal', 'value': 'stair_corner_3_block'}) 
+
+                placed_ballast_iter += 1
+
+        return placed_ballast_inner, placed_ballast_outer   
+
+###
+### In order to place supports where we want them, we need to test if there is solid ground beneath the placed blocks.
+### The functions below will test the "placed_ballast_inner", "placed_blocks", and "placed_ballast_outer" lists to determine if there is solid ground beneath them.
+### We'll return three lists: "placed_ballast_inner", "placed_ballast_outer", and "placed_ballast_core" with the results of the tests.
+###
+    @staticmethod
+    def find_solid_ground(coordinates, world, dimension, placed_blocks, placed_block_iter, placed_rails, placed_rails_iter, placed_ballast_inner, placed_ballast_outer, overlay=None, known=None):
+        logger.debug('Find Solid Ground Function!')
+
+    ###
+    ###  Every "Inner" ballast, "Core" roadbed and "Outer" ballast column is probed in one go.  The volume
+    ###  under the route is read a chunk at a time and the air and water depths come back as arrays.
+    ###  'skip' ballast blocks are not probed, they just get an 'NA' record.
+    ###  A planning run passes its planned edits as the "overlay", as they are not in the world yet.
+    ###  An incremental rebuild passes the depths it already "known" (see known_depths) for each group,
+    ###  and only the rest are probed.
+    ###
+        groups = (placed_ballast_inner, placed_blocks, placed_ballast_outer)
+        probe_masks = [group.column('state') != group.codes('state', 'skip') for group in groups]
+        if known is None:
+            known = [(np.zeros(len(group), dtype=bool), np.zeros(len(group), dtype=np.int64), np.zeros(len(group), dtype=np.int64)) for group in groups]
+        probe_masks = [probe_mask & ~known_mask for probe_mask, (known_mask, _, _) in zip(probe_masks, known)]
+
+        probed = np.concatenate([np.stack((group.column('x'), group.column('y'), group.column('z')), axis=1)[probe_mask] for group, probe_mask in zip(groups, probe_masks)])
+        air_depth, water_depth = probe_column_depths(world, dimension, probed, overlay)
+
+        results = []
+        start = 0
+        for group, probe_mask, (known_mask, known_air, known_water), fields in zip(groups, probe_masks, known, (GROUND_FIELDS, CORE_GROUND_FIELDS, GROUND_FIELDS)):
+            group_air = np.where(known_mask, known_air, 0)
+            group_water = np.where(known_mask, known_water, 0)
+            stop = start + int(probe_mask.sum())
+            group_air[probe_mask] = air_depth[start:stop]
+            group_water[probe_mask] = water_depth[start:stop]
+            start = stop
+            results.append(solid_ground_records(group, group_air, group_water, fields))
+        placed_block_x_z_inner, placed_block_x_z_core, placed_block_x_z_outer = results
+    ## Uncomment the print statements below to see the results of the tests
+        # print('Inner Test Block Dict', placed_block_x_z_inner)
+        # print('Core Test Block Dict', placed_block_x_z_core)
+        # print('Outer Test Block Dict', placed_block_x_z_outer)
+
+        return placed_block_x_z_inner, placed_block_x_z_core, placed_block_x_z_outer
+
+#
+#
+#   YEEEEEEE HAWWWWWWW
+#
+#   We have successfully tested the blocks beneath the placed ballast, placed blocks, and placed ballast outer blocks
+#
+#   Now we need to test the three against each other at each "count" and figure out which blocks to put under them
+#
+#
+
+
+    @staticmethod
+    def place_supports(cribbing_choice, minus1_choice, coordinates, world, dimension, placed_blocks, placed_block_iter, placed_rails, placed_rails_iter, placed_ballast_inner, placed_ballast_outer, placed_block_x_z_inner, placed_block_x_z_core, placed_block_x_z_outer, support_locations, span_stats=None, window=None):
+        platform, version_number = world.level_wrapper.platform, world.level_wrapper.version
+        logger.debug('Support Function!')
+        # print('Cribbing Choice:', cribbing_choice)
+        # print('Underpinning Choice:', minus1_choice)
+
+        if cribbing_choice == 'Dark Oak':
+            cribbing_block = Block('minecraft', 'dark_oak_log', {"pillar_axis": StringTag("y")})
+        elif cribbing_choice == "Smooth Stone":
+            cribbing_block = Block('minecraft', 'smooth_stone')
+        elif cribbing_choice ==  "Deepslate Tile":
+            cribbing_block = Block('minecraft', 'deepslate_tiles')
+        elif cribbing_choice == "Iron Block":
+            cribbing_block = Block('minecraft', 'iron_block')
+
+        if minus1_choice == 'Dark Oak':
+            underpinning_block = Block('minecraft', 'dark_oak_log', {"pillar_axis": StringTag("y")})
+        elif minus1_choice == "Smooth Stone":
+            underpinning_block = Block('minecraft', 'smooth_stone')
+        elif minus1_choice ==  "Deepslate Tile":
+            underpinning_block = Block('minecraft', 'deepslate_tiles')
+        elif minus1_choice == "Iron Block":
+            underpinning_block = Block('minecraft', 'iron_block')
+
+    ###
+    ###  The span engine classifies every path index ("count") from the Inner, Core and Outer ground tables
+    ###  at once, and finds the spans with a single run-length pass:
+    ###     Air / Water / Dual Bridges and Diagonal Bridges get underpinning under every block,
+    ###     Inner / Outer / Dual Cribbing gets cribbing columns (or underpinning when deeper than 8),
+    ###     Solid ground gets nothing, and Purple Wool counts become pillar locations.
+    ###
+        spans = SpanAnalysis(placed_block_x_z_inner, placed_block_x_z_core, placed_block_x_z_outer)
+    ## An incremental rebuild only places the supports of the spans its "window" of counts touches
+        if window is not None:
+            window = spans.span_window(*window)
+        support_locations.extend(spans.support_locations(window))
+    ## A planning run collects the span counts for its summary
+        if span_stats is not None:
+            span_stats.append(spans.stats())
+    ## Debugging print statement for the span types and spans found
+        # print('Span Types:', [SPAN_TYPES[span_type] for span_type in spans.span_type])
+        # print('Span Starts:', spans.run_starts, 'Span Lengths:', spans.run_lengths)
+
+        logger.debug('Placing Support Blocks!')
+        support_coords, support_index = spans.support_columns(window)
+        world.set_version_blocks(support_coords, dimension, (platform, version_number), [cribbing_block, underpinning_block], support_index)
+
+        return support_locations
+
+    @staticmethod
+    def read_construction(src_file_path):
+    ## Templates are compiled once and cached until the construction file changes on disk
+        return load_template(src_file_path, RailBuilder.compile_construction)
+
+###
+### The "Compile Construction" function turns a construction file into a PillarTemplate: an array of X, Y, Z
+### offsets, one palette index per offset, and the de-duplicated Block objects those indices point to.
+###
+### Only the bottom Y layer of each section is used (the pillar is extruded from it), and the offsets are
+### normalized so the first section's origin is "0, 0, 0".
+###
+
+    @staticmethod
+    def compile_construction(src_file_path):
+        offsets = []
+        block_index = []
+        blocks = []
+        block_lookup = {}
+        with ConstructionReader(src_file_path) as reader:
+            first_section = reader.read(0)
+            offset_x, offset_y, offset_z = 0 - first_section.sx, 0 - first_section.sy, 0 - first_section.sz
+            for i in range(len(reader.sections)):
+            # the "reader.read(i)" call pulls from the "construction.py" file's "ConstructionReader" class:"read" method
+            # the method returns the origina coords, shape, and an array of blocks in the section where the integer
+            # for each block corresponse to the index in the "palette" list
+                section = reader.read(i)
+                if section.blocks is None:
+                    continue
+            ## Each palette entry is parsed once, and identical blocks share one entry in "blocks"
+                palette_lut = []
+                for block_type in section.palette:
+                    parsed_block = RailBuilder.parse_block_type(block_type)
+                    if parsed_block not in block_lookup:
+                        block_lookup[parsed_block] = len(blocks)
+                        blocks.append(parsed_block)
+                    palette_lut.append(block_lookup[parsed_block])
+                layer = np.asarray(section.blocks)[:, 0, :]
+                layer_x, layer_z = np.meshgrid(np.arange(layer.shape[0]), np.arange(layer.shape[1]), indexing='ij')
+                section_offsets = np.stack((layer_x.ravel() + section.sx + offset_x, np.full(layer.size, section.sy + offset_y), layer_z.ravel() + section.sz + offset_z), axis=1)
+                offsets.append(section_offsets)
+                block_index.append(np.asarray(palette_lut, dtype=np.int64)[layer.ravel()])
+        if not offsets:
+            return PillarTemplate(np.zeros((0, 3), dtype=np.int64), np.zeros(0, dtype=np.int64), blocks)
+        return PillarTemplate(np.concatenate(offsets).astype(np.int64), np.concatenate(block_index), blocks)
+
+##
+## When parsing the block types from the imported Censtuction File, the "version" string needs to be parsed
+## These are VERY specific for each block type.
+##
+
+    @staticmethod
+    def parse_block_type(block_type):
+        parsed_block_type = str(block_type)
+        # print('parsed block type:', parsed_block_type)
+        library = parsed_block_type[0: parsed_block_type.find(':')]
+    # Debug print statement    
+        # print('library:', library)        
+        family = parsed_block_type[parsed_block_type.find(':') + 1: parsed_block_type.find('[')]
+    # Debug print statement
+        # print('family:', family)
+        parsed_block = Block(library, family)
+        if '__version__=18100737' in parsed_block_type:
+            if parsed_block_type.find('[') + 21 < len(parsed_block_type) and parsed_block_type[parsed_block_type.find('[') + 21] == ',':
+                block_tags = parsed_block_type[parsed_block_type.find(',') + 1: parsed_block_type.find(']')]
+            # Debug print statement
+                # print('block tags:', block_tags)
+                if 'wall' in block_tags:
+                    split_tags = block_tags.split(',')
+                    east = split_tags[0].split('"')[1]
+                    north = split_tags[1].split('"')[1]
+                    south = split_tags[2].split('"')[1]
+                    west = split_tags[3].split('"')[1]
+                    post = split_tags[4].split('=')[1]
+                # Debug print statement                     
+                    # print('wall tags:', east, north, south, west, post)
+                    parsed_block = Block(library, family, {"wall_connection_type_east": StringTag(east), "wall_connection_type_north": StringTag(north), "wall_connection_type_south": StringTag(south), "wall_connection_type_west": StringTag(west), "wall_post_bit": ByteTag(1)})
+            else:
+                parsed_block = Block(library, family)
+        elif '__version__=18108419' in parsed_block_type:
+            if 'minecraft:dark_oak_log' in parsed_block_type:
+                block_tags = parsed_block_type[parsed_block_type.find('[') + 1: parsed_block_type.find(']')]
+                if 'pillar_axis' in block_tags:
+                    split_tags = block_tags.split(',')
+                    for tag in split_tags:
+                        if 'pillar_axis' in tag:
+                            axis = tag.split('=')[1].replace('"', '')  # Remove quotes
+                            # print('pillar axis:', axis)
+                            parsed_block = Block(library, family, {"pillar_axis": StringTag(axis)})
+            elif parsed_block_type.find('[') + 21 < len(parsed_block_type) and parsed_block_type[parsed_block_type.find('[') + 21] == ',':
+                block_tags = parsed_block_type[parsed_block_type.find(',') + 1: parsed_block_type.find(']')]
+                if 'wall' in block_tags:
+                    split_tags = block_tags.split(',')
+                    east = split_tags[1].split('=')[1].replace('"', '')
+                    north = split_tags[2].split('=')[1].replace('"', '')
+                    south = split_tags[3].split('=')[1].replace('"', '')
+                    west = split_tags[4].split('=')[1].replace('"', '')
+                    post = int(split_tags[5].split('=')[1].replace('b', '').replace(']', ''))  # Remove 'b' and ']', then convert to int
+                    # print('wall tags:', east, north, south, west, post)
+                    parsed_block = Block(library, family, {"wall_connection_type_east": StringTag(east), "wall_connection_type_north": StringTag(north), "wall_connection_type_south": StringTag(south), "wall_connection_type_west": StringTag(west), "wall_post_bit": ByteTag(post)})
+            else:
+                parsed_block = Block(library, family)
+
+        else:
+            parsed_block = Block(library, family)
+
+
+    # Debug print statement
+        # print(parsed_block)
+    # Construction file block type examples
+    # These strings are parsed into the Block objects that the set_block method needs
+        # minecraft:polished_blackstone[__version__=18100737]
+        # minecraft:polished_blackstone_wall[__version__=18100737,wall_connection_type_east="short",wall_connection_type_north="none",wall_connection_type_south="short",wall_connection_type_west="none",wall_post_bit=1b]
+        return parsed_block
+
+###
+### With the coordinates and the blocks, the "set_blocks" method can be called to place the blocks in the world
+### We will use the coordinates as the starting point and iterate over the blocks in the compiled "construction_blocks"
+### template to place them in the world with the offset coordinates in the template
+###
+
+    @staticmethod
+    def set_blocks(world: "BaseLevel", dimension: Dimension, support_coordinates, construction_blocks, placed_support_blocks, placed_support_block_iter):
+        platform, version_number = world.level_wrapper.platform, world.level_wrapper.version        
+        base = (support_coordinates['x'], support_coordinates['y'], support_coordinates['z'])
+        for (x, y, z), i in zip((construction_blocks.offsets + base).tolist(), construction_blocks.block_index.tolist()):
+            block = construction_blocks.blocks[i]
+            world.set_version_block(x, y, z, dimension, (platform, version_number), block, None)
+            placed_support_blocks.append({'x': x, 'y': y, 'z': z, 'block': block})
+
+        placed_support_block_iter += 1
+    # DEBUG print statement
+        # print('Placed Support Blocks:', placed_support_blocks)
+        return placed_support_blocks, placed_support_block_iter
+
+###
+### The "Extrude Blocks" method places a whole pillar at once.  The template is stacked "height" times
+### starting at the support coordinates, and the full footprint is handed to the write buffer as one array,
+### so a tall pillar costs the same Python work as a short one.
+### Each pillar is logged once in "placed_support_blocks" rather than once per block.
+###
+
+    @staticmethod
+    def extrude_blocks(buffer, dimension: Dimension, support_coordinates, construction_blocks, height, placed_support_blocks, placed_support_block_iter):
+        platform, version_number = buffer.level_wrapper.platform, buffer.level_wrapper.version
+        height = int(height)
+        if height <= 0 or not len(construction_blocks):
+            return placed_support_blocks, placed_support_block_iter
+        base = np.array([support_coordinates['x'], support_coordinates['y'], support_coordinates['z']], dtype=np.int64)
+    ## Layer "h" of the pillar is the template shifted up by "h"; the layers are kept in bottom-up order
+        layers = np.zeros((height, 1, 3), dtype=np.int64)
+        layers[:, 0, 1] = np.arange(height)
+        coords = (construction_blocks.offsets[None, :, :] + base + layers).reshape(-1, 3)
+        block_index = np.tile(construction_blocks.block_index, height)
+        buffer.set_version_blocks(coords, dimension, (platform, version_number), construction_blocks.blocks, block_index)
+        placed_support_blocks.append({'x': int(base[0]), 'y': int(base[1]), 'z': int(base[2]), 'height': height, 'blocks': len(coords)})
+        placed_support_block_iter += height
+        return placed_support_blocks, placed_support_block_iter
@@ -0,0 +1,2241 @@
+# Rail Placer Pipeline Helpers
+# Support code for the "Place Rails" plug-in (rail_placer_working_v1dot3_with_choices.py)
+#
+# Amulet Map Editor and API Code from the Amulet Team
+# All other code (c) 2024 Black Forest Creations
+# Blame:  @lNQUlSlTlON
+
+"""
+Helpers for the Rail Placer plug-in that do not need the wx user interface.
+
+Like "construction.py", this file needs to be in the same folder as the rail
+placer script.  It has no "export" entry, so Amulet will not list it as an
+operation.
+"""
+
+import hashlib
+import itertools
+import json
+import logging
+import os
+import sys
+import time
+import weakref
+import zlib
+from collections import deque
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple, Union
+
+import numpy as np
+
+Coordinate = Tuple[int, int, int]
+
+# Logging.  Everything the placer reports goes to the "rail_placer" logger:
+# phase summaries at INFO (on by default), function banners and rare cases
+# at DEBUG, and per-block traces at TRACE.  Messages take %-style arguments,
+# so a trace that is not enabled is never formatted.
+TRACE = 5
+logging.addLevelName(TRACE, "TRACE")
+logger = logging.getLogger("rail_placer")
+LOG_FORMAT = "%(message)s"
+FILE_LOG_FORMAT = "%(asctime)s %(levelname)s %(message)s"
+
+
+class SampleFilter(logging.Filter):
+    """
+    Let through one in every ``every`` records of each message.
+
+    Records are counted per message (its format string, before the arguments
+    are filled in), so a per-block trace is thinned out without hiding a rare
+    message.  Records at ``level`` or above always pass.
+    """
+
+    def __init__(self, every: int = 1, level: int = logging.INFO):
+        super().__init__()
+        self.every = max(1, int(every))
+        self.level = level
+        self.seen: Dict[str, int] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= self.level or self.every == 1:
+            return True
+        seen = self.seen.get(record.msg, 0)
+        self.seen[record.msg] = seen + 1
+        return seen % self.every == 0
+
+
+def configure_logging(level=logging.INFO, sample_every: int = 1, log_file: Optional[str] = None) -> logging.Logger:
+    """
+    Set up the "rail_placer" logger, replacing any earlier set up.
+
+    ``level`` is a logging level or its name ("TRACE", "DEBUG", "INFO", ...).
+    Records below INFO are sampled one in ``sample_every`` per message (see
+    SampleFilter).  Records go to the console, and to ``log_file`` as well
+    when one is given.
+    """
+    if isinstance(level, str):
+        level = logging.getLevelName(level.upper())
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+    for log_filter in list(logger.filters):
+        logger.removeFilter(log_filter)
+    logger.setLevel(level)
+    logger.propagate = False
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter(LOG_FORMAT))
+    logger.addHandler(console)
+    if log_file:
+        file_handler = logging.FileHandler(log_file, encoding="utf-8")
+        file_handler.setFormatter(logging.Formatter(FILE_LOG_FORMAT))
+        logger.addHandler(file_handler)
+    if sample_every > 1:
+        logger.addFilter(SampleFilter(sample_every))
+    return logger
+
+
+if not logger.handlers:
+    configure_logging()
+
+# Marker wool blockstates and the use case each colour stands for
+# Pink = Path, Orange = Overpass, Purple = Pillar
+MARKER_USE_CASES = {
+    "universal_minecraft:wool[color=pink]": "standard_path",
+    "universal_minecraft:wool[color=orange]": "overpass",
+    "universal_minecraft:wool[color=purple]": "drop_pillar",
+}
+
+# Small integer codes for the marker use cases, used by the NumPy masks
+USE_CASE_CODES = {"standard_path": 1, "overpass": 2, "drop_pillar": 3}
+USE_CASE_NAMES = {code: name for name, code in USE_CASE_CODES.items()}
+
+# The 26 offsets of the 3x3x3 cube around a block, in x -> y -> z order.
+# The tracer takes neighbours in this order, so ties go the way they
+# always have.
+NEIGHBOUR_OFFSETS = tuple(
+    (dx, dy, dz)
+    for dx in (-1, 0, 1)
+    for dy in (-1, 0, 1)
+    for dz in (-1, 0, 1)
+    if (dx, dy, dz) != (0, 0, 0)
+)
+
+
+
+def _straight_step(dx: int, dy: int, dz: int) -> Optional[Tuple[str, str]]:
+    """The (direction, facing) of a one block step.  Used to build STRAIGHT_STEPS."""
+    if dx > 0:
+        facing = "east"
+    elif dx < 0:
+        facing = "west"
+    elif dz < 0:
+        facing = "north"
+    else:
+        facing = "south"
+    if dy != 0:
+        axis = "east" if dx != 0 else "north"
+        ascending = (dy > 0) == (dx > 0 if dx != 0 else dz < 0)
+        return f"{axis}_{'ascending' if ascending else 'descending'}", facing
+    if dx != 0:
+        return "east_west", facing
+    if dz != 0:
+        return "north_south", facing
+    return None
+
+
+# (direction, facing) of the roadbed for each single block step (dx, dy, dz)
+STRAIGHT_STEPS: Dict[Coordinate, Tuple[str, str]] = {
+    offset: _straight_step(*offset) for offset in NEIGHBOUR_OFFSETS if _straight_step(*offset) is not None
+}
+
+
+class CornerStep(NamedTuple):
+    """How a two block (corner) step is laid: the blocks in placement order and their rail directions."""
+
+    facing: str
+    first: Coordinate
+    second: Coordinate
+    start_direction: str
+    corner_direction: str
+    end_direction: str
+    start_rail: str  # key into roadbase_blocks for the rail on the very first block
+
+
+# Corner steps keyed by the pair of deltas that rail_direction reports for them
+CORNER_STEPS: Dict[Tuple[Coordinate, Coordinate], CornerStep] = {
+    ((-1, 0, 1), (0, 0, 1)): CornerStep("west-southwest", (0, 0, 1), (-1, 0, 1), "north_south", "north_west", "east_west", "rail_ns"),
+    ((-1, 0, 0), (-1, 0, 1)): CornerStep("south-southwest", (-1, 0, 0), (-1, 0, 1), "east_west", "south_east", "north_south", "rail_ew"),
+    ((0, 0, 1), (1, 0, 1)): CornerStep("east-southeast", (0, 0, 1), (1, 0, 1), "north_south", "north_east", "east_west", "rail_ns"),
+    ((1, 0, 0), (1, 0, 1)): CornerStep("south-southeast", (1, 0, 0), (1, 0, 1), "east_west", "south_west", "north_south", "rail_ew"),
+    ((0, 0, -1), (1, 0, -1)): CornerStep("east-northeast", (0, 0, -1), (1, 0, -1), "north_south", "south_east", "east_west", "rail_ns"),
+    ((1, 0, -1), (1, 0, 0)): CornerStep("north-northeast", (1, 0, 0), (1, 0, -1), "east_west", "north_west", "north_south", "rail_ew"),
+    ((-1, 0, -1), (-1, 0, 0)): CornerStep("north-northwest", (-1, 0, 0), (-1, 0, -1), "east_west", "north_east", "north_south", "rail_ew"),
+    ((-1, 0, -1), (0, 0, -1)): CornerStep("west-northwest", (0, 0, -1), (-1, 0, -1), "north_south", "south_west", "east_west", "rail_ns"),
+}
+
+# Prebuilt roadbed blocks by platform
+_roadbase_blocks: Dict[str, Dict[str, object]] = {}
+
+
+def roadbase_blocks(platform: str) -> Dict[str, object]:
+    """The Block objects set_roadbase places, built once per platform."""
+    blocks = _roadbase_blocks.get(platform)
+    if blocks is None:
+        from amulet.api.block import Block
+        from amulet_nbt import ByteTag, IntTag
+
+        blocks = _roadbase_blocks[platform] = {
+            "track_base": Block("minecraft", "cobblestone"),
+            "rail_ns": Block("minecraft", "rail", {"rail_direction": IntTag(0)}),
+            "rail_ew": Block("minecraft", "rail", {"rail_direction": IntTag(1)}),
+            "stair_northsouth_1": Block("minecraft", "stone_stairs", {"upside_down_bit": ByteTag(0), "weirdo_direction": IntTag(1)}),
+            "stair_northsouth_2": Block("minecraft", "stone_stairs", {"upside_down_bit": ByteTag(0), "weirdo_direction": IntTag(0)}),
+            "stair_eastwest_1": Block("minecraft", "stone_stairs", {"upside_down_bit": ByteTag(0), "weirdo_direction": IntTag(2)}),
+            "stair_eastwest_2": Block("minecraft", "stone_stairs", {"upside_down_bit": ByteTag(0), "weirdo_direction": IntTag(3)}),
+        }
+    return blocks
+
+# How far apart along an ordered path (see PathGraph.stretches) two entries
+# can be and still be linked.  Along a route that never touches itself, the
+# wool in the cube around a block is at most a few entries away (a diagonal
+# takes two), so this links it exactly as the cube alone would.
+ORDERED_REACH = 4
+
+
+class PathGraph:
+    """
+    Indexed adjacency graph of the marker wool voxels that make up a route.
+
+    Every marker is read from the world once.  Tracing then asks the graph for
+    the unvisited neighbours of a block instead of re-reading the 3x3x3 cube
+    around it, so following a route of N blocks costs O(N).
+    """
+
+    def __init__(self, ordered: bool = False):
+        self.coords: List[Coordinate] = []
+        self.use_cases: List[str] = []
+        self.index: Dict[Coordinate, int] = {}
+        self.adjacency: List[List[int]] = []
+        # An ordered graph only links nodes close together in node order (see stretches)
+        self.ordered = ordered
+
+    def __len__(self) -> int:
+        return len(self.coords)
+
+    def __contains__(self, coord: Coordinate) -> bool:
+        return coord in self.index
+
+    def add_node(self, coord: Coordinate, use_case: str) -> int:
+        """Add a voxel to the graph (once) and return its node index."""
+        node = self.index.get(coord)
+        if node is None:
+            node = len(self.coords)
+            self.index[coord] = node
+            self.coords.append(coord)
+            self.use_cases.append(use_case)
+        return node
+
+    def link(self):
+        """
+        (Re)build the adjacency lists.  Neighbours are kept in cube order.
+
+        In an ordered graph a neighbour more than ORDERED_REACH nodes away
+        in node order is left out.
+        """
+        index = self.index
+        self.adjacency = []
+        for this, (x, y, z) in enumerate(self.coords):
+            neighbours = []
+            for dx, dy, dz in NEIGHBOUR_OFFSETS:
+                node = index.get((x + dx, y + dy, z + dz))
+                if node is not None and not (self.ordered and abs(node - this) > ORDERED_REACH):
+                    neighbours.append(node)
+            self.adjacency.append(neighbours)
+
+    @classmethod
+    def from_voxels(cls, voxels: Iterable[Tuple[int, int, int, str]], ordered: bool = False) -> "PathGraph":
+        """Build a graph from (x, y, z, use_case) entries that are already known, in node order."""
+        graph = cls(ordered)
+        for x, y, z, use_case in voxels:
+            graph.add_node((int(x), int(y), int(z)), use_case)
+        graph.link()
+        return graph
+
+    @classmethod
+    def from_world(cls, world, dimension, start: Coordinate, start_use_case: str = "standard_path", known: Optional[Dict[Coordinate, str]] = None) -> "PathGraph":
+        """
+        Flood out from the start block and collect every marker wool voxel
+        connected to it through the 3x3x3 neighbourhood.
+
+        Each voxel around the route is read from the world at most once.
+        The start block itself is always part of the graph, whatever it is now
+        (get_coordinates_bulk has already turned it into cobblestone), and so is
+        any voxel in ``known``, a coord -> use case map of other such markers.
+        """
+        use_case_of = block_classifier(world).use_case
+        graph = cls()
+        graph.add_node(start, start_use_case)
+        read: Set[Coordinate] = {start}
+        queue = deque([start])
+        while queue:
+            x, y, z = queue.popleft()
+            for dx, dy, dz in NEIGHBOUR_OFFSETS:
+                coord = (x + dx, y + dy, z + dz)
+                if coord in read:
+                    continue
+                read.add(coord)
+                if known is not None and coord in known:
+                    use_case = known[coord]
+                else:
+                    use_case = use_case_of(world.get_block(*coord, dimension))
+                if use_case is not None:
+                    graph.add_node(coord, use_case)
+                    queue.append(coord)
+        graph.link()
+        return graph
+
+    @classmethod
+    def components(cls, world, dimension, seeds: Iterable[Tuple[Coordinate, str]]) -> List["PathGraph"]:
+        """
+        Split the markers found in a selection into separate, connected routes.
+
+        ``seeds`` are the (coord, use_case) markers of the selection scan, in
+        scan order.  Every seed that is not on an earlier route starts a new
+        one, so each route starts from its first seed, just as a single route
+        starts from the first marker found.
+        """
+        known = dict(seeds)
+        graphs: List[PathGraph] = []
+        for coord, use_case in known.items():
+            if any(coord in graph for graph in graphs):
+                continue
+            graphs.append(cls.from_world(world, dimension, coord, use_case, known))
+        return graphs
+
+    @classmethod
+    def components_from_voxels(cls, voxels: Dict[Coordinate, str], starts: Iterable[Coordinate] = ()) -> List["PathGraph"]:
+        """
+        Split markers that are already known (a coord -> use case map) into
+        connected routes, without reading the world.
+
+        Each route starts from the first of ``starts`` on it, or from its first
+        voxel in ``voxels`` order.  Nodes are added in the same order
+        from_world adds them, so a route traces the same either way.
+        """
+        graphs: List[PathGraph] = []
+        covered: Set[Coordinate] = set()
+        for start in itertools.chain(starts, voxels):
+            if start in covered or start not in voxels:
+                continue
+            graph = cls()
+            graph.add_node(start, voxels[start])
+            queue = deque([start])
+            while queue:
+                x, y, z = queue.popleft()
+                for dx, dy, dz in NEIGHBOUR_OFFSETS:
+                    coord = (x + dx, y + dy, z + dz)
+                    if coord in voxels and coord not in graph:
+                        graph.add_node(coord, voxels[coord])
+                        queue.append(coord)
+            graph.link()
+            covered.update(graph.index)
+            graphs.append(graph)
+        return graphs
+
+    @classmethod
+    def stretches(cls, path: Iterable[Tuple[Coordinate, str]]) -> List["PathGraph"]:
+        """
+        Split an ordered path (see load_path_file) into ordered graphs.
+
+        A stretch runs on while each entry is in the 3x3x3 cube of the one
+        before it, and starts from its first entry.  Its graph only links
+        entries close together along it, so tracing follows the file order
+        and is not taken on a shortcut where the path passes close by itself.
+        """
+        graphs: List[PathGraph] = []
+        previous = None
+        for coord, use_case in path:
+            if previous is None or max(abs(a - b) for a, b in zip(coord, previous)) != 1:
+                graphs.append(cls(ordered=True))
+            graphs[-1].add_node(coord, use_case)
+            previous = coord
+        for graph in graphs:
+            graph.link()
+        return graphs
+
+    def marker_table(self) -> "PathTable":
+        """The graph's markers as a MARKER_FIELDS table, in node order."""
+        coords = np.array(self.coords, dtype=np.int64).reshape(-1, 3)
+        return PathTable.from_columns(MARKER_FIELDS, {
+            "x": coords[:, 0], "y": coords[:, 1], "z": coords[:, 2],
+            "use_case": np.array([USE_CASES.encode(use_case) for use_case in self.use_cases], dtype=np.int64),
+        })
+
+    def unvisited_neighbours(self, coord: Coordinate, visited: Set[Coordinate]) -> List[dict]:
+        """
+        Return the neighbours of a block that have not been placed yet, as
+        coordinate dicts in NEIGHBOUR_OFFSETS order.
+        """
+        node = self.index.get(coord)
+        if node is None:
+            return []
+        neighbours = []
+        for other in self.adjacency[node]:
+            other_coord = self.coords[other]
+            if other_coord in visited:
+                continue
+            x, y, z = other_coord
+            neighbours.append({'x': x, 'y': y, 'z': z, 'value': 1, 'use_case': self.use_cases[other]})
+        return neighbours
+
+
+def _path_use_case(value) -> str:
+    """The use case of a path file entry, given as a USE_CASE_CODES name or code (a number, or a number as text)."""
+    if isinstance(value, (str, np.str_)):
+        value = str(value)
+        if value in USE_CASE_CODES:
+            return value
+        if value.strip().isdigit():
+            value = int(value)
+    if isinstance(value, (int, np.integer)) and not isinstance(value, bool) and int(value) in USE_CASE_NAMES:
+        return USE_CASE_NAMES[int(value)]
+    raise ValueError(f"unknown use case {value!r}")
+
+
+def load_path_file(path: str) -> List[Tuple[Coordinate, str]]:
+    """
+    Read an ordered path from a .json or .npy file, as a list of (coord, use case) entries in file order.
+
+    A JSON file holds a list of [x, y, z] or [x, y, z, use_case] entries (or
+    objects with those keys).  A .npy file holds an (N, 3) or (N, 4) array,
+    the fourth column a number or, in a string array, text.  Either way the
+    use case is a USE_CASE_CODES name or code, and entries without one are
+    "standard_path".  The path is followed in file order (see
+    PathGraph.stretches), so a voxel may only be listed once; a repeated one
+    raises ValueError.
+    """
+    if path.lower().endswith(".npy"):
+        array = np.load(path, allow_pickle=False)
+        if array.ndim != 2 or array.shape[1] not in (3, 4):
+            raise ValueError(f"{path}: expected an (N, 3) or (N, 4) array, not {array.shape}")
+        coords = array[:, :3].astype(np.int64).tolist()
+        use_cases = array[:, 3].tolist() if array.shape[1] == 4 else ["standard_path"] * len(coords)
+    else:
+        with open(path) as f:
+            entries = json.load(f)
+        coords, use_cases = [], []
+        for entry in entries:
+            if isinstance(entry, dict):
+                coords.append([entry["x"], entry["y"], entry["z"]])
+                use_cases.append(entry.get("use_case", "standard_path"))
+            else:
+                coords.append(entry[:3])
+                use_cases.append(entry[3] if len(entry) > 3 else "standard_path")
+    entries: List[Tuple[Coordinate, str]] = []
+    first_entry: Dict[Coordinate, int] = {}
+    for i, (coord, use_case) in enumerate(zip(coords, use_cases)):
+        try:
+            use_case = _path_use_case(use_case)
+        except ValueError as e:
+            raise ValueError(f"{path}: entry {i} has an {e}") from None
+        coord = tuple(int(v) for v in coord)
+        if coord in first_entry:
+            raise ValueError(f"{path}: entry {i} repeats entry {first_entry[coord]}, {coord}")
+        first_entry[coord] = i
+        entries.append((coord, use_case))
+    return entries
+
+
+# Voxel classes.  Every block the placer tests is reduced to one of these
+# small integers; the column depth probe only tells air and water from the rest.
+VOXEL_SOLID, VOXEL_AIR, VOXEL_WATER, VOXEL_LAVA = 0, 1, 2, 3
+VOXEL_PATH_WOOL, VOXEL_OVERPASS_WOOL, VOXEL_PILLAR_WOOL, VOXEL_TRACK_BASE = 4, 5, 6, 7
+
+AIR_BLOCKSTATE = "universal_minecraft:air"
+LAVA_BLOCKSTATE = "universal_minecraft:lava"
+TRACK_BASE_BLOCKSTATE = "universal_minecraft:cobblestone"
+# Only still water counts as water; flowing water is treated like any other block
+WATER_BLOCKSTATES = frozenset(
+    f"universal_minecraft:water[falling=false,flowing=false,level={i}]" for i in range(16)
+)
+
+# The marker wool classes and the use case each stands for
+MARKER_CLASSES = {VOXEL_PATH_WOOL: "standard_path", VOXEL_OVERPASS_WOOL: "overpass", VOXEL_PILLAR_WOOL: "drop_pillar"}
+_MARKER_CLASS_OF = {use_case: voxel_class for voxel_class, use_case in MARKER_CLASSES.items()}
+
+_BLOCKSTATE_CLASSES = dict(
+    {AIR_BLOCKSTATE: VOXEL_AIR, TRACK_BASE_BLOCKSTATE: VOXEL_TRACK_BASE},
+    **{blockstate: VOXEL_WATER for blockstate in WATER_BLOCKSTATES},
+    **{blockstate: _MARKER_CLASS_OF[use_case] for blockstate, use_case in MARKER_USE_CASES.items()},
+)
+
+# USE_CASE_CODES by voxel class (0 for anything that is not a marker), for NumPy lookups
+CLASS_USE_CASE_CODES = np.zeros(VOXEL_TRACK_BASE + 1, dtype=np.uint8)
+for _voxel_class, _use_case in MARKER_CLASSES.items():
+    CLASS_USE_CASE_CODES[_voxel_class] = USE_CASE_CODES[_use_case]
+
+
+def classify_blockstate(blockstate: str) -> int:
+    """Return the VOXEL_* class of a universal blockstate string."""
+    voxel_class = _BLOCKSTATE_CLASSES.get(blockstate)
+    if voxel_class is not None:
+        return voxel_class
+    if blockstate == LAVA_BLOCKSTATE or blockstate.startswith(LAVA_BLOCKSTATE + "["):
+        return VOXEL_LAVA
+    return VOXEL_SOLID
+
+
+class BlockClassifier:
+    """
+    Cache of the VOXEL_* class of every block a run has seen.
+
+    ``classify`` takes a Block (from get_block) and ``classify_ids`` an array
+    of palette ids read straight from chunks.  Each distinct block is
+    classified once; after that a block costs a dict lookup and a palette id
+    array costs one NumPy indexing operation.  Amulet's block palette only
+    ever grows, so the palette id table stays valid for the whole run and is
+    extended as new ids turn up.
+    """
+
+    def __init__(self, palette=None):
+        self._palette = palette
+        self._by_blockstate: Dict[str, int] = {}
+        self._by_id = np.zeros(0, dtype=np.uint8)
+
+    def classify(self, block) -> int:
+        """The VOXEL_* class of a universal Block."""
+        blockstate = block.blockstate
+        voxel_class = self._by_blockstate.get(blockstate)
+        if voxel_class is None:
+            voxel_class = self._by_blockstate[blockstate] = classify_blockstate(blockstate)
+        return voxel_class
+
+    def use_case(self, block) -> Optional[str]:
+        """The marker use case of a universal Block, or None if it is not marker wool."""
+        return MARKER_CLASSES.get(self.classify(block))
+
+    def classify_ids(self, ids: np.ndarray) -> np.ndarray:
+        """The VOXEL_* classes (uint8, same shape) of an array of palette ids."""
+        ids = np.asarray(ids)
+        if ids.size:
+            known = len(self._by_id)
+            needed = int(ids.max()) + 1
+            if needed > known:
+                grown = np.empty(needed, dtype=np.uint8)
+                grown[:known] = self._by_id
+                for palette_id in range(known, needed):
+                    grown[palette_id] = self.classify(self._palette[palette_id])
+                self._by_id = grown
+        return self._by_id[ids]
+
+
+_classifiers: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def block_classifier(world) -> BlockClassifier:
+    """The BlockClassifier shared by everything that reads ``world`` during a run."""
+    classifier = _classifiers.get(world)
+    if classifier is None:
+        classifier = _classifiers[world] = BlockClassifier(getattr(world, "block_palette", None))
+    return classifier
+
+
+def has_chunks(world) -> bool:
+    """
+    Whether ``world`` gives chunk level access like a BaseLevel.
+
+    The bulk readers and WriteBuffer work on chunk block arrays.  A stand-in
+    world that only has get_block and set_version_block (the benchmark's fake
+    level, for example) is read and written a block at a time instead.
+    """
+    return hasattr(world, "get_chunk")
+
+
+def scan_markers(world, dimension, selection) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Bulk scan a selection for marker wool.
+
+    Whole chunk slices are read at once and their palette ids are classified
+    with the world's BlockClassifier, so every block in the selection costs a
+    NumPy lookup instead of a get_block call and a blockstate string comparison.
+    Chunks that do not exist are skipped.  A world without chunks (see
+    has_chunks) is read with get_block.
+
+    Returns (coords, use_case_codes): an (N, 3) int array of marker
+    coordinates in x -> y -> z scan order (per selection box) and an (N,)
+    array of USE_CASE_CODES.
+    """
+    if not has_chunks(world):
+        return _scan_markers_by_block(world, dimension, selection)
+    classifier = block_classifier(world)
+    coord_parts = []
+    code_parts = []
+    for box in selection.selection_boxes:
+        box_coords = []
+        box_codes = []
+        for chunk, slices, sub_box in world.get_chunk_slice_box(dimension, box):
+            use_case_mask = CLASS_USE_CASE_CODES[classifier.classify_ids(chunk.blocks[slices])]
+            path_mask = use_case_mask > 0
+            if not path_mask.any():
+                continue
+            box_coords.append(np.argwhere(path_mask) + np.asarray(sub_box.min))
+            box_codes.append(use_case_mask[path_mask])
+        if not box_coords:
+            continue
+        coords = np.concatenate(box_coords)
+        codes = np.concatenate(box_codes)
+        # Chunks come back in chunk order; put the markers back in scan order
+        order = np.lexsort((coords[:, 2], coords[:, 1], coords[:, 0]))
+        coord_parts.append(coords[order])
+        code_parts.append(codes[order])
+    if not coord_parts:
+        return np.zeros((0, 3), dtype=np.int64), np.zeros(0, dtype=np.uint8)
+    return np.concatenate(coord_parts).astype(np.int64), np.concatenate(code_parts)
+
+
+def _scan_markers_by_block(world, dimension, selection) -> Tuple[np.ndarray, np.ndarray]:
+    """scan_markers for a world without chunks, one get_block per voxel."""
+    classify = block_classifier(world).classify
+    coords = []
+    codes = []
+    for box in selection.selection_boxes:
+        for x in range(box.min[0], box.max[0]):
+            for y in range(box.min[1], box.max[1]):
+                for z in range(box.min[2], box.max[2]):
+                    code = CLASS_USE_CASE_CODES[classify(world.get_block(x, y, z, dimension))]
+                    if code:
+                        coords.append((x, y, z))
+                        codes.append(code)
+    return np.array(coords, dtype=np.int64).reshape(-1, 3), np.array(codes, dtype=np.uint8)
+
+
+def read_voxel_classes(world, dimension, coords: np.ndarray) -> np.ndarray:
+    """
+    The VOXEL_* class of each of an (N, 3) array of voxels.
+
+    The voxels in a chunk are read with one slice of it, and a world without
+    chunks is read with get_block.  A voxel in a chunk that does not exist
+    reads as air.
+    """
+    coords = np.asarray(coords, dtype=np.int64).reshape(-1, 3)
+    classes = np.full(len(coords), VOXEL_AIR, dtype=np.uint8)
+    classifier = block_classifier(world)
+    if not has_chunks(world):
+        for i, (x, y, z) in enumerate(coords.tolist()):
+            classes[i] = classifier.classify(world.get_block(x, y, z, dimension))
+        return classes
+    for members, ids in _read_voxel_ids(world, dimension, coords):
+        classes[members] = classifier.classify_ids(ids)
+    return classes
+
+
+def read_voxel_blocks(world, dimension, coords: np.ndarray) -> list:
+    """
+    The universal Block at each of an (N, 3) array of voxels.
+
+    Read like read_voxel_classes, so a voxel in a chunk that does not exist
+    reads as air.
+    """
+    from amulet.api.block import Block
+
+    coords = np.asarray(coords, dtype=np.int64).reshape(-1, 3)
+    if not has_chunks(world):
+        return [world.get_block(x, y, z, dimension) for x, y, z in coords.tolist()]
+    air = Block.from_string_blockstate(AIR_BLOCKSTATE)
+    blocks = [air] * len(coords)
+    palette = world.block_palette
+    for members, ids in _read_voxel_ids(world, dimension, coords):
+        for i, palette_id in zip(members.tolist(), ids.tolist()):
+            blocks[i] = palette[palette_id]
+    return blocks
+
+
+def _read_voxel_ids(world, dimension, coords: np.ndarray):
+    """Yield (members, palette ids) for the voxels of ``coords`` in each chunk that exists, one chunk slice each."""
+    from amulet.api.errors import ChunkDoesNotExist, ChunkLoadError
+
+    if not len(coords):
+        return
+    chunk_keys = np.stack((coords[:, 0] >> 4, coords[:, 2] >> 4), axis=1)
+    unique_keys, chunk_of_voxel = np.unique(chunk_keys, axis=0, return_inverse=True)
+    chunk_of_voxel = chunk_of_voxel.reshape(-1)
+    for key_index, (cx, cz) in enumerate(unique_keys.tolist()):
+        members = np.flatnonzero(chunk_of_voxel == key_index)
+        try:
+            chunk = world.get_chunk(cx, cz, dimension)
+        except (ChunkDoesNotExist, ChunkLoadError):
+            continue
+        lx, y, lz = coords[members, 0] & 15, coords[members, 1], coords[members, 2] & 15
+        x0, y0, z0 = int(lx.min()), int(y.min()), int(lz.min())
+        ids = np.asarray(chunk.blocks[x0:int(lx.max()) + 1, y0:int(y.max()) + 1, z0:int(lz.max()) + 1])
+        yield members, ids[lx - x0, y - y0, lz - z0]
+
+
+def probe_column_depths(world, dimension, columns: np.ndarray, overlay: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Measure the air and water below a set of columns.
+
+    ``columns`` is an (N, 3) int array of (x, y, z).  Probing starts at y - 1
+    and runs downward: first the run of air, then the run of water directly
+    below it.  The volume under all the columns in a chunk is read in one
+    slice and classified with a palette id lookup, and the two runs are found
+    with argmax, so deep ravines and oceans cost no more Python work than
+    shallow ground.
+
+    Anything below the bottom of the world, and any column in a chunk that
+    does not exist, counts as solid.  A world without chunks (see has_chunks)
+    is probed with get_block, one voxel at a time.
+
+    ``overlay`` is an optional ((M, 3) coords, (M,) VOXEL_* classes) pair of
+    edits that have been planned but not made.  They are laid over what the
+    world holds, the last one winning, so a plan probes the ground it will
+    actually stand on.
+
+    Returns (air_depth, water_depth), two (N,) int arrays of raw run lengths.
+    """
+    from amulet.api.errors import ChunkDoesNotExist, ChunkLoadError
+
+    columns = np.asarray(columns, dtype=np.int64).reshape(-1, 3)
+    air_depth = np.zeros(len(columns), dtype=np.int64)
+    water_depth = np.zeros(len(columns), dtype=np.int64)
+    if not len(columns):
+        return air_depth, water_depth
+
+    if not has_chunks(world):
+        return _probe_column_depths_by_block(world, dimension, columns, overlay)
+    floor_y = int(world.bounds(dimension).min_y)
+    classifier = block_classifier(world)
+
+    if overlay is not None and len(overlay[0]):
+        overlay_coords = np.asarray(overlay[0], dtype=np.int64).reshape(-1, 3)[::-1]
+        overlay_classes = np.asarray(overlay[1], dtype=np.uint8)[::-1]
+        overlay_coords, last = np.unique(overlay_coords, axis=0, return_index=True)
+        overlay_classes = overlay_classes[last]
+        overlay_keys = np.stack((overlay_coords[:, 0] >> 4, overlay_coords[:, 2] >> 4), axis=1)
+    else:
+        overlay = None
+
+    chunk_keys = np.stack((columns[:, 0] >> 4, columns[:, 2] >> 4), axis=1)
+    unique_keys, chunk_of_column = np.unique(chunk_keys, axis=0, return_inverse=True)
+    chunk_of_column = chunk_of_column.reshape(-1)
+    for key_index, (cx, cz) in enumerate(unique_keys.tolist()):
+        members = np.flatnonzero(chunk_of_column == key_index)
+        try:
+            chunk = world.get_chunk(cx, cz, dimension)
+        except (ChunkDoesNotExist, ChunkLoadError):
+            continue
+        lx = columns[members, 0] & 15
+        lz = columns[members, 2] & 15
+        top = columns[members, 1] - 1  # first voxel probed in each column
+        if top.max() < floor_y:
+            continue
+
+        # One slice covering every column in this chunk, from the floor up
+        x0, x1 = int(lx.min()), int(lx.max()) + 1
+        z0, z1 = int(lz.min()), int(lz.max()) + 1
+        y1 = int(top.max()) + 1
+        classes = classifier.classify_ids(chunk.blocks[x0:x1, floor_y:y1, z0:z1])
+        if overlay is not None:
+            ox, oy, oz = overlay_coords.T
+            laid = (
+                (overlay_keys[:, 0] == cx) & (overlay_keys[:, 1] == cz)
+                & ((ox & 15) >= x0) & ((ox & 15) < x1) & ((oz & 15) >= z0) & ((oz & 15) < z1)
+                & (oy >= floor_y) & (oy < y1)
+            )
+            classes[(ox[laid] & 15) - x0, oy[laid] - floor_y, (oz[laid] & 15) - z0] = overlay_classes[laid]
+
+        # Row k of each column is the voxel k blocks below its top.  One extra
+        # row past the floor guarantees every column ends on solid ground.
+        depth = y1 - floor_y + 1
+        y_index = (top - floor_y)[:, None] - np.arange(depth)[None, :]
+        below_floor = y_index < 0
+        strips = classes[(lx - x0)[:, None], np.clip(y_index, 0, None), (lz - z0)[:, None]]
+        strips[below_floor] = VOXEL_SOLID
+
+        rows = np.arange(depth)[None, :]
+        air = np.argmax(strips != VOXEL_AIR, axis=1)
+        water_end = np.argmax((rows >= air[:, None]) & (strips != VOXEL_WATER), axis=1)
+        air_depth[members] = air
+        water_depth[members] = water_end - air
+    return air_depth, water_depth
+
+
+# The bottom of the world when a world without chunks has no bounds to ask
+DEFAULT_FLOOR_Y = -64
+
+
+def _probe_column_depths_by_block(world, dimension, columns: np.ndarray, overlay=None) -> Tuple[np.ndarray, np.ndarray]:
+    """probe_column_depths for a world without chunks, one get_block per voxel."""
+    floor_y = int(world.bounds(dimension).min_y) if hasattr(world, "bounds") else DEFAULT_FLOOR_Y
+    classify = block_classifier(world).classify
+    laid: Dict[Coordinate, int] = {}
+    if overlay is not None:
+        for coord, voxel_class in zip(np.asarray(overlay[0], dtype=np.int64).reshape(-1, 3).tolist(), np.asarray(overlay[1]).tolist()):
+            laid[tuple(coord)] = voxel_class
+    classes: Dict[Coordinate, int] = {}
+
+    def voxel_class(x: int, y: int, z: int) -> int:
+        if y < floor_y:
+            return VOXEL_SOLID
+        coord = (x, y, z)
+        found = laid.get(coord)
+        if found is None:
+            found = classes.get(coord)
+        if found is None:
+            found = classes[coord] = classify(world.get_block(x, y, z, dimension))
+        return found
+
+    air_depth = np.zeros(len(columns), dtype=np.int64)
+    water_depth = np.zeros(len(columns), dtype=np.int64)
+    for i, (x, y, z) in enumerate(columns.tolist()):
+        y -= 1
+        air = 0
+        while voxel_class(x, y, z) == VOXEL_AIR:
+            air += 1
+            y -= 1
+        water = 0
+        while voxel_class(x, y, z) == VOXEL_WATER:
+            water += 1
+            y -= 1
+        air_depth[i] = air
+        water_depth[i] = water
+    return air_depth, water_depth
+
+
+def solid_ground_records(blocks: "PathTable", air_depth: np.ndarray, water_depth: np.ndarray, fields: Dict[str, object]) -> "PathTable":
+    """
+    Turn probed depths into the ground table find_solid_ground returns.
+
+    ``y`` is the lowest air/water block of the column (the block itself when
+    there is none) and the status names the solid block below it.  A column
+    that starts with water reports one less water block than it has, the same
+    as the block by block probe did.  Rows in the 'skip' state are carried
+    through as 'NA' rows.
+    """
+    skip = blocks.column('state') == blocks.codes('state', 'skip')
+    air = np.asarray(air_depth, dtype=np.int64)
+    water = np.asarray(water_depth, dtype=np.int64)
+    reported_water = np.where((air == 0) & (water > 0), water - 1, water)
+    probed = (~skip).astype(np.int64)
+
+    def unless_skipped(values):
+        return np.where(skip, NA, values)
+
+    columns = {
+        'x': unless_skipped(blocks.column('x')),
+        'y': unless_skipped(blocks.column('y') - air - water),
+        'z': unless_skipped(blocks.column('z')),
+        'status': unless_skipped(air + reported_water + 1),
+        'air_depth': unless_skipped(air),
+        'water_depth': unless_skipped(reported_water),
+        'iteration': np.cumsum(probed) - probed,
+    }
+    for name in fields:
+        if name not in columns and name in blocks.fields:
+            columns[name] = blocks.column(name)
+    return PathTable.from_columns(fields, columns)
+
+
+class WriteBuffer:
+    """
+    Staging area for block edits.
+
+    It stands in for the world wherever the placer calls
+    ``set_version_block``, and ``set_version_blocks`` stages whole arrays of
+    edits (a pillar, for example) in one call.  A later write to a voxel
+    replaces an earlier one.  ``flush`` translates each distinct block to the
+    universal format once, then writes the edits a chunk and sub-chunk at a
+    time straight into the block arrays.  Each chunk is fetched once and
+    marked changed once per flush, instead of once per block.
+    """
+
+    def __init__(self, world):
+        self.world = world
+        # Staged edits in the order they were made.  Single block edits are
+        # collected in a dict layer, array edits are kept as they were given.
+        self._layers: list = []
+        self._universal: Dict[tuple, tuple] = {}
+
+    @property
+    def level_wrapper(self):
+        return self.world.level_wrapper
+
+    def __len__(self) -> int:
+        return sum(len(layer) if isinstance(layer, dict) else len(layer[2]) for layer in self._layers)
+
+    def set_version_block(self, x: int, y: int, z: int, dimension, version, block, block_entity=None):
+        """Stage a block edit.  Same arguments as BaseLevel.set_version_block."""
+        if not self._layers or not isinstance(self._layers[-1], dict):
+            self._layers.append({})
+        self._layers[-1][(dimension, int(x), int(y), int(z))] = (tuple(version), block, block_entity)
+
+    def set_version_blocks(self, coords: np.ndarray, dimension, version, blocks: list, block_index: np.ndarray):
+        """
+        Stage many block edits at once.
+
+        ``coords`` is an (N, 3) int array and ``block_index`` an (N,) array of
+        indices into ``blocks``.  Later rows win over earlier ones.
+        """
+        coords = np.asarray(coords, dtype=np.int64).reshape(-1, 3)
+        if len(coords):
+            self._layers.append((dimension, tuple(version), coords, list(blocks), np.asarray(block_index, dtype=np.int64)))
+
+    def get_block(self, x: int, y: int, z: int, dimension):
+        """Read a block from the world, after writing out anything staged."""
+        self.flush()
+        return self.world.get_block(x, y, z, dimension)
+
+    def _to_universal(self, version: tuple, block, block_entity=None) -> tuple:
+        if block_entity is not None:
+            universal_block, universal_entity, _ = self.world.translation_manager.get_version(*version).block.to_universal(block, block_entity)
+            return universal_block, universal_entity
+        key = (version, block)
+        universal = self._universal.get(key)
+        if universal is None:
+            universal_block, universal_entity, _ = self.world.translation_manager.get_version(*version).block.to_universal(block)
+            universal = self._universal[key] = (universal_block, universal_entity)
+        return universal
+
+    def flush(self):
+        """Write every staged edit to the world and empty the buffer."""
+        layers, self._layers = self._layers, []
+        if not has_chunks(self.world):
+            self._replay(layers)
+            return
+        palette_ids: Dict[object, int] = {}
+
+        def palette_id(universal_block) -> int:
+            found = palette_ids.get(universal_block)
+            if found is None:
+                found = palette_ids[universal_block] = self.world.block_palette.get_add_block(universal_block)
+            return found
+
+        for layer in layers:
+            if isinstance(layer, dict):
+                by_dimension: Dict[object, Tuple[list, list, dict]] = {}
+                for (dimension, x, y, z), (version, block, block_entity) in layer.items():
+                    universal_block, universal_entity = self._to_universal(version, block, block_entity)
+                    coords, ids, entities = by_dimension.setdefault(dimension, ([], [], {}))
+                    coords.append((x, y, z))
+                    ids.append(palette_id(universal_block))
+                    if universal_entity is not None:
+                        entities[(x, y, z)] = universal_entity
+                for dimension, (coords, ids, entities) in by_dimension.items():
+                    self._write(dimension, np.array(coords, dtype=np.int64), np.array(ids, dtype=np.int64), entities)
+            else:
+                dimension, version, coords, blocks, block_index = layer
+                lut = np.array([palette_id(self._to_universal(version, block)[0]) for block in blocks], dtype=np.int64)
+                self._write(dimension, coords, lut[block_index], {})
+
+    def _replay(self, layers: list):
+        """Write staged edits to a world without chunks, one set_version_block per edit."""
+        for layer in layers:
+            if isinstance(layer, dict):
+                for (dimension, x, y, z), (version, block, block_entity) in layer.items():
+                    self.world.set_version_block(x, y, z, dimension, version, block, block_entity)
+            else:
+                dimension, version, coords, blocks, block_index = layer
+                for (x, y, z), index in zip(coords.tolist(), block_index.tolist()):
+                    self.world.set_version_block(x, y, z, dimension, version, blocks[index], None)
+
+    def _write(self, dimension, coords: np.ndarray, ids: np.ndarray, entities: dict):
+        """Write palette ids into the chunks, grouped by chunk and sub-chunk."""
+        from amulet.api.errors import ChunkDoesNotExist
+
+        # Keep the last write to each voxel
+        _, last = np.unique(coords[::-1], axis=0, return_index=True)
+        keep = np.sort(len(coords) - 1 - last)
+        coords, ids = coords[keep], ids[keep]
+
+        chunk_keys = np.stack((coords[:, 0] >> 4, coords[:, 2] >> 4), axis=1)
+        unique_keys, chunk_of_edit = np.unique(chunk_keys, axis=0, return_inverse=True)
+        chunk_of_edit = chunk_of_edit.reshape(-1)
+        for key_index, (cx, cz) in enumerate(unique_keys.tolist()):
+            members = chunk_of_edit == key_index
+            chunk_coords, chunk_ids = coords[members], ids[members]
+            try:
+                chunk = self.world.get_chunk(cx, cz, dimension)
+            except ChunkDoesNotExist:
+                chunk = self.world.create_chunk(cx, cz, dimension)
+            cy = chunk_coords[:, 1] >> 4
+            for sub_chunk_y in np.unique(cy).tolist():
+                rows = cy == sub_chunk_y
+                sub_chunk = chunk.blocks.get_sub_chunk(sub_chunk_y)
+                sub_chunk[chunk_coords[rows, 0] & 15, chunk_coords[rows, 1] & 15, chunk_coords[rows, 2] & 15] = chunk_ids[rows]
+            # Like set_block, a new block replaces any block entity that was there
+            block_entities = chunk.block_entities
+            if len(block_entities) or entities:
+                for coord in map(tuple, chunk_coords.tolist()):
+                    if coord in entities:
+                        block_entities[coord] = entities[coord]
+                    elif coord in block_entities:
+                        del block_entities[coord]
+            chunk.changed = True
+
+
+class LevelInfo(NamedTuple):
+    """The platform and version of a world, standing in for its level_wrapper."""
+    platform: str
+    version: Union[Tuple[int, ...], int]  # see level_version
+
+
+def block_snbt(block) -> str:
+    """
+    A block as a string that ``snbt_block`` turns back into the same block.
+
+    ``Block.blockstate`` drops properties that are not strings (a rail's
+    IntTag rail_direction, for one), so the SNBT blockstate is used instead.
+    Extra blocks (waterlogging) follow on their own lines.
+    """
+    return "\n".join(part.snbt_blockstate for part in block.block_tuple)
+
+
+def snbt_block(snbt: str):
+    """The Block a ``block_snbt`` string stands for."""
+    from amulet.api.block import Block
+
+    base, *extra = (Block.from_snbt_blockstate(part) for part in snbt.split("\n"))
+    if extra:
+        return Block(base.namespace, base.base_name, base.properties, extra)
+    return base
+
+
+def level_version(version):
+    """
+    A level wrapper's version in a form that compares, hashes and pickles.
+
+    Bedrock gives a version tuple and Java an int data version.  Sequences
+    become tuples of ints; anything else is kept as it is.
+    """
+    if isinstance(version, (tuple, list)):
+        return tuple(int(part) for part in version)
+    return version
+
+
+class EditRecorder:
+    """
+    Records block edits instead of making them.
+
+    It takes the place of a WriteBuffer when a route is planned in another
+    process, where the world is not available.  Blocks are kept as SNBT
+    blockstate strings (see block_snbt) so the edits pickle cleanly, and
+    ``edits`` hands them back as the arguments of one
+    ``WriteBuffer.set_version_blocks`` call (after ``snbt_block``).  Order is
+    kept, so the last edit to a voxel still wins when they are replayed.
+    """
+
+    def __init__(self, platform: str, version):
+        self.level_wrapper = LevelInfo(platform, level_version(version))
+        self._coords: List[np.ndarray] = []
+        self._indices: List[np.ndarray] = []
+        self._pending: List[Tuple[int, int, int, int]] = []
+        self._blockstates: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._pending) + sum(len(index) for index in self._indices)
+
+    def _blockstate_index(self, blockstate: str) -> int:
+        index = self._blockstates.get(blockstate)
+        if index is None:
+            index = self._blockstates[blockstate] = len(self._blockstates)
+        return index
+
+    def _close_pending(self):
+        if self._pending:
+            pending = np.array(self._pending, dtype=np.int64)
+            self._coords.append(pending[:, :3])
+            self._indices.append(pending[:, 3])
+            self._pending = []
+
+    def set_version_block(self, x: int, y: int, z: int, dimension, version, block, block_entity=None):
+        if block_entity is not None:
+            raise ValueError("EditRecorder cannot record block entities")
+        self._pending.append((int(x), int(y), int(z), self._blockstate_index(block_snbt(block))))
+
+    def set_version_blocks(self, coords: np.ndarray, dimension, version, blocks: list, block_index: np.ndarray):
+        coords = np.asarray(coords, dtype=np.int64).reshape(-1, 3)
+        if len(coords):
+            self._close_pending()
+            remap = np.array([self._blockstate_index(block_snbt(block)) for block in blocks], dtype=np.int64)
+            self._coords.append(coords)
+            self._indices.append(remap[np.asarray(block_index, dtype=np.int64)])
+
+    def extend(self, coords: np.ndarray, block_index: np.ndarray, blockstates: List[str]):
+        """Record edits given the way ``edits`` returns them, e.g. by another recorder."""
+        coords = np.asarray(coords, dtype=np.int64).reshape(-1, 3)
+        if len(coords):
+            self._close_pending()
+            remap = np.array([self._blockstate_index(str(blockstate)) for blockstate in blockstates], dtype=np.int64)
+            self._coords.append(coords)
+            self._indices.append(remap[np.asarray(block_index, dtype=np.int64)])
+
+    def flush(self):
+        """Nothing is written; kept so the placer can treat this like a WriteBuffer."""
+
+    def edits(self) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+        """(coords (N, 3), block_index (N,), blockstates) for every recorded edit, in order, the blockstates as block_snbt strings."""
+        self._close_pending()
+        if not self._coords:
+            return np.zeros((0, 3), dtype=np.int64), np.zeros(0, dtype=np.int64), []
+        return np.concatenate(self._coords), np.concatenate(self._indices), list(self._blockstates)
+
+
+def run_to_completion(generator):
+    """Exhaust a generator, ignoring what it yields, and return its return value."""
+    while True:
+        try:
+            next(generator)
+        except StopIteration as stop:
+            return stop.value
+
+
+class PillarTemplate:
+    """
+    A construction file compiled for stamping.
+
+    ``offsets`` is an (N, 3) int array of block positions relative to the
+    template origin, ``block_index`` an (N,) array of indices into
+    ``blocks``, and ``blocks`` the de-duplicated Block objects.
+    """
+
+    __slots__ = ("offsets", "block_index", "blocks")
+
+    def __init__(self, offsets: np.ndarray, block_index: np.ndarray, blocks: list):
+        self.offsets = offsets
+        self.block_index = block_index
+        self.blocks = blocks
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+
+# Compiled templates by absolute path, with the file mtime they were compiled from
+_template_cache: Dict[str, Tuple[int, PillarTemplate]] = {}
+
+
+def load_template(path: str, compile_template: Callable[[str], PillarTemplate]) -> PillarTemplate:
+    """
+    Return the compiled template for a construction file.
+
+    The file is compiled with ``compile_template`` the first time it is
+    asked for and again only when its modification time changes.
+    """
+    path = os.path.abspath(path)
+    mtime = os.stat(path).st_mtime_ns
+    cached = _template_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    template = compile_template(path)
+    _template_cache[path] = (mtime, template)
+    return template
+
+
+class Codec:
+    """
+    Two-way mapping between values (usually strings) and small integer codes.
+
+    Values that have not been seen before are given the next free code, so a
+    codec never rejects a value the placer comes up with.
+    """
+
+    def __init__(self, values: Iterable = ()):
+        self.values: list = []
+        self.codes: dict = {}
+        for value in values:
+            self.encode(value)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def encode(self, value) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def decode(self, code: int):
+        return self.values[code]
+
+
+DIRECTIONS = Codec(("north", "south", "east", "west", "north_east", "north_west", "south_east", "south_west"))
+FACINGS = Codec(("north", "south", "east", "west", "wild", "unknown"))
+STATES = Codec(("cardinal", "corner", "diagonal", "transition", "skip"))
+USE_CASES = Codec(("standard_path", "overpass", "drop_pillar"))
+POSITIONS = Codec(("inner", "outer"))
+BALLAST_VALUES = Codec(("skip",))
+
+# The shared codecs by name, so a pickled table can find its codecs again
+SHARED_CODECS = {
+    "directions": DIRECTIONS,
+    "facings": FACINGS,
+    "states": STATES,
+    "use_cases": USE_CASES,
+    "positions": POSITIONS,
+    "ballast_values": BALLAST_VALUES,
+}
+
+# Stored in int columns in place of the 'NA' sentinel the dict records used
+NA = np.iinfo(np.int32).min
+STATUS_PREFIX = "solid block at y - "
+
+# Column kinds: an int column, a bool column, a Codec-coded column, or the
+# "solid block at y - N" status, stored as N
+INT, BOOL, STATUS = "int", "bool", "status"
+
+PATH_FIELDS = {
+    "x": INT, "y": INT, "z": INT, "count": INT,
+    "direction": DIRECTIONS, "origin_direction": DIRECTIONS, "facing": FACINGS,
+    "state": STATES, "b2b": BOOL, "use_case": USE_CASES,
+}
+BALLAST_FIELDS = {
+    "x": INT, "y": INT, "z": INT, "count": INT,
+    "direction": DIRECTIONS, "origin_direction": DIRECTIONS, "facing": FACINGS,
+    "b2b": BOOL, "position": POSITIONS, "state": STATES, "value": BALLAST_VALUES,
+}
+GROUND_FIELDS = {
+    "x": INT, "y": INT, "z": INT, "status": STATUS, "air_depth": INT, "water_depth": INT,
+    "count": INT, "iteration": INT,
+    "direction": DIRECTIONS, "origin_direction": DIRECTIONS, "facing": FACINGS,
+    "b2b": BOOL, "state": STATES,
+}
+CORE_GROUND_FIELDS = dict(GROUND_FIELDS, use_case=USE_CASES)
+# The marker wool of a route, in PathGraph order (kept for incremental rebuilds)
+MARKER_FIELDS = {"x": INT, "y": INT, "z": INT, "use_case": USE_CASES}
+# A CRC of the roadbase and rail blocks the world held at each path row when a route was cached
+BUILT_FIELDS = {"crc": INT}
+
+_COLUMN_DTYPES = {INT: np.int32, BOOL: np.bool_, STATUS: np.int32}
+
+
+class PathRow:
+    """Dict-style view of one row of a PathTable."""
+
+    __slots__ = ("table", "index")
+
+    def __init__(self, table: "PathTable", index: int):
+        self.table = table
+        self.index = index
+
+    def __getitem__(self, key: str):
+        return self.table.get_value(self.index, key)
+
+    def __setitem__(self, key: str, value):
+        self.table.set_value(self.index, key, value)
+
+    def __contains__(self, key) -> bool:
+        return key in self.table.fields
+
+    def __iter__(self):
+        return iter(self.table.fields)
+
+    def __len__(self) -> int:
+        return len(self.table.fields)
+
+    def keys(self):
+        return self.table.fields.keys()
+
+    def items(self):
+        return ((key, self[key]) for key in self.table.fields)
+
+    def get(self, key: str, default=None):
+        return self[key] if key in self.table.fields else default
+
+    def to_dict(self) -> dict:
+        return dict(self.items())
+
+    def __eq__(self, other):
+        if isinstance(other, PathRow):
+            other = other.to_dict()
+        return self.to_dict() == other
+
+    def __repr__(self):
+        return repr(self.to_dict())
+
+
+class PathTable:
+    """
+    Array backed list of path records.
+
+    Each field is a NumPy column: ints (with ``NA`` for 'NA'), bools, Codec
+    codes for the direction / facing / state style strings, and the ground
+    status stored as its depth.  Rows are appended and read as dicts, so code
+    written against lists of dicts keeps working, while the engines can work
+    on whole columns with ``column``.
+    """
+
+    def __init__(self, fields: Dict[str, object], capacity: int = 64):
+        self.fields = fields
+        self._size = 0
+        self._columns = {
+            name: np.zeros(capacity, dtype=_COLUMN_DTYPES.get(kind, np.uint16))
+            for name, kind in fields.items()
+        }
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self):
+        return (PathRow(self, i) for i in range(self._size))
+
+    def _index(self, index: int) -> int:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("PathTable index out of range")
+        return index
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [PathRow(self, i) for i in range(*index.indices(self._size))]
+        return PathRow(self, self._index(index))
+
+    def __setitem__(self, index: int, record: dict):
+        self._write_row(self._index(index), record)
+
+    def _grow(self, size: int):
+        capacity = len(next(iter(self._columns.values())))
+        if size > capacity:
+            capacity = max(size, capacity * 2)
+            for name, column in self._columns.items():
+                grown = np.zeros(capacity, dtype=column.dtype)
+                grown[: self._size] = column[: self._size]
+                self._columns[name] = grown
+
+    def _write_row(self, index: int, record: dict):
+        for name in self.fields:
+            self.set_value(index, name, record.get(name, "NA"))
+
+    def append(self, record: dict):
+        self._grow(self._size + 1)
+        self._size += 1
+        self._write_row(self._size - 1, record)
+
+    def extend(self, records: Iterable[dict]):
+        for record in records:
+            self.append(record)
+
+    def get_value(self, index: int, name: str):
+        kind = self.fields[name]
+        raw = self._columns[name][index]
+        if kind is BOOL:
+            return bool(raw)
+        if kind is INT:
+            return "NA" if raw == NA else int(raw)
+        if kind is STATUS:
+            return "NA" if raw == NA else STATUS_PREFIX + str(int(raw))
+        return kind.decode(int(raw))
+
+    def set_value(self, index: int, name: str, value):
+        kind = self.fields[name]
+        column = self._columns[name]
+        if kind is BOOL:
+            column[index] = value not in ("NA", None) and bool(value)
+        elif kind is INT:
+            column[index] = NA if value == "NA" or value is None else int(value)
+        elif kind is STATUS:
+            if value == "NA" or value is None:
+                column[index] = NA
+            elif isinstance(value, str) and value.startswith(STATUS_PREFIX):
+                column[index] = int(value[len(STATUS_PREFIX):])
+            else:
+                raise ValueError(f"Unsupported ground status {value!r}")
+        else:
+            column[index] = kind.encode(value)
+
+    def column(self, name: str) -> np.ndarray:
+        """The raw column for a field (codes for coded fields, NA for 'NA')."""
+        return self._columns[name][: self._size]
+
+    def codes(self, name: str, value) -> int:
+        """The code a coded field stores for a value."""
+        return self.fields[name].encode(value)
+
+    @classmethod
+    def from_columns(cls, fields: Dict[str, object], columns: Dict[str, np.ndarray]) -> "PathTable":
+        """Build a table from raw columns of equal length (missing fields are NA / 0)."""
+        size = len(next(iter(columns.values()))) if columns else 0
+        table = cls(fields, capacity=max(size, 1))
+        table._size = size
+        for name, kind in fields.items():
+            if name in columns:
+                table._columns[name][:size] = columns[name]
+            elif kind is INT or kind is STATUS:
+                table._columns[name][:size] = NA
+        return table
+
+    def take(self, rows) -> "PathTable":
+        """A new table of the given rows (a slice, index array or bool mask)."""
+        return PathTable.from_columns(self.fields, {name: self.column(name)[rows] for name in self.fields})
+
+    @classmethod
+    def concat(cls, fields: Dict[str, object], tables: Iterable["PathTable"]) -> "PathTable":
+        """One table of the rows of several tables with the same fields, in order."""
+        tables = list(tables)
+        return cls.from_columns(fields, {
+            name: np.concatenate([table.column(name) for table in tables]) if tables else np.zeros(0, dtype=_COLUMN_DTYPES.get(kind, np.uint16))
+            for name, kind in fields.items()
+        })
+
+    def to_dicts(self) -> List[dict]:
+        """The table as a list of plain dicts, e.g. for json.dump."""
+        return [row.to_dict() for row in self]
+
+    def to_arrays(self) -> Tuple[Dict[str, object], Dict[str, np.ndarray]]:
+        """The table as a JSON-able field description and a dict of plain arrays, e.g. for np.savez."""
+        state = self.__getstate__()
+        fields = {name: list(kind) if isinstance(kind, tuple) else kind for name, kind in state["fields"].items()}
+        return fields, state["columns"]
+
+    @classmethod
+    def from_arrays(cls, fields: Dict[str, object], columns: Dict[str, np.ndarray]) -> "PathTable":
+        """Rebuild a table from what ``to_arrays`` returned."""
+        table = cls.__new__(cls)
+        table.__setstate__({
+            "fields": {name: tuple(kind) if isinstance(kind, list) else kind for name, kind in fields.items()},
+            "columns": {name: np.asarray(column) for name, column in columns.items()},
+        })
+        return table
+
+    def __getstate__(self):
+        # Tables are pickled when routes are planned in other processes.  Each
+        # process has its own copy of the shared codecs, and a codec hands out
+        # new codes as it meets new values, so coded columns travel with the
+        # values their codes stand for and are re-encoded on arrival.
+        codec_names = {id(codec): name for name, codec in SHARED_CODECS.items()}
+        fields = {}
+        for name, kind in self.fields.items():
+            if isinstance(kind, Codec):
+                fields[name] = (codec_names[id(kind)], list(kind.values))
+            else:
+                fields[name] = kind
+        return {
+            "fields": fields,
+            "columns": {name: column[: self._size].copy() for name, column in self._columns.items()},
+        }
+
+    def __setstate__(self, state):
+        kinds = {INT: INT, BOOL: BOOL, STATUS: STATUS}
+        self.fields = {}
+        self._columns = {}
+        for name, kind in state["fields"].items():
+            column = state["columns"][name]
+            if isinstance(kind, tuple):
+                codec = SHARED_CODECS[kind[0]]
+                codes = np.array([codec.encode(value) for value in kind[1]], dtype=column.dtype)
+                self.fields[name] = codec
+                self._columns[name] = codes[column]
+            else:
+                self.fields[name] = kinds[kind]
+                self._columns[name] = column
+        self._size = len(next(iter(self._columns.values()))) if self._columns else 0
+        if self._size == 0:
+            self._grow(1)
+
+    def __repr__(self):
+        return repr(self.to_dicts())
+
+
+# Span types, in the order place_supports tests for them
+SPAN_TYPES = (
+    "None", "Air_Bridge", "Water_Bridge", "Dual_Bridge", "Diagonal_Bridge",
+    "Inner_Cribbing", "Outer_Cribbing", "Dual_Cribbing", "Solid",
+)
+(
+    SPAN_NONE, SPAN_AIR_BRIDGE, SPAN_WATER_BRIDGE, SPAN_DUAL_BRIDGE, SPAN_DIAGONAL_BRIDGE,
+    SPAN_INNER_CRIBBING, SPAN_OUTER_CRIBBING, SPAN_DUAL_CRIBBING, SPAN_SOLID,
+) = range(len(SPAN_TYPES))
+# Span types that carry on each other's spans share a family (the three bridges do)
+_SPAN_FAMILY = np.array([0, 1, 1, 1, 2, 3, 4, 5, 6])
+
+# Where each ground table sits across the roadbed
+POSITION_INNER, POSITION_CORE, POSITION_OUTER = 0, 1, 2
+
+# Cribbing deeper than this gets a single underpinning block instead
+MAX_CRIBBING_DEPTH = 8
+
+
+class SpanAnalysis:
+    """
+    Support spans of a route, worked out from its three ground tables.
+
+    Every path index ("count") is classified from per-count aggregates of
+    the inner, core and outer columns, and spans are found with one
+    run-length pass over the classifications.
+
+    ``span_type`` and ``span_number`` are per count (``counts`` holds the
+    count values), ``run_starts``, ``run_lengths`` and ``run_types`` describe
+    each span, and ``support_columns`` gives the blocks to place.
+    """
+
+    def __init__(self, inner: PathTable, core: PathTable, outer: PathTable):
+        tables = (inner, core, outer)
+        self.core = core
+        self.count = np.concatenate([table.column('count') for table in tables]).astype(np.int64)
+        self.position = np.concatenate([np.full(len(table), position) for position, table in enumerate(tables)])
+
+        def stacked(name: str) -> np.ndarray:
+            values = np.concatenate([table.column(name) for table in tables]).astype(np.int64)
+            return np.where(values == NA, 0, values)
+
+        self.x, self.y, self.z = stacked('x'), stacked('y'), stacked('z')
+        self.air, self.water = stacked('air_depth'), stacked('water_depth')
+        self.skip = np.concatenate([table.column('state') == table.codes('state', 'skip') for table in tables])
+        state = np.concatenate([table.column('state') for table in tables])
+        diagonal = (state == STATES.encode('diagonal')) | (state == STATES.encode('corner'))
+        use_case = np.full(len(self.count), -1, dtype=np.int64)
+        use_case[self.position == POSITION_CORE] = core.column('use_case')
+
+        self.counts, self.count_index = np.unique(self.count, return_inverse=True)
+        self.count_index = self.count_index.reshape(-1)
+        n = len(self.counts)
+
+        def any_(mask: np.ndarray) -> np.ndarray:
+            return np.bincount(self.count_index[mask], minlength=n) > 0
+
+        probed = ~self.skip
+        is_pillar = any_(use_case == USE_CASES.encode('drop_pillar'))
+        is_overpass = any_(use_case == USE_CASES.encode('overpass'))
+        all_air = ~any_(probed & (self.air <= 0))
+        all_water = ~any_(probed & (self.water <= 0))
+        inner_air = any_((self.position == POSITION_INNER) & probed & (self.air > 0))
+        outer_air = any_((self.position == POSITION_OUTER) & probed & (self.air > 0))
+        self.span_type = np.select(
+            [
+                is_pillar,
+                all_air | is_overpass,
+                any_(self.skip) & all_water,
+                ~any_(self.air <= 0) & ~any_(self.water <= 0),
+                any_(diagonal),
+                inner_air & outer_air,
+                inner_air,
+                outer_air,
+            ],
+            [
+                SPAN_NONE, SPAN_AIR_BRIDGE, SPAN_WATER_BRIDGE, SPAN_DUAL_BRIDGE, SPAN_DIAGONAL_BRIDGE,
+                SPAN_DUAL_CRIBBING, SPAN_INNER_CRIBBING, SPAN_OUTER_CRIBBING,
+            ],
+            SPAN_SOLID,
+        )
+
+        # A span starts wherever the family changes.  Pillar counts are not
+        # part of any span and the numbering starts again at 1 after one.
+        family = _SPAN_FAMILY[self.span_type]
+        no_span = self.span_type == SPAN_NONE
+        run_start = (family != np.concatenate(([-1], family[:-1]))) & ~no_span
+        started = np.cumsum(run_start)
+        self.span_number = np.where(no_span, 0, started - np.maximum.accumulate(np.where(no_span, started, 0)))
+        self.run_starts = np.flatnonzero(run_start)
+        self.run_lengths = np.bincount(started[~no_span], minlength=len(self.run_starts) + 1)[1:]
+        self.run_types = self.span_type[self.run_starts]
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """How many spans, and how many path counts, there are of each span type."""
+        spans = np.bincount(self.run_types, minlength=len(SPAN_TYPES))
+        counts = np.bincount(self.span_type, minlength=len(SPAN_TYPES))
+        return {name: {'spans': int(spans[i]), 'counts': int(counts[i])} for i, name in enumerate(SPAN_TYPES)}
+
+    def span_window(self, first: int, last: int) -> Tuple[int, int]:
+        """Widen the counts first..last - 1 so they start and end on span boundaries."""
+        lo = int(np.searchsorted(self.counts, first))
+        hi = int(np.searchsorted(self.counts, last))
+        if lo >= hi:
+            return first, last
+        run_ends = self.run_starts + self.run_lengths
+        touched = (self.run_starts < hi) & (run_ends > lo)
+        if touched.any():
+            lo = min(lo, int(self.run_starts[touched].min()))
+            hi = max(hi, int(run_ends[touched].max()))
+        return int(self.counts[lo]), int(self.counts[hi - 1]) + 1
+
+    def support_locations(self, window: Optional[Tuple[int, int]] = None) -> List[dict]:
+        """
+        The core columns of every pillar count, in the format loop_operation stamps pillars from.
+
+        ``window`` limits them to the counts first..last - 1.
+        """
+        locations = []
+        core_rows = np.flatnonzero(self.position == POSITION_CORE)
+        core_count_index = self.count_index[core_rows]
+        facing = self.core.column('facing')
+        pillars = self.span_type == SPAN_NONE
+        if window is not None:
+            pillars &= (self.counts >= window[0]) & (self.counts < window[1])
+        for k in np.flatnonzero(pillars).tolist():
+            rows = np.flatnonzero(core_count_index == k)
+            table_rows = core_rows[rows] - core_rows[0]
+            locations.append({
+                'x': self.x[core_rows[rows]].tolist(),
+                'y': self.y[core_rows[rows]].tolist(),
+                'z': self.z[core_rows[rows]].tolist(),
+                'air_depth': self.air[core_rows[rows]].tolist(),
+                'water_depth': self.water[core_rows[rows]].tolist(),
+                'facing': [FACINGS.decode(int(code)) for code in facing[table_rows]],
+            })
+        return locations
+
+    def support_columns(self, window: Optional[Tuple[int, int]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        The cribbing and underpinning blocks for the route, or for the counts
+        first..last - 1 of it if a ``window`` is given.
+
+        Returns an (M, 3) coordinate array and an (M,) array that is 0 for
+        cribbing and 1 for underpinning.  Rows come out grouped by span number
+        (in order of first appearance) and then by count, the order the blocks
+        were placed in before, so overlapping columns resolve the same way.
+        """
+        span_type = self.span_type[self.count_index]
+        position = self.position
+        cribbing = ~self.skip & (
+            ((span_type == SPAN_INNER_CRIBBING) & (position == POSITION_INNER))
+            | ((span_type == SPAN_OUTER_CRIBBING) & (position == POSITION_OUTER))
+            | ((span_type == SPAN_DUAL_CRIBBING) & (position != POSITION_CORE))
+        )
+        bridge = ~self.skip & np.isin(span_type, (SPAN_AIR_BRIDGE, SPAN_WATER_BRIDGE, SPAN_DUAL_BRIDGE, SPAN_DIAGONAL_BRIDGE))
+        underpinning = bridge | (cribbing & (self.air > MAX_CRIBBING_DEPTH))
+        filled = cribbing & ~underpinning
+
+        top = self.y + self.air + self.water - 1
+        # Water bridges have always measured the water depth twice
+        top = np.where(span_type == SPAN_WATER_BRIDGE, self.y + 2 * self.water - 1, top)
+        start_y = np.where(underpinning, top, self.y)
+        lengths = np.where(underpinning, 1, np.where(filled, self.air + self.water, 0))
+        if window is not None:
+            lengths = np.where((self.count >= window[0]) & (self.count < window[1]), lengths, 0)
+
+        span_number = self.span_number[self.count_index]
+        _, first_seen = np.unique(self.span_number, return_index=True)
+        group_rank = np.empty(len(first_seen), dtype=np.int64)
+        group_rank[np.argsort(first_seen, kind='stable')] = np.arange(len(first_seen))
+        order = np.lexsort((self.count_index, group_rank[np.searchsorted(np.unique(self.span_number), span_number)]))
+        order = order[lengths[order] > 0]
+
+        rows = np.repeat(order, lengths[order])
+        run_offset = np.repeat(np.cumsum(lengths[order]) - lengths[order], lengths[order])
+        step = np.arange(len(rows)) - run_offset
+        coords = np.stack((self.x[rows], start_y[rows] + step, self.z[rows]), axis=1)
+        return coords, underpinning[rows].astype(np.int64)
+
+
+# Progress reporting.  Amulet runs an operation that is a generator inside a
+# progress dialog: every yielded (fraction, message) updates the dialog, and
+# cancelling the dialog stops the generator at its next yield.  The
+# WriteBuffer is flushed at each yield, so only the writes of one window are
+# ever staged.  The route's path, ballast and ground tables are still kept
+# whole (the supports are worked out over all of them), and a run that writes
+# as it goes keeps whatever it wrote before a cancel (see
+# RailBuilder.build_railroad).
+
+# Path blocks handled between two progress updates (and two buffer flushes)
+PROGRESS_WINDOW = 256
+
+# The share of the progress bar given to each phase, in run order
+PHASES = (
+    ("trace", "Tracing path", 0.20),
+    ("rails", "Placing rails", 0.15),
+    ("ballast", "Placing ballast", 0.25),
+    ("ground", "Probing for solid ground", 0.10),
+    ("supports", "Placing supports", 0.10),
+    ("pillars", "Placing pillars", 0.20),
+)
+
+
+def phase_progress(phase: str, done: int = 0, total: int = 0) -> Tuple[float, str]:
+    """The (fraction, message) pair to yield after `done` of `total` items of a phase."""
+    start = 0.0
+    for name, label, share in PHASES:
+        if name == phase:
+            break
+        start += share
+    else:
+        raise KeyError(phase)
+    if total > 0:
+        return start + share * min(done / total, 1.0), f"{label} ({done}/{total})"
+    return start, label
+
+
+def windows(total: int, size: int = PROGRESS_WINDOW, first: int = 0) -> Iterable[Tuple[int, int]]:
+    """Split range(first, total) into consecutive (start, stop) windows of at most `size` items."""
+    for start in range(first, total, size):
+        yield start, min(start + size, total)
+
+
+# Progress labels of the steps outside PHASES, for phase_of
+APPLY_LABEL = "Applying planned edits"
+_PHASE_LABELS = tuple((label, name) for name, label, _ in PHASES) + ((APPLY_LABEL, "apply"),)
+
+
+def phase_of(message: str) -> Optional[str]:
+    """The phase a progress message belongs to, or None.  "Route n/N: " prefixes are ignored."""
+    if message.startswith("Route ") and ": " in message:
+        message = message.split(": ", 1)[1]
+    for label, name in _PHASE_LABELS:
+        if message.startswith(label):
+            return name
+    return None
+
+
+class InstrumentedWorld:
+    """
+    A world wrapper that counts what the pipeline asks of the world.
+
+    Every attribute is passed through to the wrapped world.  Calls to
+    get_block, set_version_block(s), get_chunk, create_chunk and
+    get_chunk_slice_box are counted, along with the chunks they touch, in the
+    RunProfile's current phase.  Attributes the wrapped world lacks stay
+    missing, so has_chunks sees through the wrapper.
+    """
+
+    def __init__(self, world, profile: "RunProfile"):
+        self._world = world
+        self._profile = profile
+
+    def __getattr__(self, name):
+        attr = getattr(self._world, name)
+        if name not in _COUNTED_CALLS:
+            return attr
+        chunks_of = _COUNTED_CALLS[name]
+        profile = self._profile
+
+        def counted(*args, **kwargs):
+            stats = profile.current
+            stats[name] = stats.get(name, 0) + 1
+            result = attr(*args, **kwargs)
+            if chunks_of is None:
+                return _counted_slices(result, stats)
+            stats["chunks"].update(chunks_of(args))
+            return result
+
+        # Cached on the wrapper, so later calls skip __getattr__
+        self.__dict__[name] = counted
+        return counted
+
+
+def _counted_slices(slices, stats):
+    """Pass get_chunk_slice_box through, noting each chunk it hands out."""
+    for chunk, chunk_slices, box in slices:
+        stats["chunks"].add((chunk.cx, chunk.cz))
+        yield chunk, chunk_slices, box
+
+
+def _block_chunks(args):
+    return ((int(args[0]) >> 4, int(args[2]) >> 4),)
+
+
+def _array_chunks(args):
+    coords = np.asarray(args[0], dtype=np.int64).reshape(-1, 3)
+    return map(tuple, np.unique(coords[:, [0, 2]] >> 4, axis=0).tolist())
+
+
+def _chunk_chunks(args):
+    return ((int(args[0]), int(args[1])),)
+
+
+# The calls InstrumentedWorld counts, and how to find the chunks each touches
+# from its arguments (get_chunk_slice_box is followed as it is iterated)
+_COUNTED_CALLS = {
+    "get_block": _block_chunks,
+    "set_version_block": _block_chunks,
+    "set_version_blocks": _array_chunks,
+    "get_chunk": _chunk_chunks,
+    "create_chunk": _chunk_chunks,
+    "get_chunk_slice_box": None,
+}
+PROFILE_COUNTERS = ("get_block", "set_version_block", "set_version_blocks", "get_chunk", "create_chunk", "get_chunk_slice_box")
+
+
+class RunProfile:
+    """
+    Per phase timings and world access counts of one run.
+
+    Hand ``profile.world`` to the pipeline instead of the world, and drive the
+    pipeline's generator through ``profile.run``.  The time and calls between
+    two progress updates go to the phase of the first one; whatever happens
+    before the first update (reading the selection and the route) is the
+    "scan" phase.  Nothing is wrapped or counted unless a RunProfile is made,
+    so a run without one costs nothing extra.
+    """
+
+    def __init__(self, world):
+        self.world = InstrumentedWorld(world, self)
+        self.phases: Dict[str, dict] = {}
+        self.seconds = 0.0
+        self.current = self._phase("scan")
+
+    def _phase(self, name: str) -> dict:
+        stats = self.phases.get(name)
+        if stats is None:
+            stats = self.phases[name] = {"seconds": 0.0, "chunks": set()}
+        return stats
+
+    def run(self, operation):
+        """Drive a pipeline generator, passing its progress through.  Returns what it returns."""
+        while True:
+            mark = time.perf_counter()
+            try:
+                progress = next(operation)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                # Only the pipeline's own time counts, not the time spent showing its progress
+                elapsed = time.perf_counter() - mark
+                self.current["seconds"] += elapsed
+                self.seconds += elapsed
+            phase = phase_of(progress[1])
+            if phase is not None:
+                self.current = self._phase(phase)
+            yield progress
+
+    def summary(self) -> dict:
+        """The profile as plain JSON-ready data."""
+        phases = {}
+        touched: Set[Tuple[int, int]] = set()
+        for name, stats in self.phases.items():
+            touched |= stats["chunks"]
+            phases[name] = dict(
+                {"seconds": round(stats["seconds"], 6)},
+                **{counter: stats.get(counter, 0) for counter in PROFILE_COUNTERS},
+                chunks=len(stats["chunks"]),
+            )
+        return {"seconds": round(self.seconds, 6), "chunks": len(touched), "phases": phases}
+
+    def table(self) -> str:
+        """The profile as a console table, one line per phase."""
+        summary = self.summary()
+        lines = [f"{'phase':<10} {'seconds':>9} {'get_block':>10} {'set_block':>10} {'get_chunk':>10} {'chunks':>7}"]
+        for name, stats in summary["phases"].items():
+            lines.append(
+                f"{name:<10} {stats['seconds']:>9.3f} {stats['get_block']:>10} "
+                f"{stats['set_version_block'] + stats['set_version_blocks']:>10} {stats['get_chunk']:>10} {stats['chunks']:>7}"
+            )
+        lines.append(f"{'total':<10} {summary['seconds']:>9.3f} {'':>10} {'':>10} {'':>10} {summary['chunks']:>7}")
+        return "\n".join(lines)
+
+    def save(self, path: str):
+        """Write the summary to ``path`` as JSON."""
+        with open(path, "w") as f:
+            json.dump(self.summary(), f, indent=2)
+
+
+def profile_path(level_path: str) -> str:
+    """Where the profile of a run on the world at ``level_path`` is saved: next to the world, named after it."""
+    return f"{os.path.normpath(level_path)}.rail_profile.json"
+
+
+def _merge_along(boxes: np.ndarray, axis: int) -> np.ndarray:
+    """Merge (K, 6) min/max boxes that share their extent on the other two axes and touch along ``axis``."""
+    a, b = [other for other in range(3) if other != axis]
+    order = np.lexsort((boxes[:, axis], boxes[:, b + 3], boxes[:, b], boxes[:, a + 3], boxes[:, a]))
+    boxes = boxes[order]
+    same = np.all(boxes[1:, [a, b, a + 3, b + 3]] == boxes[:-1, [a, b, a + 3, b + 3]], axis=1)
+    joined = same & (boxes[1:, axis] == boxes[:-1, axis + 3])
+    starts = np.flatnonzero(np.concatenate(([True], ~joined)))
+    ends = np.concatenate((starts[1:], [len(boxes)])) - 1
+    merged = boxes[starts]
+    merged[:, axis + 3] = boxes[ends, axis + 3]
+    return merged
+
+
+def merge_voxel_boxes(coords: np.ndarray) -> np.ndarray:
+    """
+    Cover a set of voxels with a few boxes.
+
+    Voxels are joined into runs along X, runs with the same X extent into
+    rectangles along Z, and rectangles with the same extent into boxes along
+    Y.  Returns a (K, 6) int array of (min x, min y, min z, max x, max y,
+    max z), max exclusive, the way SelectionBox takes them.
+    """
+    coords = np.unique(np.asarray(coords, dtype=np.int64).reshape(-1, 3), axis=0)
+    if not len(coords):
+        return np.zeros((0, 6), dtype=np.int64)
+    coords = coords[np.lexsort((coords[:, 0], coords[:, 2], coords[:, 1]))]
+    x, y, z = coords.T
+    run_start = np.concatenate(([True], (y[1:] != y[:-1]) | (z[1:] != z[:-1]) | (x[1:] != x[:-1] + 1)))
+    starts = np.flatnonzero(run_start)
+    ends = np.concatenate((starts[1:], [len(coords)])) - 1
+    boxes = np.stack((x[starts], y[starts], z[starts], x[ends] + 1, y[starts] + 1, z[starts] + 1), axis=1)
+    return _merge_along(_merge_along(boxes, 2), 1)
+
+
+def edit_voxel_classes(world, version, blockstates: List[str]) -> np.ndarray:
+    """The VOXEL_* class of each recorded (version) blockstate, once translated to universal."""
+    translator = world.translation_manager.get_version(*version).block
+    return np.array(
+        [classify_blockstate(translator.to_universal(snbt_block(blockstate))[0].blockstate) for blockstate in blockstates],
+        dtype=np.uint8,
+    )
+
+
+class EditPlan:
+    """
+    Every edit a Build_Railroad run would make, worked out without touching the world.
+
+    Edits are kept per stage, in the order they would be made: the marker
+    wool turned to cobblestone, the track (roadbase, rails and ballast) and
+    the supports (cribbing, underpinning and pillars).  Each route's path,
+    ballast and ground tables are kept too, so the supports can be planned
+    again with other choices without tracing the route again.
+
+    A plan saves to one compressed .npz file, previews as merged selection
+    boxes, and is written to a world in one bulk commit with ``apply``.
+    ``completed`` lists the phases that are fully planned, which is what lets
+    a saved plan serve as a checkpoint.
+    """
+
+    STAGES = ("markers", "track", "supports")
+    # 2: blocks are kept as SNBT blockstates, with every property
+    FORMAT = 2
+
+    def __init__(self, platform: str, version, dimension, options: Optional[dict] = None):
+        self.platform = platform
+        self.version = level_version(version)
+        self.dimension = dimension
+        self.options = dict(options or {})
+        self.stages: Dict[str, EditRecorder] = {name: EditRecorder(platform, self.version) for name in self.STAGES}
+        self.routes: List[Dict[str, PathTable]] = []
+        self.support_locations: List[dict] = []
+        self.span_stats: Dict[str, Dict[str, int]] = {}
+        self.completed: List[str] = []
+        # Where this plan is checkpointed, if it is (not saved with the plan)
+        self.checkpoint: Optional[str] = None
+
+    def __len__(self) -> int:
+        return sum(len(recorder) for recorder in self.stages.values())
+
+    def reset_supports(self):
+        """Forget the planned ground probe and supports, before planning them again."""
+        self.stages["supports"] = EditRecorder(self.platform, self.version)
+        self.support_locations = []
+        self.span_stats = {}
+        for route in self.routes:
+            for table_name in ("ground_inner", "ground_core", "ground_outer"):
+                route.pop(table_name, None)
+        if "supports" in self.completed:
+            self.completed.remove("supports")
+
+    def add_span_stats(self, stats: Dict[str, Dict[str, int]]):
+        for name, values in stats.items():
+            totals = self.span_stats.setdefault(name, {key: 0 for key in values})
+            for key, value in values.items():
+                totals[key] += value
+
+    def edits(self, stages: Iterable[str] = STAGES) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+        """The edits of the given stages, in order, as one (coords, block_index, blockstates) set."""
+        combined = EditRecorder(self.platform, self.version)
+        for name in stages:
+            combined.extend(*self.stages[name].edits())
+        return combined.edits()
+
+    def overlay(self, world, stages: Iterable[str] = STAGES) -> Tuple[np.ndarray, np.ndarray]:
+        """The planned edits as a probe_column_depths overlay."""
+        coords, block_index, blockstates = self.edits(stages)
+        if not blockstates:
+            return coords, np.zeros(0, dtype=np.uint8)
+        return coords, edit_voxel_classes(world, (self.platform, self.version), blockstates)[block_index]
+
+    def preview_boxes(self, stages: Iterable[str] = STAGES) -> np.ndarray:
+        """Every voxel the plan edits, merged into (K, 6) min/max boxes."""
+        return merge_voxel_boxes(self.edits(stages)[0])
+
+    def selection_group(self, stages: Iterable[str] = STAGES):
+        """The preview boxes as a SelectionGroup, to show the plan in the editor."""
+        from amulet.api.selection import SelectionBox, SelectionGroup
+
+        return SelectionGroup([SelectionBox(box[:3], box[3:]) for box in self.preview_boxes(stages).tolist()])
+
+    def apply(self, world) -> int:
+        """Make every planned edit in one bulk write.  Returns the number of edits."""
+        coords, block_index, blockstates = self.edits()
+        buffer = WriteBuffer(world)
+        buffer.set_version_blocks(coords, self.dimension, (self.platform, self.version), [snbt_block(blockstate) for blockstate in blockstates], block_index)
+        buffer.flush()
+        return len(coords)
+
+    def save(self, path: str):
+        """
+        Save the plan with np.savez_compressed, adding ".npz" to the path if it is missing.
+
+        The file is written under another name and then moved into place, so
+        a crash while saving a checkpoint never leaves a broken one behind.
+        """
+        arrays = {}
+        for name, recorder in self.stages.items():
+            coords, block_index, blockstates = recorder.edits()
+            arrays[f"{name}.coords"] = coords.astype(np.int32)
+            arrays[f"{name}.index"] = block_index.astype(np.int32)
+            arrays[f"{name}.blockstates"] = np.array(blockstates, dtype=str)
+        routes = []
+        for route_number, route in enumerate(self.routes):
+            fields = {}
+            for table_name, table in route.items():
+                fields[table_name], columns = table.to_arrays()
+                for column_name, column in columns.items():
+                    arrays[f"route{route_number}.{table_name}.{column_name}"] = column
+            routes.append(fields)
+        meta = {
+            "format": self.FORMAT,
+            "platform": self.platform,
+            "version": list(self.version) if isinstance(self.version, tuple) else self.version,
+            "dimension": self.dimension,
+            "options": self.options,
+            "routes": routes,
+            "support_locations": self.support_locations,
+            "span_stats": self.span_stats,
+            "completed": self.completed,
+        }
+        arrays["meta"] = np.array(json.dumps(meta))
+        if not path.endswith(".npz"):
+            path += ".npz"
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        partial = path[:-len(".npz")] + ".partial.npz"
+        np.savez_compressed(partial, **arrays)
+        os.replace(partial, path)
+
+    @classmethod
+    def load(cls, path: str) -> "EditPlan":
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            if meta.get("format") != cls.FORMAT:
+                raise ValueError(f"{path} is not a rail placer edit plan this version can read")
+            plan = cls(meta["platform"], meta["version"], meta["dimension"], meta["options"])
+            for name in cls.STAGES:
+                plan.stages[name].extend(data[f"{name}.coords"], data[f"{name}.index"], data[f"{name}.blockstates"].tolist())
+            for route_number, route_fields in enumerate(meta["routes"]):
+                plan.routes.append({
+                    table_name: PathTable.from_arrays(fields, {column_name: data[f"route{route_number}.{table_name}.{column_name}"] for column_name in fields})
+                    for table_name, fields in route_fields.items()
+                })
+            plan.support_locations = meta["support_locations"]
+            plan.span_stats = meta["span_stats"]
+            plan.completed = meta.get("completed", [])
+        return plan
+
+    def summary(self) -> str:
+        """One line per stage and span type, for the console."""
+        lines = [f"Edit plan: {len(self)} edits in {len(self.preview_boxes())} boxes over {len(self.routes)} route(s)"]
+        for name, recorder in self.stages.items():
+            lines.append(f"  {name}: {len(recorder)} edits")
+        for name, values in self.span_stats.items():
+            if values.get("counts"):
+                lines.append(f"  {name}: {values['spans']} spans, {values['counts']} path blocks")
+        lines.append(f"  pillars: {len(self.support_locations)}")
+        return "\n".join(lines)
+
+
+def _world_key(world, dimension) -> dict:
+    """What tells one world and dimension from another, for the names of saved plans."""
+    wrapper = world.level_wrapper
+    return {
+        "world": os.path.abspath(str(getattr(wrapper, "path", ""))),
+        "platform": wrapper.platform,
+        "version": [int(part) for part in wrapper.version] if isinstance(wrapper.version, (tuple, list)) else wrapper.version,
+        "dimension": str(dimension),
+    }
+
+
+def checkpoint_path(directory: str, world, dimension, selection_group, markers: List[list], options: dict) -> str:
+    """
+    The checkpoint file of a planned run.
+
+    The name is a hash of the world (its path, platform and version), the
+    dimension, the selection boxes, the markers found in them and the options
+    that shape the track.  A rerun of the same build finds the checkpoint, and
+    a change to any of them starts afresh.
+    """
+    key = dict(
+        _world_key(world, dimension),
+        selection=[[[int(v) for v in box.min], [int(v) for v in box.max]] for box in selection_group.selection_boxes],
+        markers=markers,
+        options=options,
+    )
+    digest = hashlib.sha1(json.dumps(key, sort_keys=True).encode("utf-8")).hexdigest()[:20]
+    return os.path.join(directory, f"rail_placer_{digest}.npz")
+
+
+def load_checkpoint(path: str) -> Optional[EditPlan]:
+    """
+    The plan checkpointed at ``path``, or None if there is none.
+
+    A checkpoint that cannot be read, such as one saved in an older plan
+    format whose blocks lost their properties, is removed so the run starts
+    over instead of resuming from it.
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        plan = EditPlan.load(path)
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning('Discarding unreadable checkpoint %s: %s', path, e)
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        return None
+    plan.checkpoint = path
+    return plan
+
+
+def discard_checkpoint(plan: EditPlan):
+    """Remove a plan's checkpoint once the plan has been applied."""
+    if plan.checkpoint is not None and os.path.exists(plan.checkpoint):
+        os.remove(plan.checkpoint)
+    plan.checkpoint = None
+
+
+# Incremental rebuilds.  The plan of the last run on a world is kept in a
+# RouteCache.  A later run traces each route again, finds the stretch of its
+# path that changed and plans only that stretch, splicing the new rows into
+# the cached path, ballast and ground tables.
+
+# Path rows either side of a changed stretch that are laid again.  The
+# ballast looks a block or two behind and ahead, and the margin leaves room
+# for that.
+REBUILD_MARGIN = 4
+
+
+def changed_window(old: PathTable, new: PathTable, margin: int = REBUILD_MARGIN, stale: Iterable[int] = ()) -> Optional[Tuple[int, int, int]]:
+    """
+    The stretch of a re-traced path that differs from the cached path.
+
+    Rows are compared on every field but 'count'.  ``stale`` are rows of the
+    new path that trace the same but have to be laid again all the same (the
+    world no longer holds them as they were built).  Returns None when the
+    two paths are the same and nothing is stale, or (first, old_last,
+    new_last): rows first..old_last - 1 of the old path became rows
+    first..new_last - 1 of the new one, with ``margin`` rows either side
+    included.
+    """
+    names = [name for name in new.fields if name != "count"]
+
+    def rows(table: PathTable) -> np.ndarray:
+        return np.stack([table.column(name).astype(np.int64) for name in names], axis=1).reshape(len(table), len(names))
+
+    old_rows, new_rows = rows(old), rows(new)
+    shortest = min(len(old_rows), len(new_rows))
+    same = np.all(old_rows[:shortest] == new_rows[:shortest], axis=1)
+    prefix = shortest if same.all() else int(np.argmin(same))
+    stale = sorted(stale)
+    if prefix == len(old_rows) == len(new_rows) and not stale:
+        return None
+    tail = shortest - prefix
+    same = np.all(old_rows[len(old_rows) - tail:][::-1] == new_rows[len(new_rows) - tail:][::-1], axis=1)
+    suffix = tail if same.all() else int(np.argmin(same))
+    changed_first, changed_last = prefix, len(new_rows) - suffix
+    if stale:
+        changed_first, changed_last = min(changed_first, stale[0]), max(changed_last, stale[-1] + 1)
+    first = max(0, changed_first - margin)
+    new_last = min(len(new_rows), changed_last + margin)
+    return first, new_last - (len(new_rows) - len(old_rows)), new_last
+
+
+def splice_rows(old: PathTable, rows: PathTable, first: int, old_last: int, new_last: int) -> PathTable:
+    """
+    Replace the rows of a cached ballast or ground table whose 'count' is in first..old_last - 1.
+
+    ``rows`` are the new rows for the window; the old rows past it have their
+    count moved on by the change in path length.
+    """
+    count = old.column('count')
+    after = old.take(count >= old_last)
+    after.column('count')[:] += new_last - old_last
+    return PathTable.concat(old.fields, (old.take(count < first), rows, after))
+
+
+def known_depths(blocks: PathTable, old_blocks: PathTable, old_ground: PathTable) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    The air and water depths of the rows of ``blocks`` an earlier run already probed.
+
+    ``old_blocks`` are the earlier run's path or ballast rows and
+    ``old_ground`` the ground rows find_solid_ground made from them, row for
+    row.  A row is known when a probed old row had the same x, y and z.
+    Returns (known, air_depth, water_depth), with the raw depths
+    probe_column_depths would give.
+    """
+    known = np.zeros(len(blocks), dtype=bool)
+    air_depth = np.zeros(len(blocks), dtype=np.int64)
+    water_depth = np.zeros(len(blocks), dtype=np.int64)
+    probed = np.flatnonzero(old_blocks.column('state') != old_blocks.codes('state', 'skip'))
+    old_columns = np.stack([old_blocks.column(name) for name in ('x', 'y', 'z')], axis=1)[probed].tolist()
+    old_row = {tuple(coord): row for coord, row in zip(old_columns, probed.tolist())}
+    old_air, old_bottom = old_ground.column('air_depth'), old_ground.column('y')
+    skip = blocks.column('state') == blocks.codes('state', 'skip')
+    for i, coord in enumerate(np.stack([blocks.column(name) for name in ('x', 'y', 'z')], axis=1).tolist()):
+        row = old_row.get(tuple(coord))
+        if row is None or skip[i]:
+            continue
+        known[i] = True
+        air_depth[i] = old_air[row]
+        # The ground table reports one water block less in some columns, its y does not
+        water_depth[i] = coord[1] - int(old_bottom[row]) - air_depth[i]
+    return known, air_depth, water_depth
+
+
+def renumber_iterations(table: PathTable):
+    """Number the probed rows of a spliced ground table again, as solid_ground_records does."""
+    probed = (table.column('state') != table.codes('state', 'skip')).astype(np.int64)
+    table.column('iteration')[:] = np.cumsum(probed) - probed
+
+
+def built_fingerprints(world, dimension, path: PathTable) -> np.ndarray:
+    """A CRC of the roadbase block and the block above it (the rail) at each row of ``path``, as the world holds them."""
+    coords = np.stack([path.column(name) for name in ('x', 'y', 'z')], axis=1).reshape(-1, 3).astype(np.int64)
+    blocks = read_voxel_blocks(world, dimension, np.concatenate((coords, coords + (0, 1, 0))))
+    crc = np.zeros(len(coords), dtype=np.int64)
+    for i, (base, rail) in enumerate(zip(blocks[:len(coords)], blocks[len(coords):])):
+        crc[i] = zlib.crc32(f"{block_snbt(base)}\n\n{block_snbt(rail)}".encode("utf-8")) & 0x7FFFFFFF
+    return crc
+
+
+def selection_mask(selection_group, coords: np.ndarray) -> np.ndarray:
+    """Which of an (N, 3) array of voxels lie inside a SelectionGroup."""
+    coords = np.asarray(coords, dtype=np.int64).reshape(-1, 3)
+    inside = np.zeros(len(coords), dtype=bool)
+    for box in selection_group.selection_boxes:
+        inside |= np.all((coords >= np.asarray(box.min)) & (coords < np.asarray(box.max)), axis=1)
+    return inside
+
+
+class RouteCache:
+    """
+    The last plan applied to each world and dimension, kept for incremental rebuilds.
+
+    Only the plan's options and route tables are stored, since its edits are
+    in the world by then, together with a 'built' table per route: the
+    built_fingerprints of its path as it stood once the plan was applied.  A
+    rerun compares them with the world to find out whether the routes are
+    still there as they were built (an undo, for one, takes them away).
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def path(self, world, dimension) -> str:
+        digest = hashlib.sha1(json.dumps(_world_key(world, dimension), sort_keys=True).encode("utf-8")).hexdigest()[:20]
+        return os.path.join(self.directory, f"rail_routes_{digest}.npz")
+
+    def load(self, world, dimension) -> Optional[EditPlan]:
+        """The cached plan for this world and dimension, or None if there is none (or it cannot be read)."""
+        path = self.path(world, dimension)
+        if not os.path.exists(path):
+            return None
+        try:
+            return EditPlan.load(path)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning('Ignoring unreadable route cache %s: %s', path, e)
+            return None
+
+    def store(self, world, plan: EditPlan):
+        """Cache a plan that has just been applied."""
+        cached = EditPlan(plan.platform, plan.version, plan.dimension, plan.options)
+        cached.routes = [
+            dict(route, built=PathTable.from_columns(BUILT_FIELDS, {'crc': built_fingerprints(world, plan.dimension, route['path'])}))
+            for route in plan.routes
+        ]
+        cached.completed = list(plan.completed)
+        cached.save(self.path(world, plan.dimension))
+
+    @staticmethod
+    def changed_rows(world, dimension, route: Dict[str, PathTable]) -> np.ndarray:
+        """Which path rows of a cached route the world no longer holds as they were built."""
+        return built_fingerprints(world, dimension, route['path']) != route['built'].column('crc')
@@ -0,0 +1,377 @@
+# Rail Placer Benchmark
+# Time the "Place Rails" pipeline on synthetic routes, without Amulet's editor
+#
+# Amulet Map Editor and API Code from the Amulet Team
+# All other code (c) 2024 Black Forest Creations
+# Blame:  @lNQUlSlTlON
+
+"""
+Benchmark for the Rail Placer.
+
+Builds a synthetic wool route in an in-memory FakeLevel and runs the same
+RailBuilder.build_railroad pipeline the "Place Rails" panel runs on it.  The
+time and the world calls the pipeline makes are reported per phase (see
+RunProfile), for each route length asked for.
+
+The routes snake back and forth in rows and mix straights, staircase
+diagonals, slopes, bridges over ravines and water crossings, so every span
+type the support engine knows about is hit.
+
+Example:
+
+    python rail_placer_benchmark.py --sizes 1000 10000 --json bench.json
+    python rail_placer_benchmark.py --sizes 1000 10000 --baseline bench.json
+    python rail_placer_benchmark.py --sizes 10000 --mode checkpoint
+    python rail_placer_benchmark.py --sizes 10000 --platform java --level anvil
+
+--mode picks how the run is driven: built as it goes (direct, the default),
+planned and then applied (plan), planned with a checkpoint (checkpoint) or
+as an incremental build with a route cache (cache).
+
+--platform picks the level's platform: Bedrock, with a version tuple (the
+default), or Java, with an int data version.  --level anvil copies the route
+into a temporary Java world and runs on that instead of the FakeLevel, so
+the chunk paths a saved world takes (scan_markers, probe_column_depths and
+the WriteBuffer's sub-chunk writes) are what gets timed.
+
+--baseline compares the run against an earlier --json file and exits with 1
+when any route got slower than --tolerance allows, so a change to the placer
+can be checked for regressions; each route is compared with the baseline
+run in the same mode, platform and level.  The pipeline still imports
+amulet (for its Block objects) and PyMCTranslate (to translate blocks the
+way a real level does), and "construction.py", "rail_builder.py" and
+"rail_pipeline.py" need to be in the same folder as this script.
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+
+import amulet
+import numpy as np
+import PyMCTranslate
+
+from amulet.api.block import Block
+from amulet.api.selection import SelectionBox, SelectionGroup
+from amulet.level.formats.anvil_world import AnvilFormat
+# Rail Placer pipeline (same folder as this script)
+from rail_builder import CRIBBING_CHOICES, PILLAR_CHOICES, POWER_CHOICES, UNDERPINNING_CHOICES, RailBuilder
+from rail_pipeline import RunProfile, configure_logging
+
+DIMENSION = "minecraft:overworld"
+GROUND_Y = 64  # the wool of a flat stretch sits on ground whose top block is GROUND_Y - 1
+ROW_LENGTH = 512  # the route turns back after about this many blocks
+ROW_SPACING = 16  # blocks between the rows of the route
+BOTTOM_Y = GROUND_Y - 16  # an Anvil level's terrain is filled in from here up
+
+PINK_WOOL = "universal_minecraft:wool[color=pink]"
+STONE = "universal_minecraft:stone"
+WATER = "universal_minecraft:water[falling=false,flowing=false,level=0]"
+AIR = "universal_minecraft:air"
+
+
+# The ways a run can be driven: building as it goes, planning then applying,
+# planning with a checkpoint, and an incremental (cached) build
+MODES = ("direct", "plan", "checkpoint", "cache")
+
+# The version a level of each platform reports: Bedrock a version tuple, Java
+# an int data version (3465 is 1.20.1)
+VERSIONS = {"bedrock": (1, 20, 0), "java": 3465}
+
+# The level a run works on: the in-memory FakeLevel, or a temporary Java world
+LEVELS = ("fake", "anvil")
+
+_translation_manager = None
+
+
+def translation_manager():
+    """The PyMCTranslate translation manager, loaded once for every FakeLevel."""
+    global _translation_manager
+    if _translation_manager is None:
+        _translation_manager = PyMCTranslate.new_translation_manager()
+    return _translation_manager
+
+
+class FakeLevelWrapper:
+    def __init__(self, platform, version):
+        self.platform = platform
+        self.version = version
+
+
+class FakeLevel:
+    """
+    An in-memory stand-in for BaseLevel.
+
+    The terrain is two NumPy height maps, one for the ground and one for the
+    water surface, with anything placed (the wool, and everything the
+    pipeline writes) kept in a dict of universal Blocks on top.  It only has
+    the part of the BaseLevel interface the pipeline needs without chunks:
+    get_block, set_version_block, level_wrapper and translation_manager.
+    Placed blocks are translated to universal like a real level does, so a
+    block that loses its properties on the way in reads back without them.
+    """
+
+    def __init__(self, ground: np.ndarray, water: np.ndarray, origin, platform="bedrock", version=(1, 20, 0)):
+        self.ground = ground
+        self.water = water
+        self.origin_x, self.origin_z = origin
+        self.level_wrapper = FakeLevelWrapper(platform, version)
+        self.translation_manager = translation_manager()
+        self.placed = {}
+        self._blocks = {}
+        self._universal = {}
+
+    def _block(self, blockstate: str) -> Block:
+        block = self._blocks.get(blockstate)
+        if block is None:
+            block = self._blocks[blockstate] = Block.from_string_blockstate(blockstate)
+        return block
+
+    def get_block(self, x: int, y: int, z: int, dimension) -> Block:
+        placed = self.placed.get((x, y, z))
+        if placed is not None:
+            return placed
+        i, k = x - self.origin_x, z - self.origin_z
+        if 0 <= i < self.ground.shape[0] and 0 <= k < self.ground.shape[1]:
+            ground, water = self.ground[i, k], self.water[i, k]
+        else:
+            ground = water = GROUND_Y
+        if y < ground:
+            return self._block(STONE)
+        if y < water:
+            return self._block(WATER)
+        return self._block(AIR)
+
+    def set_version_block(self, x: int, y: int, z: int, dimension, version, block, block_entity=None):
+        key = (tuple(version), block)
+        universal = self._universal.get(key)
+        if universal is None:
+            universal = self._universal[key] = self.translation_manager.get_version(*version).block.to_universal(block)[0]
+        self.placed[(int(x), int(y), int(z))] = universal
+
+
+# One motif of a row: (feature, blocks).  The motif ends at the height and
+# row offset it started at, so rows can be repeated any number of times.
+MOTIF = (
+    ("straight", 8),
+    ("diagonal_out", 4),
+    ("straight", 8),
+    ("slope_up", 4),
+    ("bridge", 16),
+    ("slope_down", 4),
+    ("straight", 8),
+    ("water", 16),
+    ("diagonal_in", 4),
+    ("straight", 8),
+)
+
+
+def synthetic_route(length: int, platform="bedrock"):
+    """
+    Lay out a wool route of about "length" blocks.
+
+    Returns (FakeLevel, start) with the route's wool placed in a level of
+    "platform" (a key of VERSIONS) and "start" its first block.
+    """
+    path = []  # (x, y, z, terrain) with terrain one of "flat", "ravine", "water"
+    x, y, z = 0, GROUND_Y, 0
+    heading = 1
+
+    def step(dx, dy, dz, terrain="flat"):
+        nonlocal x, y, z
+        x, y, z = x + dx, y + dy, z + dz
+        path.append((x, y, z, terrain))
+
+    path.append((x, y, z, "flat"))
+    while len(path) < length:
+        row_start = x
+        while abs(x - row_start) < ROW_LENGTH and len(path) < length:
+            for feature, blocks in MOTIF:
+                for _ in range(blocks):
+                    if feature == "diagonal_out":
+                        step(heading, 0, 0)
+                        step(0, 0, 1)
+                    elif feature == "diagonal_in":
+                        step(heading, 0, 0)
+                        step(0, 0, -1)
+                    elif feature == "slope_up":
+                        step(heading, 1, 0)
+                    elif feature == "slope_down":
+                        step(heading, -1, 0)
+                    elif feature == "bridge":
+                        step(heading, 0, 0, "ravine")
+                    elif feature == "water":
+                        step(heading, 0, 0, "water")
+                    else:
+                        step(heading, 0, 0)
+        for _ in range(4):
+            step(heading, 0, 0)
+        for _ in range(ROW_SPACING):
+            step(0, 0, 1)
+        for _ in range(4):
+            step(-heading, 0, 0)
+        heading = -heading
+
+    coords = np.array([point[:3] for point in path], dtype=np.int64)
+    margin = 8
+    origin = (int(coords[:, 0].min()) - margin, int(coords[:, 2].min()) - margin)
+    shape = (int(np.ptp(coords[:, 0])) + 2 * margin + 1, int(np.ptp(coords[:, 2])) + 2 * margin + 1)
+    ground = np.full(shape, GROUND_Y, dtype=np.int16)
+    water = np.full(shape, GROUND_Y, dtype=np.int16)
+    # A ravine or a lake is cut three blocks either side of the track
+    for px, py, pz, terrain in path:
+        if terrain == "flat":
+            continue
+        i, k = px - origin[0], pz - origin[1]
+        if terrain == "ravine":
+            ground[i - 1:i + 2, k - 3:k + 4] = GROUND_Y - 12
+        else:
+            ground[i - 1:i + 2, k - 3:k + 4] = GROUND_Y - 6
+            water[i - 1:i + 2, k - 3:k + 4] = py
+    level = FakeLevel(ground, water, origin, platform, VERSIONS[platform])
+    for px, py, pz, _ in path:
+        level.placed[(px, py, pz)] = level._block(PINK_WOOL)
+    return level, tuple(int(v) for v in coords[0])
+
+
+def anvil_level(level: FakeLevel, path: str):
+    """
+    Copy a FakeLevel's terrain and placed blocks into a new Java world at "path".
+
+    Returns the world, saved and opened again, so its chunks are read from
+    disk the way they are in the editor.
+    """
+    # Amulet writes a level.dat without dimension types and logs an error about each one on every open
+    logging.getLogger("amulet.level.formats.anvil_world.format").setLevel(logging.CRITICAL)
+    wrapper = AnvilFormat(path)
+    wrapper.create_and_open("java", level.level_wrapper.version, overwrite=True)
+    wrapper.close()
+    world = amulet.load_level(path)
+    stone, water, air = (world.block_palette.get_add_block(level._block(blockstate)) for blockstate in (STONE, WATER, AIR))
+    x0, z0 = level.origin_x, level.origin_z
+    x1, z1 = x0 + level.ground.shape[0], z0 + level.ground.shape[1]
+    top = int(max(level.ground.max(), level.water.max()))
+    ys = np.arange(BOTTOM_Y, top, dtype=np.int16)[None, :, None]
+    for cx in range(x0 >> 4, ((x1 - 1) >> 4) + 1):
+        for cz in range(z0 >> 4, ((z1 - 1) >> 4) + 1):
+            # The height maps under this chunk, GROUND_Y where it runs past their edge
+            ground = np.full((16, 16), GROUND_Y, dtype=np.int16)
+            surface = np.full((16, 16), GROUND_Y, dtype=np.int16)
+            ax0, ax1 = max(x0, cx * 16), min(x1, cx * 16 + 16)
+            az0, az1 = max(z0, cz * 16), min(z1, cz * 16 + 16)
+            local = (slice(ax0 - cx * 16, ax1 - cx * 16), slice(az0 - cz * 16, az1 - cz * 16))
+            ground[local] = level.ground[ax0 - x0:ax1 - x0, az0 - z0:az1 - z0]
+            surface[local] = level.water[ax0 - x0:ax1 - x0, az0 - z0:az1 - z0]
+            ids = np.full((16, ys.shape[1], 16), air, dtype=np.uint32)
+            ids[np.broadcast_to(ys < surface[:, None, :], ids.shape)] = water
+            ids[np.broadcast_to(ys < ground[:, None, :], ids.shape)] = stone
+            chunk = world.create_chunk(cx, cz, DIMENSION)
+            chunk.blocks[0:16, BOTTOM_Y:top, 0:16] = ids
+    for (x, y, z), block in level.placed.items():
+        chunk = world.get_chunk(x >> 4, z >> 4, DIMENSION)
+        chunk.set_block(x & 15, y, z & 15, block)
+        chunk.changed = True
+    world.save()
+    world.close()
+    return amulet.load_level(path)
+
+
+def run_benchmark(length: int, cribbing_choice, minus1_choice, power_choice, pillar_choice, construction_dir=None, mode="direct", platform="bedrock", level="fake"):
+    """
+    Build a synthetic route of about "length" blocks, driven the way "mode" (one of MODES) says.
+
+    The route is built in a FakeLevel of "platform" (a key of VERSIONS), or
+    for "level" anvil in a temporary Java world copied from it.  Returns the
+    route length (in wool blocks) and its RunProfile.
+    """
+    fake_level, start = synthetic_route(length, platform)
+    wool = len(fake_level.placed)
+    selection_group = SelectionGroup([SelectionBox(start, tuple(v + 1 for v in start))])
+    builder = RailBuilder()
+    with tempfile.TemporaryDirectory() as directory:
+        world = anvil_level(fake_level, os.path.join(directory, "world")) if level == "anvil" else fake_level
+        run_profile = RunProfile(world)
+        args = (run_profile.world, DIMENSION, selection_group, cribbing_choice, minus1_choice, power_choice, pillar_choice, construction_dir)
+        if mode == "plan":
+            def planned():
+                plan = yield from builder.plan_railroad(*args, workers=1)
+                yield from builder.apply_plan(plan, run_profile.world)
+            operation = planned()
+        elif mode == "checkpoint":
+            operation = builder.build_railroad(*args, workers=1, checkpoint_dir=directory)
+        elif mode == "cache":
+            operation = builder.build_railroad(*args, workers=1, cache_dir=directory)
+        else:
+            operation = builder.build_railroad(*args, workers=1)
+        try:
+            for _ in run_profile.run(operation):
+                pass
+        finally:
+            if world is not fake_level:
+                world.close()
+    return wool, run_profile
+
+
+def compare(results, baseline_path, tolerance):
+    """Print how each route compares to the baseline file.  Returns True when none got slower than allowed."""
+    def key(result):
+        return result["length"], result.get("mode", "direct"), result.get("platform", "bedrock"), result.get("level", "fake")
+
+    with open(baseline_path) as f:
+        baseline = {key(result): result for result in json.load(f)["results"]}
+    passed = True
+    for result in results:
+        before = baseline.get(key(result))
+        if before is None:
+            print(f"{result['length']:>8}: not in the baseline ({result['mode']}, {result['platform']}, {result['level']})")
+            continue
+        ratio = result["seconds"] / before["seconds"] if before["seconds"] else 1.0
+        slower = ratio > 1.0 + tolerance
+        passed = passed and not slower
+        print(f"{result['length']:>8}: {before['seconds']:.3f}s -> {result['seconds']:.3f}s ({ratio:.2f}x){'  SLOWER' if slower else ''}")
+    return passed
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Time the rail placer on synthetic routes.")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[1000, 10000, 100000], help="route lengths in blocks (default: %(default)s)")
+    parser.add_argument("--cribbing", choices=CRIBBING_CHOICES, default=CRIBBING_CHOICES[0], help="cribbing blocks (default: %(default)s)")
+    parser.add_argument("--underpinning", choices=UNDERPINNING_CHOICES, default=UNDERPINNING_CHOICES[0], help="underpinning blocks (default: %(default)s)")
+    parser.add_argument("--power", choices=POWER_CHOICES, default=POWER_CHOICES[0], help="climbing rails (default: %(default)s)")
+    parser.add_argument("--pillar", choices=PILLAR_CHOICES, default=PILLAR_CHOICES[0], help="support pillars (default: %(default)s)")
+    parser.add_argument("--mode", choices=MODES, default=MODES[0], help="direct: build as the route is worked out; plan: plan, then apply; checkpoint: plan with a checkpoint; cache: an incremental (cached) build (default: %(default)s)")
+    parser.add_argument("--platform", choices=VERSIONS, default="bedrock", help="the level's platform: bedrock has a version tuple, java an int data version (default: %(default)s)")
+    parser.add_argument("--level", choices=LEVELS, default=LEVELS[0], help="fake: an in-memory level; anvil: a temporary Java world, read and written through its chunks (default: %(default)s)")
+    parser.add_argument("--construction-dir", default=None, help="folder holding the pillar .construction files (default: the editor's plug-in folder)")
+    parser.add_argument("--json", metavar="PATH", help="also save the results as JSON, for a later --baseline")
+    parser.add_argument("--baseline", metavar="PATH", help="compare against the results saved by an earlier --json run")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="how much slower than the baseline a route may get (default: %(default)s)")
+    args = parser.parse_args(argv)
+    if args.level == "anvil" and args.platform != "java":
+        parser.error("--level anvil is a Java world, so it needs --platform java")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    # The pipeline's own messages are not what is being measured
+    configure_logging(logging.WARNING)
+    results = []
+    for length in args.sizes:
+        wool, run_profile = run_benchmark(length, args.cribbing, args.underpinning, args.power, args.pillar, args.construction_dir, args.mode, args.platform, args.level)
+        print(f"Route of {wool} blocks ({args.mode}, {args.platform}, {args.level}):")
+        print(run_profile.table())
+        results.append(dict(run_profile.summary(), length=wool, mode=args.mode, platform=args.platform, level=args.level))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"results": results}, f, indent=2)
+    if args.baseline and not compare(results, args.baseline, args.tolerance):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
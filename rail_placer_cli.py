@@ -0,0 +1,182 @@
+# Rail Placer Command Line Runner
+# Run the "Place Rails" pipeline on saved worlds, without Amulet's editor
+#
+# Amulet Map Editor and API Code from the Amulet Team
+# All other code (c) 2024 Black Forest Creations
+# Blame:  @lNQUlSlTlON
+
+"""
+Headless runner for the Rail Placer.
+
+Loads each world with amulet.load_level, runs the same RailBuilder pipeline
+the "Place Rails" panel runs, and saves the world.  No wx import is needed, so
+this works on a build server.  Several worlds are processed side by side in
+separate OS processes with --jobs, and separate routes in one selection are
+planned in up to --workers processes.
+
+--plan-only saves an edit plan without changing the world, and --apply-plan
+writes a saved plan to the world later in one bulk commit.
+
+--log-level sets how much the pipeline reports (TRACE shows every block),
+--log-sample keeps one in every N of each per-block message, and --log-file
+writes the messages to a file as well.  {world} in --log-file is replaced by
+the world folder name.
+
+--profile records the time and world calls of each phase, prints them as a
+table and saves them as JSON next to the world ("<world>.rail_profile.json").
+
+Builds are checkpointed under --checkpoint-dir: run the same command again
+after a crash or Ctrl+C and the phases already done are skipped.
+
+--path-file builds along a precomputed ordered path (a .json or .npy list of
+x, y, z and use case, see load_path_file) instead of the wool in --box.
+
+--incremental keeps the plan of each build under --route-cache-dir, and a
+later --incremental run rewrites only the stretches of track whose wool was
+moved.  The --box then only needs to cover the wool that was added or moved,
+and the broken roadbase of the stretch it replaces, which is cleared away.
+If anything else about the cached track changed (an undo, say), the --box is
+built in full instead.
+
+Example:
+
+    python rail_placer_cli.py "C:\\worlds\\Railway" --box 100 64 -20 180 64 40 \\
+        --cribbing "Smooth Stone" --pillar "3x5 Blackstone"
+
+The box corners are inclusive, the same as the two points of a selection in
+the editor.  "construction.py", "rail_builder.py" and "rail_pipeline.py" need
+to be in the same folder as this script.  Back up your worlds first: the edits
+are saved without an undo history.
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import amulet
+from amulet.api.selection import SelectionBox, SelectionGroup
+# Rail Placer pipeline (same folder as this script)
+from rail_builder import CRIBBING_CHOICES, PILLAR_CHOICES, POWER_CHOICES, UNDERPINNING_CHOICES, RailBuilder, default_checkpoint_dir, default_route_cache_dir
+from rail_pipeline import EditPlan, RunProfile, configure_logging, discard_checkpoint, load_path_file, profile_path
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Place rails along the wool path in a saved world.")
+    parser.add_argument("worlds", nargs="+", help="world folder(s) to build in")
+    parser.add_argument("--box", nargs=6, type=int, action="append", metavar=("X1", "Y1", "Z1", "X2", "Y2", "Z2"),
+                        help="inclusive corners of a selection box (repeat for more boxes)")
+    parser.add_argument("--dimension", default="minecraft:overworld", help="dimension to build in (default: %(default)s)")
+    parser.add_argument("--cribbing", choices=CRIBBING_CHOICES, default=CRIBBING_CHOICES[0], help="cribbing blocks (default: %(default)s)")
+    parser.add_argument("--underpinning", choices=UNDERPINNING_CHOICES, default=UNDERPINNING_CHOICES[0], help="underpinning blocks (default: %(default)s)")
+    parser.add_argument("--power", choices=POWER_CHOICES, default=POWER_CHOICES[0], help="climbing rails (default: %(default)s)")
+    parser.add_argument("--pillar", choices=PILLAR_CHOICES, default=PILLAR_CHOICES[0], help="support pillars (default: %(default)s)")
+    parser.add_argument("--construction-dir", default=None, help="folder holding the pillar .construction files (default: the editor's plug-in folder)")
+    parser.add_argument("--jobs", type=int, default=1, help="worlds to process at the same time, one process each (default: %(default)s)")
+    parser.add_argument("--workers", type=int, default=None, help="processes that plan separate routes in one world (default: one per CPU)")
+    parser.add_argument("--plan-only", metavar="PLAN", help="save an edit plan (.npz) instead of changing the world; {world} is replaced by the world folder name")
+    parser.add_argument("--apply-plan", metavar="PLAN", help="apply a saved edit plan instead of building from --box")
+    parser.add_argument("--path-file", metavar="PATH", help="build along an ordered path (.json or .npy) instead of the wool in --box")
+    parser.add_argument("--checkpoint-dir", default=default_checkpoint_dir(), help="folder for resumable checkpoints (default: %(default)s)")
+    parser.add_argument("--no-checkpoint", action="store_true", help="build straight into the world without checkpoints")
+    parser.add_argument("--incremental", action="store_true", help="only rebuild the track whose wool changed since the last --incremental run")
+    parser.add_argument("--route-cache-dir", default=default_route_cache_dir(), help="folder for the plans --incremental compares against (default: %(default)s)")
+    parser.add_argument("--profile", action="store_true", help="time each phase and count its world calls")
+    parser.add_argument("--log-level", choices=("TRACE", "DEBUG", "INFO", "WARNING", "ERROR"), default="INFO", help="how much the pipeline reports (default: %(default)s)")
+    parser.add_argument("--log-sample", type=int, default=1, metavar="N", help="keep one in every N of each DEBUG or TRACE message (default: %(default)s)")
+    parser.add_argument("--log-file", metavar="PATH", help="also write the pipeline's messages to this file; {world} is replaced by the world folder name")
+    args = parser.parse_args(argv)
+    if not args.box and not args.apply_plan and not args.path_file:
+        parser.error("--box is required unless --apply-plan or --path-file is given")
+    return args
+
+
+def run_world(world_path, boxes, dimension, cribbing_choice, minus1_choice, power_choice, pillar_choice, construction_dir=None, workers=None, plan_only=None, apply_plan=None, checkpoint_dir=None, profile=False, cache_dir=None, log_level="INFO", log_sample=1, log_file=None, path_file=None):
+    """
+    Build the railroad in one world and save it.  Returns the seconds it took.
+
+    With "plan_only" the run is only planned and the plan saved there; with
+    "apply_plan" a saved plan is applied instead of building from the boxes,
+    and with "path_file" the railroad follows that path instead of the wool.
+    A "checkpoint_dir" makes planning resumable (see RailBuilder.plan_railroad),
+    and a "cache_dir" makes the build incremental (see RailBuilder.rebuild_railroad).
+    With "profile" the run is timed per phase (see RunProfile).  The log_*
+    arguments set up the pipeline's logging (see configure_logging).
+    """
+    start_time = time.perf_counter()
+    world_name = os.path.basename(os.path.normpath(world_path))
+    configure_logging(log_level, log_sample, log_file.format(world=world_name) if log_file else None)
+    selection_group = SelectionGroup([
+        SelectionBox(
+            (min(box[0], box[3]), min(box[1], box[4]), min(box[2], box[5])),
+            (max(box[0], box[3]) + 1, max(box[1], box[4]) + 1, max(box[2], box[5]) + 1),
+        )
+        for box in boxes or ()
+    ])
+    builder = RailBuilder()
+    level = amulet.load_level(world_path)
+    try:
+        run_profile = RunProfile(level) if profile else None
+        world = run_profile.world if profile else level
+        if apply_plan:
+            operation = builder.apply_plan(EditPlan.load(apply_plan), world)
+        elif path_file and plan_only:
+            operation = builder.plan_from_path(world, dimension, load_path_file(path_file), cribbing_choice, minus1_choice, power_choice, pillar_choice, construction_dir, workers)
+        elif path_file:
+            operation = builder.build_from_path(world, dimension, load_path_file(path_file), cribbing_choice, minus1_choice, power_choice, pillar_choice, construction_dir, workers)
+        elif plan_only:
+            operation = builder.plan_railroad(world, dimension, selection_group, cribbing_choice, minus1_choice, power_choice, pillar_choice, construction_dir, workers, checkpoint_dir)
+        else:
+            operation = builder.build_railroad(world, dimension, selection_group, cribbing_choice, minus1_choice, power_choice, pillar_choice, construction_dir, workers, checkpoint_dir, cache_dir)
+        if profile:
+            operation = run_profile.run(operation)
+        while True:
+            try:
+                progress, message = next(operation)
+            except StopIteration as stop:
+                result = stop.value
+                break
+            print(f"{world_path}: {progress:6.1%} {message}", flush=True)
+        if plan_only:
+            plan_path = plan_only.format(world=world_name)
+            result.save(plan_path)
+            discard_checkpoint(result)
+            print(f"{world_path}: plan saved to {plan_path}")
+        else:
+            level.save()
+        if profile:
+            print(run_profile.table())
+            run_profile.save(profile_path(world_path))
+            print(f"{world_path}: profile saved to {profile_path(world_path)}")
+    finally:
+        level.close()
+    return time.perf_counter() - start_time
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    options = (args.box, args.dimension, args.cribbing, args.underpinning, args.power, args.pillar, args.construction_dir, args.workers, args.plan_only, args.apply_plan, None if args.no_checkpoint else args.checkpoint_dir, args.profile, args.route_cache_dir if args.incremental else None, args.log_level, args.log_sample, args.log_file, args.path_file)
+    failed = 0
+    if args.jobs > 1 and len(args.worlds) > 1:
+        with ProcessPoolExecutor(max_workers=min(args.jobs, len(args.worlds))) as pool:
+            futures = {pool.submit(run_world, world_path, *options): world_path for world_path in args.worlds}
+            for future in as_completed(futures):
+                world_path = futures[future]
+                try:
+                    print(f"{world_path}: done in {future.result():.1f}s")
+                except Exception as e:
+                    print(f"{world_path}: failed: {e}", file=sys.stderr)
+                    failed += 1
+    else:
+        for world_path in args.worlds:
+            try:
+                print(f"{world_path}: done in {run_world(world_path, *options):.1f}s")
+            except Exception as e:
+                print(f"{world_path}: failed: {e}", file=sys.stderr)
+                failed += 1
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
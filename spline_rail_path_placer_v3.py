@@ -22,17 +22,23 @@ with pink wool, while clearing air above and beside the path.
 The tension slider controls how tightly the spline follows the control points:
   - Low tension (left) = loose, sweeping curves
   - High tension (right) = tight, nearly straight lines between points
+
+The preview shares its box merging with the Rail Placer, so "rail_pipeline.py"
+needs to be in the same folder as this script.
 """
 
 import math
 import numpy as np
 import wx
 
+from collections import OrderedDict
 from typing import TYPE_CHECKING, List, Tuple, Set, Optional
 from amulet.api.selection import SelectionBox, SelectionGroup
 from amulet.api.data_types import Dimension
 from amulet.api.block import Block
 from amulet_map_editor.programs.edit.api.operations import DefaultOperationUI
+# Rail Placer pipeline (same folder as this script)
+from rail_pipeline import merge_voxel_boxes
 
 if TYPE_CHECKING:
     from amulet.api.level import BaseLevel
@@ -56,6 +62,15 @@ WOOL_COLOR_MAP = {
     "Purple Wool":     ("purple",     "purple_wool"),
 }
 
+# Samples per block used to measure a spline's length before it is resampled by arc length
+ARC_LENGTH_OVERSAMPLE = 4
+
+# Recomputed previews kept for (points, tension, width, height), and rasterized segments kept by curve
+RECOMPUTE_CACHE_SIZE = 8
+SEGMENT_CACHE_SIZE = 2048
+# Quiet time after the last tension slider event before the preview is recomputed
+TENSION_DEBOUNCE_MS = 150
+
 # Dropdown label lists for each role
 START_CHOICES = ["Lime Wool", "Yellow Wool", "Light Blue Wool", "Green Wool"]
 END_CHOICES = ["Red Wool", "Magenta Wool", "Black Wool", "Orange Wool"]
@@ -63,6 +78,93 @@ CONTROL_CHOICES = ["Blue Wool", "Cyan Wool", "Purple Wool", "White Wool"]
 PATH_CHOICES = ["Pink Wool", "Orange Wool", "White Wool", "Magenta Wool"]
 
 
+class LRUCache(OrderedDict):
+    """An OrderedDict that keeps only its "size" most recently used entries."""
+
+    def __init__(self, size: int):
+        super().__init__()
+        self.size = size
+
+    def get(self, key, default=None):
+        if key not in self:
+            return default
+        self.move_to_end(key)
+        return self[key]
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > self.size:
+            self.popitem(last=False)
+
+
+# The 26 offsets to the blocks around a block
+NEIGHBOR_OFFSETS = tuple(
+    (dx, dy, dz)
+    for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1)
+    if (dx, dy, dz) != (0, 0, 0)
+)
+
+
+class VoxelIndex:
+    """
+    Spatial index of the blocks of an ordered path.
+
+    Each block is packed into one int64 key (see pack) and the keys are kept
+    sorted, so the path blocks at a fixed offset from every block of the path
+    are found with one vectorized search instead of a set lookup per block.
+    """
+
+    # Bits per axis: x and z cover the world border (+-30M), y covers +-1024
+    XZ_BITS = 26
+    Y_BITS = 11
+
+    def __init__(self, voxels):
+        self.coords = np.asarray(voxels, dtype=np.int64).reshape(-1, 3)
+        self.keys = self.pack(self.coords)
+        self._order = np.argsort(self.keys, kind="stable")
+        self._sorted = self.keys[self._order]
+
+    @classmethod
+    def pack(cls, coords: np.ndarray) -> np.ndarray:
+        """Pack (N, 3) x, y, z coordinates into N int64 keys, x in the high bits, then z, then y."""
+        coords = np.asarray(coords, dtype=np.int64).reshape(-1, 3)
+        x = coords[:, 0] + (1 << (cls.XZ_BITS - 1))
+        z = coords[:, 2] + (1 << (cls.XZ_BITS - 1))
+        y = coords[:, 1] + (1 << (cls.Y_BITS - 1))
+        return (x << (cls.XZ_BITS + cls.Y_BITS)) | (z << cls.Y_BITS) | y
+
+    @classmethod
+    def offset(cls, dx: int, dy: int, dz: int) -> int:
+        """The amount a key changes by when its block moves by (dx, dy, dz)."""
+        return (dx << (cls.XZ_BITS + cls.Y_BITS)) + (dz << cls.Y_BITS) + dy
+
+    def __len__(self):
+        return len(self.keys)
+
+    def _search(self, dx: int, dy: int, dz: int):
+        query = self.keys + self.offset(dx, dy, dz)
+        lo = np.searchsorted(self._sorted, query, "left")
+        hi = np.searchsorted(self._sorted, query, "right")
+        return lo, hi - lo
+
+    def occupied(self, dx: int, dy: int, dz: int) -> np.ndarray:
+        """For each path block, whether the position (dx, dy, dz) away from it is on the path."""
+        return self._search(dx, dy, dz)[1] > 0
+
+    def matches(self, dx: int, dy: int, dz: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Pairs of path indices (i, j) where block j is (dx, dy, dz) away from
+        block i, as two arrays.  A position on the path more than once gives
+        a pair for each of its indices.
+        """
+        lo, counts = self._search(dx, dy, dz)
+        i = np.repeat(np.arange(len(self.keys)), counts)
+        first = np.repeat(lo, counts)
+        within = np.arange(len(i)) - np.repeat(np.cumsum(counts) - counts, counts)
+        return i, self._order[first + within]
+
+
 class SplineRailPathPlacerV3(wx.Panel, DefaultOperationUI):
     def __init__(
         self,
@@ -142,6 +244,10 @@ class SplineRailPathPlacerV3(wx.Panel, DefaultOperationUI):
         self._remove_markers_cb.SetValue(True)
         self._sizer.Add(self._remove_markers_cb, 0, wx.ALL | wx.ALIGN_CENTRE_HORIZONTAL, 5)
 
+        self._preview_clearance_cb = wx.CheckBox(self, label="Show clearance in preview")
+        self._preview_clearance_cb.SetValue(False)
+        self._sizer.Add(self._preview_clearance_cb, 0, wx.ALL | wx.ALIGN_CENTRE_HORIZONTAL, 5)
+
         # --- Buttons (above status so they stay visible) ---
         btn_sizer = wx.BoxSizer(wx.HORIZONTAL)
         self._scan_button = wx.Button(self, label="Scan")
@@ -173,10 +279,20 @@ class SplineRailPathPlacerV3(wx.Panel, DefaultOperationUI):
         self._clearance_voxels: Set[Tuple[int, int, int]] = set()
         self._ordered_path: List[Tuple[int, int, int]] = []
         self._constraint_stats: dict = {}
+        self._recompute_cache = LRUCache(RECOMPUTE_CACHE_SIZE)
+        self._segment_cache = LRUCache(SEGMENT_CACHE_SIZE)
+        self._tension_timer: Optional[wx.CallLater] = None
         self._marker_coords: List[Tuple[int, int, int]] = []
         self._ordered_points: List[Tuple[int, int, int]] = []
         self._scan_complete = False
 
+    def disable(self):
+        # The editor destroys the panel after disabling it, so a preview still waiting
+        # on the tension slider must not fire after this
+        if self._tension_timer is not None:
+            self._tension_timer.Stop()
+        DefaultOperationUI.disable(self)
+
     # -------------------------------------------------------------------------
     # Button Handlers
     # -------------------------------------------------------------------------
@@ -243,14 +359,19 @@ class SplineRailPathPlacerV3(wx.Panel, DefaultOperationUI):
             return
 
         self._recompute_path()
-        self._show_path_preview()
+        box_count, ratio = self._show_path_preview()
         self._fill_button.Enable()
 
         fixes = self._constraint_stats.get("total_fixes", 0)
         fix_msg = f" Constraints: {fixes} fix(es)." if fixes > 0 else ""
+        report = self._constraint_stats.get("report", {})
+        knots = len(report.get("knots", ()))
+        gaps = len(report.get("gaps", ()))
+        check_msg = f" Check {knots} knot(s), {gaps} gap(s)." if knots or gaps else ""
         self._set_status(
             f"Preview: {len(self._path_voxels)} path blocks, "
-            f"{len(self._clearance_voxels)} air clearance.{fix_msg} "
+            f"{len(self._clearance_voxels)} air clearance.{fix_msg}{check_msg} "
+            f"Shown as {box_count} box(es), {ratio:.1f}x fewer than blocks. "
             f"Adjust tension and re-Preview, or click Fill."
         )
 
@@ -258,6 +379,10 @@ class SplineRailPathPlacerV3(wx.Panel, DefaultOperationUI):
         """Phase 2: Place path blocks and clear air."""
         if not self._scan_complete:
             return
+        if self._tension_timer is not None and self._tension_timer.IsRunning():
+            # Fill what the slider shows, not the preview from before it moved
+            self._tension_timer.Stop()
+            self._on_preview(None)
 
         world = self.canvas.world
         dimension = self.canvas.dimension
@@ -315,39 +440,59 @@ class SplineRailPathPlacerV3(wx.Panel, DefaultOperationUI):
         print("Spline Rail Path Placer operation completed successfully.")
 
     def _on_tension_change(self, _):
-        """Recompute and re-preview when tension slider changes."""
+        """Recompute and re-preview once the tension slider has been still for a moment."""
         if not self._scan_complete or len(self._ordered_points) < 2:
             return
-        self._on_preview(None)
+        if self._tension_timer is not None and self._tension_timer.IsRunning():
+            self._tension_timer.Start(TENSION_DEBOUNCE_MS)
+        else:
+            self._tension_timer = wx.CallLater(TENSION_DEBOUNCE_MS, self._on_preview, None)
 
     # -------------------------------------------------------------------------
     # Internal Helpers
     # -------------------------------------------------------------------------
 
     def _recompute_path(self):
-        """Recompute spline, rasterize, enforce constraints, and calculate clearance."""
+        """
+        Recompute spline, rasterize, enforce constraints, and calculate clearance.
+
+        Results are kept in an LRU cache, so going back to an earlier tension
+        is instant, and segments of the spline that did not change are reused
+        from the segment cache (see rasterize_spline).
+        """
         tension = self._tension_slider.GetValue() / 100.0
         width = self._width_spin.GetValue()
         height = self._height_spin.GetValue()
 
-        spline_coords = self.catmull_rom_spline(self._ordered_points, tension)
-        ordered_voxels = self.rasterize_to_voxels(spline_coords)
-        self._ordered_path, self._constraint_stats = self.enforce_path_constraints(
-            ordered_voxels
-        )
-        self._path_voxels = set(self._ordered_path)
-        self._clearance_voxels = self.get_clearance_voxels(
-            self._path_voxels, width, height
-        )
+        key = (tuple(self._ordered_points), tension, width, height)
+        cached = self._recompute_cache.get(key)
+        if cached is None:
+            ordered_voxels = self.rasterize_spline(
+                self._ordered_points, tension, segment_cache=self._segment_cache
+            )
+            ordered_path, constraint_stats = self.enforce_path_constraints(ordered_voxels)
+            path_voxels = set(ordered_path)
+            clearance_voxels = self.get_clearance_voxels(path_voxels, width, height)
+            cached = (ordered_path, constraint_stats, path_voxels, clearance_voxels)
+            self._recompute_cache[key] = cached
+        self._ordered_path, self._constraint_stats, self._path_voxels, self._clearance_voxels = cached
+
+    def _show_path_preview(self) -> Tuple[int, float]:
+        """
+        Set the canvas selection to show path blocks (and the clearance, if
+        asked for) as highlighted boxes, merged into as few boxes as possible.
 
-    def _show_path_preview(self):
-        """Set the canvas selection to show path blocks as highlighted boxes."""
-        boxes = [
-            SelectionBox((x, y, z), (x + 1, y + 1, z + 1))
-            for x, y, z in self._ordered_path
-        ]
-        if boxes:
-            self.canvas.selection.set_selection_group(SelectionGroup(boxes))
+        Returns the number of boxes and the compression ratio (see merge_boxes).
+        """
+        voxels = self._path_voxels
+        if self._preview_clearance_cb.GetValue():
+            voxels = voxels | self._clearance_voxels
+        boxes, ratio = self.merge_boxes(voxels)
+        if len(boxes):
+            self.canvas.selection.set_selection_group(SelectionGroup([
+                SelectionBox(box[:3], box[3:]) for box in boxes.tolist()
+            ]))
+        return len(boxes), ratio
 
     def _set_status(self, text: str):
         """Update the status label text."""
@@ -428,19 +573,71 @@ class SplineRailPathPlacerV3(wx.Panel, DefaultOperationUI):
 
         return ordered
 
+    @staticmethod
+    def catmull_rom_coefficients(
+        points: List[Tuple[int, int, int]],
+        tension: float = 0.5,
+    ) -> np.ndarray:
+        """
+        Power-basis coefficients of every segment of a Catmull-Rom spline.
+
+        The endpoints are padded by duplicating the first and last points, and
+        each segment's four control points go through the tension basis matrix
+        in one batched product.
+
+        Args:
+            points: Ordered list of (x, y, z) coordinates to pass through (at least 2).
+            tension: 0.0 = loose curves, 1.0 = tight/linear.
+
+        Returns:
+            np.ndarray of shape (S, 4, 3): segment s at t is [1, t, t^2, t^3] @ C[s].
+        """
+        pts = np.asarray(points, dtype=float)
+        padded = np.vstack([pts[0:1], pts, pts[-1:]])
+        tau = tension
+        basis = np.array([
+            [0.0, 1.0, 0.0, 0.0],
+            [-tau, 0.0, tau, 0.0],
+            [2.0 * tau, tau - 3.0, 3.0 - 2.0 * tau, -tau],
+            [-tau, 2.0 - tau, tau - 2.0, tau],
+        ])
+        # (S, 4, 3): the p0..p3 of each segment
+        control = np.stack([padded[j:j + len(pts) - 1] for j in range(4)], axis=1)
+        return np.einsum("kj,sjd->skd", basis, control)
+
+    @staticmethod
+    def evaluate_spline(coefficients: np.ndarray, u: np.ndarray) -> np.ndarray:
+        """
+        Evaluate a spline at global parameters u (segment index + t, from 0 to S).
+
+        Returns:
+            np.ndarray of shape (N, 3), all samples from a single matrix product.
+        """
+        u = np.asarray(u, dtype=float)
+        segment = np.clip(np.floor(u).astype(np.int64), 0, len(coefficients) - 1)
+        t = u - segment
+        powers = np.stack([np.ones_like(t), t, t * t, t * t * t], axis=1)
+        return np.einsum("nk,nkd->nd", powers, coefficients[segment])
+
     @staticmethod
     def catmull_rom_spline(
         points: List[Tuple[int, int, int]],
         tension: float = 0.5,
         samples_per_unit: float = 2.0,
+        arc_length: bool = True,
     ) -> np.ndarray:
         """
         Compute a 3D Catmull-Rom spline through the given points.
 
+        With arc_length the samples are spaced evenly along the curve, in
+        blocks, however long or short each segment is.  Otherwise each segment
+        gets its own even spacing in t, as earlier versions did.
+
         Args:
             points: Ordered list of (x, y, z) coordinates to pass through.
             tension: 0.0 = loose curves, 1.0 = tight/linear.
             samples_per_unit: Number of samples per block of distance.
+            arc_length: Sample by arc length rather than per segment.
 
         Returns:
             np.ndarray of shape (N, 3) with float coordinates along the spline.
@@ -457,42 +654,95 @@ class SplineRailPathPlacerV3(wx.Panel, DefaultOperationUI):
             t_vals = np.linspace(0.0, 1.0, num_samples)
             return np.outer(1.0 - t_vals, p0) + np.outer(t_vals, p1)
 
-        pts = np.array(points, dtype=float)
+        pts = np.asarray(points, dtype=float)
+        coefficients = SplineRailPathPlacerV3.catmull_rom_coefficients(pts, tension)
+        num_segments = len(coefficients)
+        chords = np.linalg.norm(np.diff(pts, axis=0), axis=1)
 
-        # Pad endpoints by duplicating first and last
-        padded = np.vstack([pts[0:1], pts, pts[-1:]])
+        if not arc_length:
+            # Don't include the last point of each segment except the final one
+            counts = np.maximum((chords * samples_per_unit).astype(np.int64), 2)
+            segment = np.repeat(np.arange(num_segments), counts)
+            local = np.arange(len(segment)) - np.repeat(np.cumsum(counts) - counts, counts)
+            steps = np.where(segment == num_segments - 1, counts[segment] - 1, counts[segment])
+            return SplineRailPathPlacerV3.evaluate_spline(coefficients, segment + local / steps)
+
+        # Measure the curve on a dense sampling, then invert its cumulative length
+        dense_counts = np.maximum(np.ceil(chords * samples_per_unit * ARC_LENGTH_OVERSAMPLE).astype(np.int64), 8)
+        segment = np.repeat(np.arange(num_segments), dense_counts)
+        local = np.arange(len(segment)) - np.repeat(np.cumsum(dense_counts) - dense_counts, dense_counts)
+        dense_u = np.append(segment + local / dense_counts[segment], float(num_segments))
+        dense = SplineRailPathPlacerV3.evaluate_spline(coefficients, dense_u)
+        cumulative = np.concatenate([[0.0], np.cumsum(np.linalg.norm(np.diff(dense, axis=0), axis=1))])
+        length = cumulative[-1]
+        if length == 0.0:
+            return dense[[0, -1]]
+        num_samples = max(int(length * samples_per_unit), 2)
+        u = np.interp(np.linspace(0.0, length, num_samples), cumulative, dense_u)
+        return SplineRailPathPlacerV3.evaluate_spline(coefficients, u)
 
-        all_samples = []
-        num_segments = len(padded) - 3
+    @staticmethod
+    def sample_segment(coefficients: np.ndarray, samples_per_unit: float = 2.0) -> np.ndarray:
+        """
+        Sample one spline segment evenly by arc length, both ends included.
 
-        for i in range(1, len(padded) - 2):
-            p0 = padded[i - 1]
-            p1 = padded[i]
-            p2 = padded[i + 1]
-            p3 = padded[i + 2]
+        Args:
+            coefficients: The (4, 3) coefficients of the segment, one row of catmull_rom_coefficients.
+            samples_per_unit: Number of samples per block of distance.
 
-            segment_dist = np.linalg.norm(p2 - p1)
-            num_samples = max(int(segment_dist * samples_per_unit), 2)
+        Returns:
+            np.ndarray of shape (N, 3) with float coordinates along the segment.
+        """
+        row = coefficients[np.newaxis]
+        chord = np.linalg.norm(coefficients.sum(axis=0) - coefficients[0])
+        dense_t = np.linspace(0.0, 1.0, max(int(np.ceil(chord * samples_per_unit * ARC_LENGTH_OVERSAMPLE)), 8) + 1)
+        dense = SplineRailPathPlacerV3.evaluate_spline(row, dense_t)
+        cumulative = np.concatenate([[0.0], np.cumsum(np.linalg.norm(np.diff(dense, axis=0), axis=1))])
+        length = cumulative[-1]
+        if length == 0.0:
+            return dense[[0, -1]]
+        num_samples = max(int(length * samples_per_unit), 2)
+        t = np.interp(np.linspace(0.0, length, num_samples), cumulative, dense_t)
+        return SplineRailPathPlacerV3.evaluate_spline(row, t)
 
-            # Don't include the last point of each segment except the final one
-            include_end = (i == len(padded) - 3)
-            t_vals = np.linspace(0.0, 1.0, num_samples, endpoint=include_end)
-
-            tau = tension
-            for t in t_vals:
-                t2 = t * t
-                t3 = t2 * t
-
-                # Catmull-Rom basis functions with tension parameter
-                q = (
-                    p1
-                    + (-tau * p0 + tau * p2) * t
-                    + (2.0 * tau * p0 + (tau - 3.0) * p1 + (3.0 - 2.0 * tau) * p2 - tau * p3) * t2
-                    + (-tau * p0 + (2.0 - tau) * p1 + (tau - 2.0) * p2 + tau * p3) * t3
-                )
-                all_samples.append(q)
+    @staticmethod
+    def rasterize_spline(
+        points: List[Tuple[int, int, int]],
+        tension: float = 0.5,
+        samples_per_unit: float = 2.0,
+        segment_cache: Optional[LRUCache] = None,
+    ) -> List[Tuple[int, int, int]]:
+        """
+        Rasterize the spline through the points one segment at a time.
+
+        Each segment is sampled by its own arc length and rasterized on its
+        own, and the segments are joined keeping the first visit of each block,
+        the same as rasterize_to_voxels does for a whole curve.  segment_cache
+        keeps the rasterized segments by their coefficients, so a segment whose
+        four control points and tension are unchanged is not recomputed.
 
-        return np.array(all_samples)
+        Returns an ordered list of (x, y, z) block positions.
+        """
+        if len(points) < 3:
+            return SplineRailPathPlacerV3.rasterize_to_voxels(
+                SplineRailPathPlacerV3.catmull_rom_spline(points, tension, samples_per_unit)
+            )
+        ordered = []
+        seen = set()
+        for coefficients in SplineRailPathPlacerV3.catmull_rom_coefficients(points, tension):
+            key = (coefficients.tobytes(), samples_per_unit)
+            voxels = segment_cache.get(key) if segment_cache is not None else None
+            if voxels is None:
+                voxels = SplineRailPathPlacerV3.rasterize_to_voxels(
+                    SplineRailPathPlacerV3.sample_segment(coefficients, samples_per_unit)
+                )
+                if segment_cache is not None:
+                    segment_cache[key] = voxels
+            for v in voxels:
+                if v not in seen:
+                    ordered.append(v)
+                    seen.add(v)
+        return ordered
 
     @staticmethod
     def bresenham_3d(
@@ -594,7 +844,7 @@ class SplineRailPathPlacerV3(wx.Panel, DefaultOperationUI):
                 dy = abs(current[1] - prev[1])
                 dz = abs(current[2] - prev[2])
                 if dx > 1 or dy > 1 or dz > 1:
-                    gap_voxels = SplineRailPathPlacer.bresenham_3d(prev, current)
+                    gap_voxels = SplineRailPathPlacerV3.bresenham_3d(prev, current)
                     for gv in gap_voxels:
                         if gv not in seen:
                             ordered.append(gv)
@@ -609,156 +859,110 @@ class SplineRailPathPlacerV3(wx.Panel, DefaultOperationUI):
 
         return ordered
 
-    @staticmethod
-    def enforce_path_constraints(
-        path: List[Tuple[int, int, int]],
-    ) -> Tuple[List[Tuple[int, int, int]], dict]:
-        """
-        Validate and fix the rasterized path to comply with rail placer rules.
-
-        Runs constraint fixes in order:
-          9e. Gap prevention
-          9a. Vertical stacking prevention
-          9b. Elevation step normalization
-          9g. Diagonal path prevention
-          9c. Turn flatness enforcement
-          9d. Turn-to-incline buffer insertion
-          9f. Branch/ambiguity prevention
-
-        Returns (fixed_path, stats_dict) where stats_dict counts fixes applied.
-        """
-        if len(path) < 2:
-            return list(path), {"total_fixes": 0}
-
-        stats = {
-            "gaps_filled": 0,
-            "vertical_stacks_fixed": 0,
-            "elevation_steps_fixed": 0,
-            "diagonals_fixed": 0,
-            "turns_flattened": 0,
-            "buffers_inserted": 0,
-            "branches_pruned": 0,
-        }
-
-        fixed = list(path)
-
-        def _is_single_cardinal(dx, dz):
-            """True if the step is exactly one cardinal direction (not diagonal, not zero)."""
-            return (dx != 0) != (dz != 0)  # exactly one is non-zero
+    # -------------------------------------------------------------------------
+    # Constraint Passes
+    # -------------------------------------------------------------------------
+    # Each pass takes an iterator of voxels and yields the fixed voxels, keeping
+    # only the few blocks around the current step, so the passes chain without
+    # copying the path in between.  Fixes are counted in the shared stats dict.
 
-        def _log_path(label):
-            """Print the full ordered path with step deltas for debugging."""
-            print(f"\n=== {label} ({len(fixed)} blocks) ===")
-            for idx, v in enumerate(fixed):
-                if idx == 0:
-                    print(f"  [{idx:3d}] ({v[0]:5d}, {v[1]:3d}, {v[2]:5d})")
-                else:
-                    p = fixed[idx - 1]
-                    d = (v[0]-p[0], v[1]-p[1], v[2]-p[2])
-                    print(f"  [{idx:3d}] ({v[0]:5d}, {v[1]:3d}, {v[2]:5d})  delta=({d[0]:+d},{d[1]:+d},{d[2]:+d})")
+    @staticmethod
+    def _is_single_cardinal(dx: int, dz: int) -> bool:
+        """True if the step is exactly one cardinal direction (not diagonal, not zero)."""
+        return (dx != 0) != (dz != 0)  # exactly one is non-zero
 
-        _log_path("INPUT (after rasterization)")
-
-        # --- 9e. Gap Prevention ---
-        # Verify every consecutive pair is within 1 block on all axes
-        i = 0
-        while i < len(fixed) - 1:
-            curr = fixed[i]
-            nxt = fixed[i + 1]
-            dx = abs(nxt[0] - curr[0])
-            dy = abs(nxt[1] - curr[1])
-            dz = abs(nxt[2] - curr[2])
-            if dx > 1 or dy > 1 or dz > 1:
+    @staticmethod
+    def _fill_gaps(voxels, stats: dict):
+        """9e. Gap prevention: every consecutive pair ends up within 1 block on all axes."""
+        voxels = iter(voxels)
+        curr = next(voxels, None)
+        if curr is None:
+            return
+        for nxt in voxels:
+            yield curr
+            if abs(nxt[0] - curr[0]) > 1 or abs(nxt[1] - curr[1]) > 1 or abs(nxt[2] - curr[2]) > 1:
                 # Fill gap with Bresenham
-                gap = SplineRailPathPlacer.bresenham_3d(curr, nxt)
-                for j, gv in enumerate(gap[:-1]):  # exclude last (it's nxt)
-                    fixed.insert(i + 1 + j, gv)
-                # print(f"  9e: gap at [{i}] {curr} -> {nxt}, inserted {len(gap)-1} blocks")
+                gap = SplineRailPathPlacerV3.bresenham_3d(curr, nxt)
+                yield from gap[:-1]  # exclude last (it's nxt)
                 stats["gaps_filled"] += len(gap) - 1
-                i += len(gap)
-            else:
-                i += 1
-
-        if stats["gaps_filled"]:
-            _log_path("AFTER 9e (gap prevention)")
-
-        # --- 9a. REMOVED (v2) ---
-        # Vertical stack prevention moved to post-filter (phase 10).
-
-        # --- 9b. Elevation Step Normalization ---
-        # Every elevation change must be dy=±1 with exactly one cardinal axis
-        i = 0
-        while i < len(fixed) - 1:
-            curr = fixed[i]
-            nxt = fixed[i + 1]
-            dx = nxt[0] - curr[0]
-            dy = nxt[1] - curr[1]
-            dz = nxt[2] - curr[2]
-            if dy != 0:
-                # Both dx and dz non-zero during elevation change — fix
-                if dx != 0 and dz != 0:
-                    # Split into: first move on dominant horizontal axis + dy,
-                    # then move on the other axis at the new Y
-                    if abs(dx) >= abs(dz):
-                        step_dx = 1 if dx > 0 else -1
-                        step_dy = 1 if dy > 0 else -1
-                        mid = (curr[0] + step_dx, curr[1] + step_dy, curr[2])
-                    else:
-                        step_dz = 1 if dz > 0 else -1
+            curr = nxt
+        yield curr
+
+    @staticmethod
+    def _normalize_elevation_steps(voxels, stats: dict):
+        """9b. Elevation step normalization: every elevation change is dy=±1 with exactly one cardinal axis."""
+        voxels = iter(voxels)
+        curr = next(voxels, None)
+        if curr is None:
+            return
+        prev = None
+        for nxt in voxels:
+            # Keep inserting blocks after curr until the step to nxt is legal
+            while True:
+                dx = nxt[0] - curr[0]
+                dy = nxt[1] - curr[1]
+                dz = nxt[2] - curr[2]
+                mid = None
+                if dy != 0:
+                    # Both dx and dz non-zero during elevation change — fix
+                    if dx != 0 and dz != 0:
+                        # Split into: first move on dominant horizontal axis + dy,
+                        # then move on the other axis at the new Y
                         step_dy = 1 if dy > 0 else -1
-                        mid = (curr[0], curr[1] + step_dy, curr[2] + step_dz)
-                    # print(f"  9b: elev+dual-axis at [{i}] {curr} -> {nxt} (dx={dx},dy={dy},dz={dz}), inserted mid={mid}")
-                    fixed.insert(i + 1, mid)
-                    stats["elevation_steps_fixed"] += 1
-                    i += 1
-                # dy magnitude > 1 — break into single steps
-                elif abs(dy) > 1:
-                    step_dy = 1 if dy > 0 else -1
-                    step_dx = 1 if dx > 0 else (-1 if dx < 0 else 0)
-                    step_dz = 1 if dz > 0 else (-1 if dz < 0 else 0)
-                    # If no horizontal movement, pick one from context
-                    if step_dx == 0 and step_dz == 0:
-                        if i > 0:
-                            prev = fixed[i - 1]
-                            pdx = curr[0] - prev[0]
-                            pdz = curr[2] - prev[2]
-                            step_dx = 1 if pdx > 0 else (-1 if pdx < 0 else 1)
-                            if pdx == 0:
-                                step_dz = 1 if pdz > 0 else (-1 if pdz < 0 else 0)
-                                step_dx = 0
+                        if abs(dx) >= abs(dz):
+                            step_dx = 1 if dx > 0 else -1
+                            mid = (curr[0] + step_dx, curr[1] + step_dy, curr[2])
                         else:
-                            step_dx = 1
-                    mid = (curr[0] + step_dx, curr[1] + step_dy, curr[2] + step_dz)
-                    # print(f"  9b: elev multi-step at [{i}] {curr} -> {nxt} (dy={dy}), inserted mid={mid}")
-                    fixed.insert(i + 1, mid)
-                    stats["elevation_steps_fixed"] += 1
-                    i += 1
-                else:
-                    i += 1
-            else:
-                i += 1
-
-        if stats["elevation_steps_fixed"]:
-            _log_path("AFTER 9b (elevation normalization)")
-
-        # --- 9g. Diagonal Path Prevention ---
-        # Pure diagonal steps (both dx!=0 and dz!=0, dy=0) that aren't part of
-        # a turn pattern get converted to L-shaped steps
-        i = 0
-        while i < len(fixed) - 1:
-            curr = fixed[i]
-            nxt = fixed[i + 1]
-            dx = nxt[0] - curr[0]
-            dy = nxt[1] - curr[1]
-            dz = nxt[2] - curr[2]
-            if dx != 0 and dz != 0 and dy == 0:
+                            step_dz = 1 if dz > 0 else -1
+                            mid = (curr[0], curr[1] + step_dy, curr[2] + step_dz)
+                    # dy magnitude > 1 — break into single steps
+                    elif abs(dy) > 1:
+                        step_dy = 1 if dy > 0 else -1
+                        step_dx = 1 if dx > 0 else (-1 if dx < 0 else 0)
+                        step_dz = 1 if dz > 0 else (-1 if dz < 0 else 0)
+                        # If no horizontal movement, pick one from context
+                        if step_dx == 0 and step_dz == 0:
+                            if prev is not None:
+                                pdx = curr[0] - prev[0]
+                                pdz = curr[2] - prev[2]
+                                step_dx = 1 if pdx > 0 else (-1 if pdx < 0 else 1)
+                                if pdx == 0:
+                                    step_dz = 1 if pdz > 0 else (-1 if pdz < 0 else 0)
+                                    step_dx = 0
+                            else:
+                                step_dx = 1
+                        mid = (curr[0] + step_dx, curr[1] + step_dy, curr[2] + step_dz)
+                if mid is None:
+                    break
+                stats["elevation_steps_fixed"] += 1
+                yield curr
+                prev, curr = curr, mid
+            yield curr
+            prev, curr = curr, nxt
+        yield curr
+
+    @staticmethod
+    def _split_diagonals(voxels, stats: dict):
+        """
+        9g. Diagonal path prevention: pure diagonal steps (both dx!=0 and dz!=0,
+        dy=0) that aren't part of a turn pattern get converted to L-shaped steps.
+        """
+        is_single_cardinal = SplineRailPathPlacerV3._is_single_cardinal
+        voxels = iter(voxels)
+        curr = next(voxels, None)
+        if curr is None:
+            return
+        prev = None
+        nxt = next(voxels, None)
+        while nxt is not None:
+            after = next(voxels, None)
+            mid = None
+            if nxt[0] != curr[0] and nxt[2] != curr[2] and nxt[1] == curr[1]:
                 # Check if this is part of a valid turn (3-block pattern)
                 # A valid turn requires single-cardinal steps on both sides,
                 # on perpendicular axes, all at the same Y level
                 is_turn = False
-                if i > 0 and i + 2 < len(fixed):
-                    prev = fixed[i - 1]
-                    after = fixed[i + 2]
+                if prev is not None and after is not None:
                     d_prev_x = curr[0] - prev[0]
                     d_prev_y = curr[1] - prev[1]
                     d_prev_z = curr[2] - prev[2]
@@ -766,8 +970,8 @@ class SplineRailPathPlacerV3(wx.Panel, DefaultOperationUI):
                     d_after_y = after[1] - nxt[1]
                     d_after_z = after[2] - nxt[2]
                     # Both sides must be single-cardinal, flat, and perpendicular
-                    if (_is_single_cardinal(d_prev_x, d_prev_z) and
-                            _is_single_cardinal(d_after_x, d_after_z) and
+                    if (is_single_cardinal(d_prev_x, d_prev_z) and
+                            is_single_cardinal(d_after_x, d_after_z) and
                             d_prev_y == 0 and d_after_y == 0 and
                             prev[1] == curr[1] == nxt[1] == after[1]):
                         prev_axis = 'x' if d_prev_x != 0 else 'z'
@@ -777,67 +981,63 @@ class SplineRailPathPlacerV3(wx.Panel, DefaultOperationUI):
                 if not is_turn:
                     # Convert to L-shape: move on X first, then Z
                     mid = (nxt[0], curr[1], curr[2])
-                    # print(f"  9g: diagonal at [{i}] {curr} -> {nxt} (dx={dx},dz={dz}), inserted mid={mid}")
-                    fixed.insert(i + 1, mid)
                     stats["diagonals_fixed"] += 1
-                    i += 2
-                else:
-                    i += 1
+            yield curr
+            if mid is not None:
+                yield mid
+                prev = mid
             else:
-                i += 1
-
-        if stats["diagonals_fixed"]:
-            _log_path("AFTER 9g (diagonal prevention)")
-
-        # --- 9d. Turn-to-Incline Buffer ---
-        # Reshape the last few zigzag blocks before each elevation change
-        # so all minor-axis movement happens first, then a straight run
-        # in the ascending direction provides the 2-block buffer.
-        # The zigzag L-corner preserves diagonal adjacency for turn detection.
-        i = 0
-        while i < len(fixed) - 1:
-            curr = fixed[i]
-            nxt = fixed[i + 1]
-            dy = nxt[1] - curr[1]
-            if dy != 0 and _is_single_cardinal(nxt[0] - curr[0], nxt[2] - curr[2]):
+                prev = curr
+            curr, nxt = nxt, after
+        yield curr
+
+    @staticmethod
+    def _reshape_incline_approaches(voxels, stats: dict, verbose: bool = False):
+        """
+        9d. Turn-to-incline buffer: reshape the last few zigzag blocks before each
+        elevation change so all minor-axis movement happens first, then a straight
+        run in the ascending direction provides the 2-block buffer.
+        The zigzag L-corner preserves diagonal adjacency for turn detection.
+        With verbose each reshape is printed.
+
+        The reshape only reaches back through blocks at the same Y, so the pass
+        holds the current level run and hands it on at each elevation change.
+        """
+        is_single_cardinal = SplineRailPathPlacerV3._is_single_cardinal
+        run = []  # blocks at the current Y, the last one being curr
+        emitted = 0  # blocks handed on before run[0], for the log line
+        for nxt in voxels:
+            if not run or nxt[1] == run[-1][1]:
+                run.append(nxt)
+                continue
+            curr = run[-1]
+            adx = nxt[0] - curr[0]
+            adz = nxt[2] - curr[2]
+            if is_single_cardinal(adx, adz):
                 # Elevation change with single-cardinal horizontal component
-                adx = nxt[0] - curr[0]
-                adz = nxt[2] - curr[2]
                 elev_y = curr[1]
+                dy = nxt[1] - elev_y
 
                 # The "major axis" is the one matching the ascending direction
                 major_is_x = (adx != 0)
 
-                # Look backward to find how far we can reshape (same Y, no elevation)
-                reshape_start = i
-                for j in range(i - 1, max(i - 8, -1), -1):
-                    if j < 0:
-                        break
-                    if fixed[j][1] != elev_y:
-                        break
-                    reshape_start = j
+                # Look backward up to 7 blocks, all at the same Y
+                i = len(run) - 1
+                reshape_start = max(i - 7, 0)
 
                 # Calculate total displacement of the reshape section
-                start_pt = fixed[reshape_start]
-                end_pt = fixed[i]  # last block before ascending
+                start_pt = run[reshape_start]
+                end_pt = curr  # last block before ascending
                 total_dx = end_pt[0] - start_pt[0]
                 total_dz = end_pt[2] - start_pt[2]
-
-                if major_is_x:
-                    major_disp = abs(total_dx)
-                    minor_disp = abs(total_dz)
-                else:
-                    major_disp = abs(total_dz)
-                    minor_disp = abs(total_dx)
+                major_disp = abs(total_dx) if major_is_x else abs(total_dz)
+                minor_disp = abs(total_dz) if major_is_x else abs(total_dx)
 
                 # Need at least 3 blocks on the major axis (turn exit + 2 buffer)
                 # If not enough, extend reshape_start further back
                 while major_disp < 3 and reshape_start > 0:
                     reshape_start -= 1
-                    if fixed[reshape_start][1] != elev_y:
-                        reshape_start += 1
-                        break
-                    start_pt = fixed[reshape_start]
+                    start_pt = run[reshape_start]
                     total_dx = end_pt[0] - start_pt[0]
                     total_dz = end_pt[2] - start_pt[2]
                     major_disp = abs(total_dx) if major_is_x else abs(total_dz)
@@ -874,85 +1074,98 @@ class SplineRailPathPlacerV3(wx.Panel, DefaultOperationUI):
                     # Verify the replacement ends at the correct position
                     if replacement[-1] == end_pt:
                         old_len = i - reshape_start + 1
-                        fixed[reshape_start:i + 1] = replacement
-                        new_i = reshape_start + len(replacement) - 1
+                        run[reshape_start:] = replacement
                         stats["buffers_inserted"] += 1
-                        print(
-                            f"  9d: reshaped [{reshape_start}..{i}] ({old_len} blocks) "
-                            f"-> L-shape ({len(replacement)} blocks) "
-                            f"major={'X' if major_is_x else 'Z'}={major_disp}, "
-                            f"minor={'Z' if major_is_x else 'X'}={minor_disp}, "
-                            f"buffer before ascending at Y={elev_y}->{elev_y + dy}"
-                        )
-                        i = new_i + 1
-                        continue
-            i += 1
-
-        if stats["buffers_inserted"]:
-            _log_path("AFTER 9d (turn-to-incline buffer)")
-
-        # --- 9c. Turn Flatness Enforcement ---
-        # Turns (direction changes) must have dy=0 across all 3 blocks
-        # Only triggers on genuine turns: single-cardinal incoming AND outgoing
-        # on perpendicular axes. Skips diagonal or ascending transitions.
-        i = 1
-        while i < len(fixed) - 1:
-            prev = fixed[i - 1]
-            curr = fixed[i]
-            nxt = fixed[i + 1]
-            d1x = curr[0] - prev[0]
-            d1y = curr[1] - prev[1]
-            d1z = curr[2] - prev[2]
-            d2x = nxt[0] - curr[0]
-            d2y = nxt[1] - curr[1]
-            d2z = nxt[2] - curr[2]
-            # Both steps must be single-cardinal, flat (dy==0), and perpendicular
-            is_turn = False
-            if (d1y == 0 and d2y == 0 and
-                    _is_single_cardinal(d1x, d1z) and _is_single_cardinal(d2x, d2z)):
-                prev_axis = 'x' if d1x != 0 else 'z'
-                next_axis = 'x' if d2x != 0 else 'z'
-                if prev_axis != next_axis:
-                    is_turn = True
-            if is_turn:
-                target_y = prev[1]
-                if curr[1] != target_y or nxt[1] != target_y:
-                    # print(f"  9c: turn flatten at [{i}] prev={prev} curr={curr}->{(curr[0],target_y,curr[2])} nxt={nxt}->{(nxt[0],target_y,nxt[2])}")
-                    fixed[i] = (curr[0], target_y, curr[2])
-                    fixed[i + 1] = (nxt[0], target_y, nxt[2])
-                    stats["turns_flattened"] += 1
-                i += 2
+                        if verbose:
+                            print(
+                                f"  9d: reshaped [{emitted + reshape_start}..{emitted + i}] ({old_len} blocks) "
+                                f"-> L-shape ({len(replacement)} blocks) "
+                                f"major={'X' if major_is_x else 'Z'}={major_disp}, "
+                                f"minor={'Z' if major_is_x else 'X'}={minor_disp}, "
+                                f"buffer before ascending at Y={elev_y}->{elev_y + dy}"
+                            )
+            yield from run
+            emitted += len(run)
+            run = [nxt]
+        yield from run
+
+    @staticmethod
+    def _flatten_turns(voxels, stats: dict):
+        """
+        9c. Turn flatness enforcement: turns (direction changes) must have dy=0
+        across all 3 blocks.  Only triggers on genuine turns: single-cardinal
+        incoming AND outgoing on perpendicular axes.  Skips diagonal or
+        ascending transitions.
+        """
+        is_single_cardinal = SplineRailPathPlacerV3._is_single_cardinal
+        voxels = iter(voxels)
+        prev = next(voxels, None)
+        if prev is None:
+            return
+        curr = next(voxels, None)
+        if curr is None:
+            yield prev
+            return
+        skip = False  # the block after a turn is not the middle of another
+        for nxt in voxels:
+            if skip:
+                skip = False
             else:
-                i += 1
-
-        if stats["turns_flattened"]:
-            _log_path("AFTER 9c (turn flatness)")
-
-        # --- 10. Post-Filter: Vertical Stack Cleanup ---
-        # Runs after all path shaping is complete. Detects vertical stacks
-        # (same X,Z, only Y differs) and shifts the second block 1 unit
-        # horizontally in the departure direction. Minimal, surgical fix
-        # that preserves curve shape.
-        path_positions = set(fixed)
-        i = 0
-        while i < len(fixed) - 1:
-            curr = fixed[i]
-            nxt = fixed[i + 1]
-            dx = nxt[0] - curr[0]
-            dy = nxt[1] - curr[1]
-            dz = nxt[2] - curr[2]
-            if dx == 0 and dz == 0 and dy != 0:
+                d1x = curr[0] - prev[0]
+                d1y = curr[1] - prev[1]
+                d1z = curr[2] - prev[2]
+                d2x = nxt[0] - curr[0]
+                d2y = nxt[1] - curr[1]
+                d2z = nxt[2] - curr[2]
+                # Both steps must be single-cardinal, flat (dy==0), and perpendicular
+                if (d1y == 0 and d2y == 0 and
+                        is_single_cardinal(d1x, d1z) and is_single_cardinal(d2x, d2z) and
+                        (d1x != 0) != (d2x != 0)):
+                    target_y = prev[1]
+                    if curr[1] != target_y or nxt[1] != target_y:
+                        curr = (curr[0], target_y, curr[2])
+                        nxt = (nxt[0], target_y, nxt[2])
+                        stats["turns_flattened"] += 1
+                    skip = True
+            yield prev
+            prev, curr = curr, nxt
+        yield prev
+        yield curr
+
+    @staticmethod
+    def _unstack_vertical_steps(voxels, stats: dict, verbose: bool = False) -> List[Tuple[int, int, int]]:
+        """
+        10. Post-filter: vertical stack cleanup.  Runs after all path shaping is
+        complete.  Detects vertical stacks (same X,Z, only Y differs) and shifts
+        the second block 1 unit horizontally in the departure direction.
+        Minimal, surgical fix that preserves curve shape.  With verbose each
+        shift is printed.
+
+        A shift must not land on any other block of the path, so unlike the
+        passes before it this one collects the whole path, and returns a list.
+        """
+        voxels = list(voxels)
+        path_positions = set(voxels)
+        fixed = []
+        if not voxels:
+            return fixed
+        curr = voxels[0]
+        k = 1  # index of nxt in voxels
+        while k < len(voxels):
+            nxt = voxels[k]
+            after = voxels[k + 1] if k + 1 < len(voxels) else None
+            if nxt[0] == curr[0] and nxt[2] == curr[2] and nxt[1] != curr[1]:
+                i = len(fixed)  # index of curr in the output
                 # Try departure direction first, then approach, then cardinals
                 candidates = []
-                if i + 2 < len(fixed):
-                    after = fixed[i + 2]
+                if after is not None:
                     ddx, ddz = after[0] - nxt[0], after[2] - nxt[2]
                     if ddx != 0:
                         candidates.append((1 if ddx > 0 else -1, 0))
                     if ddz != 0:
                         candidates.append((0, 1 if ddz > 0 else -1))
-                if i > 0:
-                    prev = fixed[i - 1]
+                if fixed:
+                    prev = fixed[-1]
                     pdx, pdz = curr[0] - prev[0], curr[2] - prev[2]
                     if pdx != 0:
                         candidates.append((1 if pdx > 0 else -1, 0))
@@ -967,73 +1180,106 @@ class SplineRailPathPlacerV3(wx.Panel, DefaultOperationUI):
                     if shifted == curr:
                         continue
                     # Check it doesn't collide with other path blocks
-                    # (except fixed[i+2] which we might merge with)
-                    if shifted in path_positions and shifted != nxt:
-                        if i + 2 < len(fixed) and shifted == fixed[i + 2]:
-                            pass  # will merge below
-                        else:
-                            continue
+                    # (except the block after nxt, which we might merge with)
+                    if shifted in path_positions and shifted != nxt and shifted != after:
+                        continue
                     # Apply the shift
                     path_positions.discard(nxt)
                     path_positions.add(shifted)
-                    fixed[i + 1] = shifted
                     stats["vertical_stacks_fixed"] += 1
-                    print(f"  10: vstack fix [{i}]->[{i+1}] shifted {nxt} -> {shifted}")
+                    if verbose:
+                        print(f"  10: vstack fix [{i}]->[{i+1}] shifted {nxt} -> {shifted}")
+                    nxt = shifted
                     # Merge if shifted == next block
-                    if i + 2 < len(fixed) and fixed[i + 1] == fixed[i + 2]:
-                        path_positions.discard(fixed[i + 2])
-                        fixed.pop(i + 2)
-                        print(f"  10: merged duplicate at [{i+2}]")
+                    if nxt == after:
+                        path_positions.discard(after)
+                        k += 1
+                        if verbose:
+                            print(f"  10: merged duplicate at [{i+2}]")
                     break
-            i += 1
-
-        # --- 10b. Post-Filter: Knot Detection ---
-        # Flag blocks where a non-adjacent path block falls within the
-        # 3x3x3 cube, creating ambiguity for the rail placer.
-        for i in range(len(fixed)):
-            for j in range(i + 3, len(fixed)):
-                bx = abs(fixed[j][0] - fixed[i][0])
-                by = abs(fixed[j][1] - fixed[i][1])
-                bz = abs(fixed[j][2] - fixed[i][2])
-                if bx <= 1 and by <= 1 and bz <= 1:
-                    print(f"  10b: KNOT at [{i}] {fixed[i]} <-> [{j}] {fixed[j]} (dist {j-i} apart in path)")
-
-        # --- 10c. Post-Filter: Gap Detection ---
-        # Consecutive blocks must be adjacent (each axis differs by at most 1,
-        # total manhattan distance at most 2).
-        for i in range(len(fixed) - 1):
-            curr = fixed[i]
-            nxt = fixed[i + 1]
-            adx = abs(nxt[0] - curr[0])
-            ady = abs(nxt[1] - curr[1])
-            adz = abs(nxt[2] - curr[2])
-            if max(adx, ady, adz) > 1 or adx + ady + adz > 2:
-                print(f"  10c: GAP at [{i}]->[{i+1}] {curr} -> {nxt} (d={adx},{ady},{adz})")
-
-        # --- 10d. Post-Filter: Turn Before Elevation ---
-        # A direction change immediately before a Y transition confuses the
-        # rail placer. Flag when the step into a Y-change is on a different
-        # axis than the step before it.
-        for i in range(2, len(fixed)):
-            curr = fixed[i - 1]
-            nxt = fixed[i]
-            dy = nxt[1] - curr[1]
-            if dy == 0:
-                continue
-            # There's a Y transition at i-1 -> i. Check if i-2 -> i-1 is a turn.
-            prev = fixed[i - 2]
-            d1x = curr[0] - prev[0]
-            d1z = curr[2] - prev[2]
-            d2x = nxt[0] - curr[0]
-            d2z = nxt[2] - curr[2]
-            # Both steps have horizontal movement, but on different axes = turn
-            if d1x != 0 and d2z != 0 and d1z == 0 and d2x == 0:
-                print(f"  10d: TURN BEFORE ELEV at [{i-2}]->[{i}] {prev}->{curr}->{nxt}")
-            elif d1z != 0 and d2x != 0 and d1x == 0 and d2z == 0:
-                print(f"  10d: TURN BEFORE ELEV at [{i-2}]->[{i}] {prev}->{curr}->{nxt}")
+            fixed.append(curr)
+            curr = nxt
+            k += 1
+        fixed.append(curr)
+        return fixed
+
+    @staticmethod
+    def enforce_path_constraints(
+        path: List[Tuple[int, int, int]],
+        verbose: bool = False,
+    ) -> Tuple[List[Tuple[int, int, int]], dict]:
+        """
+        Validate and fix the rasterized path to comply with rail placer rules.
+
+        Runs constraint fixes in order:
+          9e. Gap prevention
+          9b. Elevation step normalization
+          9g. Diagonal path prevention
+          9d. Turn-to-incline buffer insertion
+          9c. Turn flatness enforcement
+          10. Vertical stack cleanup
+
+        then flags what is left to the rail placer with validate_path (knots,
+        gaps, turns before elevation and branches).
+
+        The fixes stream into each other (see Constraint Passes), so each
+        runs in linear time.  With verbose the whole path is printed after
+        every fix that changed it, which needs a copy of it per fix, and the
+        validation report is printed too.
+
+        Returns (fixed_path, stats_dict) where stats_dict counts fixes applied,
+        and holds the validate_path report under "report".  The checks run
+        before consecutive duplicate blocks are dropped, so a duplicate counts
+        on its own and the report's indices are into the path as it was then.
+        """
+        if len(path) < 2:
+            return list(path), {"total_fixes": 0, "report": SplineRailPathPlacerV3.validate_path(path)}
+
+        stats = {
+            "gaps_filled": 0,
+            "vertical_stacks_fixed": 0,
+            "elevation_steps_fixed": 0,
+            "diagonals_fixed": 0,
+            "turns_flattened": 0,
+            "buffers_inserted": 0,
+            "branches_pruned": 0,
+        }
+
+        def _log_path(label, voxels):
+            """Print the full ordered path with step deltas for debugging."""
+            if not verbose:
+                return
+            print(f"\n=== {label} ({len(voxels)} blocks) ===")
+            for idx, v in enumerate(voxels):
+                if idx == 0:
+                    print(f"  [{idx:3d}] ({v[0]:5d}, {v[1]:3d}, {v[2]:5d})")
+                else:
+                    p = voxels[idx - 1]
+                    d = (v[0]-p[0], v[1]-p[1], v[2]-p[2])
+                    print(f"  [{idx:3d}] ({v[0]:5d}, {v[1]:3d}, {v[2]:5d})  delta=({d[0]:+d},{d[1]:+d},{d[2]:+d})")
+
+        _log_path("INPUT (after rasterization)", path)
+
+        # 9a (vertical stack prevention) moved to the post-filter (phase 10) in v2
+        cls = SplineRailPathPlacerV3
+        passes = (
+            (cls._fill_gaps, "gaps_filled", "AFTER 9e (gap prevention)"),
+            (cls._normalize_elevation_steps, "elevation_steps_fixed", "AFTER 9b (elevation normalization)"),
+            (cls._split_diagonals, "diagonals_fixed", "AFTER 9g (diagonal prevention)"),
+            (lambda voxels, stats: cls._reshape_incline_approaches(voxels, stats, verbose), "buffers_inserted", "AFTER 9d (turn-to-incline buffer)"),
+            (cls._flatten_turns, "turns_flattened", "AFTER 9c (turn flatness)"),
+        )
+        voxels = iter(path)
+        for fix, stat, label in passes:
+            voxels = fix(voxels, stats)
+            if verbose:
+                voxels = list(voxels)
+                if stats[stat]:
+                    _log_path(label, voxels)
+        fixed = cls._unstack_vertical_steps(voxels, stats, verbose)
 
         if stats["vertical_stacks_fixed"]:
-            _log_path("AFTER 10 (post-filter cleanup)")
+            _log_path("AFTER 10 (post-filter cleanup)", fixed)
 
         # --- 9d. Turn-to-Incline Buffer (Minimum 2 Flat Blocks) ---
         # DISABLED: Buffer insertion creates disconnected stubs because inserted
@@ -1042,30 +1288,19 @@ class SplineRailPathPlacerV3(wx.Panel, DefaultOperationUI):
         # reshaping existing path rather than inserting new blocks).
         # TODO: Revisit in a future session.
 
-        # --- 9f. Branch/Ambiguity Prevention ---
-        # No voxel should have more than 2 neighbors in the path
-        path_set = set(fixed)
-        to_remove = set()
-        for i, v in enumerate(fixed):
-            neighbors_in_path = 0
-            for dx, dy, dz in [
-                (1,0,0),(-1,0,0),(0,1,0),(0,-1,0),(0,0,1),(0,0,-1),
-                (1,1,0),(-1,1,0),(1,-1,0),(-1,-1,0),
-                (0,1,1),(0,-1,1),(0,1,-1),(0,-1,-1),
-                (1,0,1),(-1,0,1),(1,0,-1),(-1,0,-1),
-                (1,1,1),(-1,1,1),(1,-1,1),(1,1,-1),
-                (-1,-1,1),(-1,1,-1),(1,-1,-1),(-1,-1,-1),
-            ]:
-                neighbor = (v[0]+dx, v[1]+dy, v[2]+dz)
-                if neighbor in path_set and neighbor != v:
-                    neighbors_in_path += 1
-            # In an ordered list, a block should connect to at most 2 others
-            # If it has 3+ neighbors, it's a branch point — we keep it but flag it
-            # (Pruning branches from an ordered list is complex; the ordered list
-            #  itself prevents true branches. We just validate here.)
-            if neighbors_in_path > 2:
-                # print(f"  9f: branch at [{i}] {v} has {neighbors_in_path} neighbors in path")
-                stats["branches_pruned"] += 1
+        # --- 10b-10d, 9f. Validation ---
+        # Knots, gaps, turns before elevation and branches are flagged, not fixed
+        report = SplineRailPathPlacerV3.validate_path(fixed)
+        stats["branches_pruned"] = len(report["branches"])
+        if verbose:
+            for i, j in report["knots"]:
+                print(f"  10b: KNOT at [{i}] {fixed[i]} <-> [{j}] {fixed[j]} (dist {j-i} apart in path)")
+            for i in report["gaps"]:
+                print(f"  10c: GAP at [{i}]->[{i+1}] {fixed[i]} -> {fixed[i+1]}")
+            for i in report["turns_before_elevation"]:
+                print(f"  10d: TURN BEFORE ELEV at [{i}]->[{i+2}] {fixed[i]}->{fixed[i+1]}->{fixed[i+2]}")
+            for i in report["branches"]:
+                print(f"  9f: branch at [{i}] {fixed[i]} has more than 2 neighbors in path")
 
         # Remove duplicate consecutive entries that may have been introduced
         deduped = [fixed[0]]
@@ -1075,8 +1310,79 @@ class SplineRailPathPlacerV3(wx.Panel, DefaultOperationUI):
         fixed = deduped
 
         stats["total_fixes"] = sum(v for v in stats.values())
+        stats["report"] = report
         return fixed, stats
 
+    @staticmethod
+    def validate_path(path: List[Tuple[int, int, int]]) -> dict:
+        """
+        Check an ordered path for blocks that would confuse the rail placer.
+
+        Returns a report of path indices:
+          knots                   (i, j) pairs at least 3 apart in the path
+                                  whose blocks share a 3x3x3 cube (10b)
+          gaps                    i where the step to i + 1 is not adjacent (10c)
+          turns_before_elevation  i where the path turns at i + 1 right
+                                  before changing Y at i + 2 (10d)
+          branches                i whose block has 3+ neighbors in the path (9f)
+
+        The neighbor lookups go through a VoxelIndex, so this is linear in
+        the path length apart from the sort.
+        """
+        report = {"knots": [], "gaps": [], "turns_before_elevation": [], "branches": []}
+        if len(path) < 2:
+            return report
+        index = VoxelIndex(path)
+
+        # Knots: any other path block in the cube (its own position included)
+        # that is not one of the two blocks either side
+        knot_i, knot_j = [], []
+        neighbor_count = np.zeros(len(path), dtype=np.int64)
+        for offset in NEIGHBOR_OFFSETS + ((0, 0, 0),):
+            i, j = index.matches(*offset)
+            later = j >= i + 3
+            knot_i.append(i[later])
+            knot_j.append(j[later])
+            if offset != (0, 0, 0):
+                neighbor_count += index.occupied(*offset)
+        knot_i = np.concatenate(knot_i)
+        knot_j = np.concatenate(knot_j)
+        order = np.lexsort((knot_j, knot_i))
+        report["knots"] = list(zip(knot_i[order].tolist(), knot_j[order].tolist()))
+
+        # Gaps: each axis differs by at most 1, total manhattan distance at most 2
+        steps = np.diff(index.coords, axis=0)
+        distance = np.abs(steps)
+        report["gaps"] = np.flatnonzero((distance.max(axis=1) > 1) | (distance.sum(axis=1) > 2)).tolist()
+
+        # Turns before elevation: the step into a Y change is on a different
+        # horizontal axis than the step before it
+        d1, d2 = steps[:-1], steps[1:]
+        x_then_z = (d1[:, 0] != 0) & (d1[:, 2] == 0) & (d2[:, 2] != 0) & (d2[:, 0] == 0)
+        z_then_x = (d1[:, 2] != 0) & (d1[:, 0] == 0) & (d2[:, 0] != 0) & (d2[:, 2] == 0)
+        report["turns_before_elevation"] = np.flatnonzero((d2[:, 1] != 0) & (x_then_z | z_then_x)).tolist()
+
+        # Branches: in an ordered list a block should connect to at most 2
+        # others.  The ordered list itself prevents true branches, so they are
+        # only flagged here.
+        report["branches"] = np.flatnonzero(neighbor_count > 2).tolist()
+        return report
+
+    @staticmethod
+    def merge_boxes(voxels) -> Tuple[np.ndarray, float]:
+        """
+        Cover a set of blocks with few axis-aligned boxes, the way the Rail
+        Placer previews its plans (see rail_pipeline.merge_voxel_boxes).
+
+        Returns (boxes, ratio): boxes is an (N, 6) int array of min x, y, z and
+        max x, y, z (exclusive), ratio the number of blocks per box.
+        """
+        boxes = merge_voxel_boxes(np.asarray(list(voxels), dtype=np.int64).reshape(-1, 3))
+        if len(boxes) == 0:
+            return boxes, 0.0
+        # The boxes do not overlap, so their volumes add up to the block count
+        return boxes, int(np.prod(boxes[:, 3:] - boxes[:, :3], axis=1).sum()) / len(boxes)
+
     @staticmethod
     def get_clearance_voxels(
         path_voxels: Set[Tuple[int, int, int]],